@@ -0,0 +1,220 @@
+# benchmarks/fake_sheets.py
+
+import json, threading, time
+import requests
+from collections import Counter
+from functools import lru_cache
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple
+from gspread.exceptions import APIError, WorksheetNotFound
+from gspread.utils import a1_range_to_grid_range
+
+
+def _split_range(a1: str) -> Tuple[str, str]:
+    """Split "'Tab'!A1:F1" into ("Tab", "A1:F1")."""
+    sheet, _, cells = a1.rpartition("!")
+    if sheet.startswith("'") and sheet.endswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, cells
+
+def api_error(code: int, message: str) -> APIError:
+    """The APIError gspread raises for an HTTP `code` response from the Sheets API."""
+    response = requests.Response()
+    response.status_code = code
+    response._content = json.dumps({"error": {"code": code, "message": message}}).encode()
+    return APIError(response)
+
+# Ordinal of day 0 of spreadsheet date serials
+_SERIAL_EPOCH = date(1899, 12, 30).toordinal()
+
+@lru_cache(maxsize=4096)
+def _unformatted(value: str) -> Any:
+    """A cell as UNFORMATTED_VALUE returns it, in a DD/MM locale: DD/MM/YYYY text is a date serial."""
+    parts = value.split("/") if isinstance(value, str) else []
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        return value
+    day, month, year = map(int, parts)
+    return date(year, month, day).toordinal() - _SERIAL_EPOCH
+
+class FakeWorksheet:
+    """In-memory stand-in for the gspread.Worksheet methods the app uses."""
+
+    def __init__(self, spreadsheet: "FakeSpreadsheet", title: str, sheet_id: int, rows: int = 1000):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = 26
+        self.values: List[List[Any]] = []
+        self.formats: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self.conditional_formats: List[Dict[str, Any]] = []
+
+    def _write(self, row: int, col: int, values: List[Any]) -> None:
+        while len(self.values) < row:
+            self.values.append([])
+        target = self.values[row - 1]
+        while len(target) < col - 1 + len(values):
+            target.append("")
+        target[col - 1:col - 1 + len(values)] = [str(v) for v in values]
+        self.row_count = max(self.row_count, row)
+
+    def append_row(self, values: List[Any], value_input_option: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        self.spreadsheet._call("append_row")
+        row = len(self.values) + 1
+        self._write(row, 1, values)
+        end_col = chr(ord("A") + len(values) - 1)
+        return {"updates": {"updatedRange": f"'{self.title}'!A{row}:{end_col}{row}", "updatedRows": 1}}
+
+    def get_all_values(self, **kwargs) -> List[List[str]]:
+        self.spreadsheet._call("get_all_values")
+        return [list(row) for row in self.values]
+
+    def format(self, ranges: str, fmt: Dict[str, Any]) -> None:
+        self.spreadsheet._call("format")
+        grid = a1_range_to_grid_range(ranges)
+        self.formats[(grid["startRowIndex"], grid["startColumnIndex"])] = fmt
+
+class FakeSpreadsheet:
+    """
+    In-process fake of the gspread.Spreadsheet API surface used by
+    sheets_client. Every API method counts as one call in `calls`
+    and sleeps `latency` seconds, to stand in for a network round trip.
+    """
+
+    def __init__(self, titles: List[str], latency: float = 0.0, history_rows: int = 0):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+        self.id = "fake-spreadsheet"
+        self._sheets: Dict[str, FakeWorksheet] = {}
+        for i, title in enumerate(titles):
+            ws = FakeWorksheet(self, title, 1000 + i)
+            ws.values = [["Date", "Attendance", "Leads", "Dials", "Talk Time", "Notes"]]
+            ws.values.extend([["01/01/2025", "Office", "0", "0", "00:00:00", ""]] * history_rows)
+            ws.row_count = max(ws.row_count, len(ws.values))
+            self._sheets[title] = ws
+
+    def _call(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def _tab(self, title: str) -> FakeWorksheet:
+        """The tab a values range names; like the API, an unknown tab is a 400."""
+        if title not in self._sheets:
+            raise api_error(400, f"Unable to parse range: '{title}'")
+        return self._sheets[title]
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self._call("worksheet")
+        if title not in self._sheets:
+            raise WorksheetNotFound(title)
+        return self._sheets[title]
+
+    def worksheets(self, **kwargs) -> List[FakeWorksheet]:
+        self._call("worksheets")
+        return list(self._sheets.values())
+
+    def fetch_sheet_metadata(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self._call("fetch_sheet_metadata")
+        return {"sheets": [
+            {
+                "properties": {
+                    "title": ws.title,
+                    "sheetId": ws.id,
+                    "gridProperties": {"rowCount": ws.row_count, "columnCount": ws.col_count}
+                },
+                "conditionalFormats": [dict(rule) for rule in ws.conditional_formats]
+            }
+            for ws in self._sheets.values()
+        ]}
+
+    def values_batch_get(self, ranges: List[str], params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self._call("values_batch_get")
+        value_ranges = []
+        for a1 in ranges:
+            title, cells = _split_range(a1)
+            ws = self._tab(title)
+            grid = a1_range_to_grid_range(cells)
+            start_row = grid.get("startRowIndex", 0)
+            end_row = grid.get("endRowIndex", len(ws.values))
+            start_col = grid.get("startColumnIndex", 0)
+            end_col = grid.get("endColumnIndex", ws.col_count)
+            values = [row[start_col:end_col] for row in ws.values[start_row:end_row]]
+            if (params or {}).get("valueRenderOption") == "UNFORMATTED_VALUE":
+                values = [[_unformatted(v) for v in row] for row in values]
+            # Like the API, trailing empty rows are omitted
+            while values and not any(values[-1]):
+                values.pop()
+            value_ranges.append({"range": a1, "values": values})
+        return {"valueRanges": value_ranges}
+
+    def values_append(self, range: str, params: Dict[str, Any], body: Dict[str, Any]) -> Dict[str, Any]:
+        self._call("values_append")
+        title, _ = _split_range(range)
+        ws = self._tab(title)
+        first = len(ws.values) + 1
+        for offset, row in enumerate(body["values"]):
+            ws._write(first + offset, 1, row)
+        last = first + len(body["values"]) - 1
+        return {"updates": {"updatedRange": f"'{title}'!A{first}:F{last}", "updatedRows": len(body["values"])}}
+
+    def values_batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self._call("values_batch_update")
+        # Every range is checked before any is written, as the API does
+        writes = []
+        for item in body.get("data", []):
+            title, cells = _split_range(item["range"])
+            grid = a1_range_to_grid_range(cells)
+            ws = self._tab(title)
+            if grid["startRowIndex"] + len(item["values"]) > ws.row_count:
+                raise api_error(400, f"Range ({item['range']}) exceeds grid limits. Max rows: {ws.row_count}")
+            writes.append((ws, grid, item["values"]))
+        for ws, grid, values in writes:
+            for offset, row in enumerate(values):
+                ws._write(grid["startRowIndex"] + 1 + offset, grid["startColumnIndex"] + 1, row)
+        return {"totalUpdatedRows": len(body.get("data", []))}
+
+    def add_worksheet(self, title: str, rows: int, cols: int, index: Optional[int] = None) -> FakeWorksheet:
+        self._call("add_worksheet")
+        if title in self._sheets:
+            raise api_error(400, f"A sheet with the name \"{title}\" already exists.")
+        ws = FakeWorksheet(self, title, max((ws.id for ws in self._sheets.values()), default=999) + 1, rows)
+        ws.col_count = cols
+        self._sheets[title] = ws
+        return ws
+
+    def batch_update(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self._call("batch_update")
+        by_id = {ws.id: ws for ws in self._sheets.values()}
+        replies = []
+        for request in body.get("requests", []):
+            if "appendDimension" in request:
+                spec = request["appendDimension"]
+                by_id[spec["sheetId"]].row_count += spec["length"]
+            elif "duplicateSheet" in request:
+                spec = request["duplicateSheet"]
+                source = by_id[spec["sourceSheetId"]]
+                ws = FakeWorksheet(self, spec["newSheetName"], max(by_id) + 1, source.row_count)
+                ws.values = [list(row) for row in source.values]
+                ws.conditional_formats = [
+                    {**rule, "ranges": [{**grid, "sheetId": ws.id} for grid in rule["ranges"]]}
+                    for rule in source.conditional_formats
+                ]
+                self._sheets[ws.title] = by_id[ws.id] = ws
+                replies.append({"duplicateSheet": {"properties": {"sheetId": ws.id, "title": ws.title}}})
+                continue
+            elif "addConditionalFormatRule" in request:
+                rule = request["addConditionalFormatRule"]["rule"]
+                by_id[rule["ranges"][0]["sheetId"]].conditional_formats.insert(0, rule)
+            elif "repeatCell" in request:
+                grid = request["repeatCell"]["range"]
+                ws = by_id[grid["sheetId"]]
+                ws.formats[(grid["startRowIndex"], grid["startColumnIndex"])] = request["repeatCell"]["cell"]
+            replies.append({})
+        return {"replies": replies}
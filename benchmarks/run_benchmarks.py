@@ -0,0 +1,159 @@
+# benchmarks/run_benchmarks.py
+
+"""
+Benchmark the CSV → Sheets pipeline on synthetic Metabase exports.
+
+    python -m benchmarks.run_benchmarks --roster 60 --rows 20000 --latency-ms 50
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<previous>.json
+
+Each stage reports wall time, peak traced memory and (for Sheets stages)
+API calls against an in-process fake. Results are written as JSON under
+benchmarks/results/ so runs from different versions can be compared.
+"""
+
+import os, json, time, shutil, argparse, tempfile, tracemalloc, subprocess
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional
+
+from src.data.csv_reader.csv_loader import load_csv_dicts
+from src.data.csv_reader.talk_time_reader import extract_talk_time
+from src.data.csv_reader.dials_reader import extract_dials
+from src.data.csv_reader.leads_reader import extract_leads
+from src.data.csv_reader.team_member import load_team_members
+from src.core.services.team_data_service import process_team_data
+from src.data.file_manager.file_manager import process_daily_files
+from src.data.sheets_client.sheets_client import SheetsClient, update_sheet_for_agent, update_sheets_for_team
+from .synthetic_exports import generate_exports
+from .fake_sheets import FakeSpreadsheet
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _measure(fn: Callable[[], Any], fake: Optional[FakeSpreadsheet] = None) -> Dict[str, Any]:
+    """Run `fn` once and return wall time, peak traced memory and API calls."""
+    if fake:
+        fake.calls.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result: Dict[str, Any] = {"wall_s": round(wall, 6), "peak_kib": round(peak / 1024, 1)}
+    if fake:
+        result["api_calls"] = fake.total_calls
+        result["api_calls_by_method"] = dict(fake.calls)
+    return result
+
+def _file(dir_path: str) -> str:
+    return os.path.join(dir_path, os.listdir(dir_path)[0])
+
+
+def run(roster: int, rows: int, latency: float, history: int, seed: int, extract_sample: int) -> Dict[str, Any]:
+    stages: Dict[str, Dict[str, Any]] = {}
+    work = tempfile.mkdtemp(prefix="bench-")
+    # Keep the index cache out of the way; cold and warm runs are measured separately
+    os.environ["METRICS_CACHE_DIR"] = os.path.join(work, "cache")
+    try:
+        dirs = generate_exports(os.path.join(work, "input"), roster, rows, seed)
+        team_file, talk_file = _file(dirs["team_members"]), _file(dirs["talk_time"])
+        dials_file, leads_file = _file(dirs["dials"]), _file(dirs["leads"])
+        agents = load_team_members(team_file)
+
+        # 1) Raw parsing
+        stages["load_csv_dicts"] = _measure(lambda: load_csv_dicts(talk_file))
+
+        # 2) Per-agent readers, on a sample (they reparse per call)
+        sample = agents[:extract_sample]
+        stages[f"extract_x{len(sample)}"] = _measure(lambda: [
+            (extract_talk_time(talk_file, a), extract_dials(dials_file, a), extract_leads(leads_file, a))
+            for a in sample
+        ])
+
+        # 3) Whole team, cold and warm index cache
+        team_args = (team_file, talk_file, dials_file, leads_file)
+        stages["process_team_data_cold"] = _measure(lambda: process_team_data(*team_args))
+        stages["process_team_data_warm"] = _measure(lambda: process_team_data(*team_args))
+
+        # 4) Daily run including archiving (on a copy, since files are moved)
+        daily = os.path.join(work, "daily")
+        shutil.copytree(os.path.join(work, "input"), daily)
+        os.environ["PROCESSED_DIR"] = os.path.join(work, "processed")
+        os.environ["ARCHIVE_INDEX_PATH"] = os.path.join(work, "archive_index.sqlite")
+        stages["process_daily_files"] = _measure(lambda: process_daily_files(
+            os.path.join(daily, "leads"), os.path.join(daily, "talk_time"),
+            os.path.join(daily, "dials"), os.path.join(daily, "team_members")
+        ))
+
+        team = process_team_data(*team_args)
+        team.set_date("01/02/2025")
+
+        # 5) Per-agent uploads against the fake
+        fake = FakeSpreadsheet(agents, latency, history)
+        client = SheetsClient("bench", fake)
+        stages["update_sheet_for_agent"] = _measure(
+            lambda: [update_sheet_for_agent(team.record(i), client) for i in range(len(team))], fake)
+
+        # 6) Batched upload, cold row cache then warm
+        fake = FakeSpreadsheet(agents, latency, history)
+        client = SheetsClient("bench", fake)
+        stages["update_sheets_for_team_cold"] = _measure(lambda: update_sheets_for_team(team, client), fake)
+        stages["update_sheets_for_team_warm"] = _measure(lambda: update_sheets_for_team(team, client), fake)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "params": {"roster": roster, "rows": rows, "latency_s": latency,
+                   "history_rows": history, "seed": seed, "extract_sample": extract_sample},
+        "stages": stages
+    }
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    print(f"revision {report['revision']}  params {report['params']}")
+    print(f"{'stage':32} {'wall s':>10} {'peak KiB':>10} {'API calls':>10}")
+    for name, stage in report["stages"].items():
+        line = f"{name:32} {stage['wall_s']:>10.4f} {stage['peak_kib']:>10.1f} {stage.get('api_calls', ''):>10}"
+        old = (baseline or {}).get("stages", {}).get(name)
+        if old and old["wall_s"]:
+            line += f"   {stage['wall_s'] / old['wall_s']:.2f}x time vs {baseline['revision']}"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the metrics pipeline on synthetic exports.")
+    parser.add_argument("--roster", type=int, default=60, help="agents on the team (default: 60)")
+    parser.add_argument("--rows", type=int, default=5000, help="rows per Metabase export (default: 5000)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated latency per Sheets call")
+    parser.add_argument("--history", type=int, default=250, help="existing rows per agent tab (default: 250)")
+    parser.add_argument("--extract-sample", type=int, default=10, help="agents timed through extract_* (default: 10)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument("--no-save", action="store_true", help="do not write a results file")
+    args = parser.parse_args()
+
+    report = run(args.roster, args.rows, args.latency_ms / 1000, args.history, args.seed, args.extract_sample)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print_report(report, baseline)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(RESULTS_DIR, f"{stamp}-{report['revision'] or 'unknown'}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {path}")
+
+if __name__ == '__main__':
+    main()
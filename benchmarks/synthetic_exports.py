@@ -0,0 +1,70 @@
+# benchmarks/synthetic_exports.py
+
+import os, csv, random
+from typing import Dict, List
+
+FIRST_NAMES = ["Adam", "Basma", "Carlos", "Dina", "Eslam", "Farah", "Gamal", "Hana", "Islam", "Jana",
+               "Karim", "Laila", "Mostafa", "Nour", "Omar", "Rana", "Salma", "Tarek", "Youssef", "Zeina"]
+LAST_NAMES = ["Ali", "Hassan", "Ibrahim", "Mahmoud", "Mostafa", "Nabil", "Saad", "Salem", "Samir", "Zaki"]
+
+
+def agent_names(count: int, seed: int = 0) -> List[str]:
+    """`count` distinct, deterministic agent names."""
+    rng = random.Random(seed)
+    names: List[str] = []
+    seen = set()
+    while len(names) < count:
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {len(names):05d}"
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+def _write_csv(path: str, header: List[str], rows) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def generate_exports(out_dir: str, roster_size: int, export_rows: int, seed: int = 0) -> Dict[str, str]:
+    """
+    Write a roster plus talk-time, dials and leads exports shaped like the
+    Metabase ones. Each export has `export_rows` rows: every roster agent
+    (in shuffled order) padded with agents from other teams, as a
+    floor-wide export would be. Output is identical for the same arguments.
+
+    Returns:
+        Mapping of "team_members", "talk_time", "dials" and "leads" to
+        the directory holding that single CSV (the layout
+        process_daily_files expects)
+    """
+    rng = random.Random(seed)
+    floor = agent_names(max(roster_size, export_rows), seed)
+    roster = floor[:roster_size]
+
+    dirs: Dict[str, str] = {}
+    for key in ("team_members", "talk_time", "dials", "leads"):
+        dirs[key] = os.path.join(out_dir, key)
+        os.makedirs(dirs[key], exist_ok=True)
+
+    _write_csv(os.path.join(dirs["team_members"], "team_members.csv"),
+               ["Agent Name"], ([name] for name in roster))
+
+    talk = floor[:]
+    rng.shuffle(talk)
+    _write_csv(os.path.join(dirs["talk_time"], "talk_time.csv"),
+               ["User Name", "Sum of Duration in Minutes"],
+               ([name, f"{rng.uniform(0, 420):.2f}"] for name in talk))
+
+    dials = floor[:]
+    rng.shuffle(dials)
+    _write_csv(os.path.join(dirs["dials"], "dials.csv"),
+               ["User Name", "Distinct values of Started At"],
+               ([name, rng.randint(0, 400)] for name in dials))
+
+    leads = [name for name in floor if rng.random() < 0.3]
+    rng.shuffle(leads)
+    _write_csv(os.path.join(dirs["leads"], "leads.csv"),
+               ["Sales Rep", "Count"],
+               ([name, rng.randint(1, 5)] for name in leads))
+    return dirs
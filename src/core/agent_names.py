@@ -0,0 +1,21 @@
+# src/core/agent_names.py
+
+import unicodedata
+from typing import Dict, Optional
+
+
+def normalize_agent_name(name: str) -> str:
+    """
+    Matching key for an agent name: Unicode NFKC, casefolded, with runs
+    of whitespace collapsed and the ends trimmed, so "John  Smith " in
+    one export and "john smith" in the roster are the same agent.
+    """
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+def agent_key(name: str, aliases: Optional[Dict[str, str]] = None) -> str:
+    """
+    The normalized key of `name`, after mapping it through `aliases`
+    (normalized alias → normalized agent name, see `load_agent_aliases`).
+    """
+    key = normalize_agent_name(name)
+    return aliases.get(key, key) if aliases else key
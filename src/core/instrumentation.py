@@ -0,0 +1,182 @@
+# src/core/instrumentation.py
+
+import os, io, json, time, pstats, cProfile, threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Where run reports are written (overridable through RUN_REPORT_DIR)
+DEFAULT_REPORT_DIR = os.path.join("raw-data", "reports")
+
+# How many functions the profile section of a report lists
+PROFILE_TOP_FUNCTIONS = 25
+
+_current: Optional["RunStats"] = None
+_current_lock = threading.Lock()
+
+
+class RunStats:
+    """
+    Timers and counters for one pipeline run.
+
+    Stages and Sheets API calls are timed under dotted names like
+    "parse.talk_time" or "sheets.values_batch_update"; each keeps a call count,
+    total and slowest duration. Plain counters (cache hits, retries)
+    live alongside, as do notes: named lists of things worth a look
+    (e.g. agent names that matched nothing). Safe to update from worker
+    threads.
+    """
+
+    def __init__(self, label: str, profile: bool = False):
+        self.label = label
+        self.started = datetime.now()
+        self._t0 = time.perf_counter()
+        self.wall_s: Optional[float] = None
+        self.timers: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.notes: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        # cProfile only sees the thread that started the run
+        self.profiler: Optional[cProfile.Profile] = cProfile.Profile() if profile else None
+        if self.profiler:
+            self.profiler.enable()
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timer = self.timers.setdefault(name, {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+            timer["calls"] += 1
+            timer["total_s"] += seconds
+            timer["max_s"] = max(timer["max_s"], seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def note(self, name: str, items: Iterable[str]) -> None:
+        with self._lock:
+            noted = self.notes.setdefault(name, [])
+            noted.extend(item for item in items if item not in noted)
+
+    def finish(self) -> None:
+        """Stop the clock (and the profiler); further updates are still accepted."""
+        if self.wall_s is None:
+            self.wall_s = time.perf_counter() - self._t0
+        if self.profiler:
+            self.profiler.disable()
+
+    def api_calls(self) -> int:
+        """Total Sheets API calls made so far."""
+        with self._lock:
+            return sum(int(t["calls"]) for name, t in self.timers.items() if name.startswith("sheets."))
+
+    def summary(self) -> str:
+        """One line for a status bar or the end of CLI output."""
+        wall = self.wall_s if self.wall_s is not None else time.perf_counter() - self._t0
+        with self._lock:
+            stages = sorted(
+                ((name, t["total_s"]) for name, t in self.timers.items() if not name.startswith("sheets.")),
+                key=lambda item: item[1], reverse=True
+            )
+        parts = [f"{name} {seconds:.2f}s" for name, seconds in stages[:4]]
+        return f"{self.label}: {wall:.2f}s total, {self.api_calls()} API calls" + (
+            f" ({', '.join(parts)})" if parts else "")
+
+    def report(self) -> Dict[str, Any]:
+        """Everything recorded, as a JSON-serialisable dict."""
+        with self._lock:
+            report: Dict[str, Any] = {
+                "label": self.label,
+                "started": self.started.isoformat(timespec="seconds"),
+                "wall_s": round(self.wall_s, 6) if self.wall_s is not None else None,
+                "timers": {
+                    name: {"calls": int(t["calls"]), "total_s": round(t["total_s"], 6), "max_s": round(t["max_s"], 6)}
+                    for name, t in sorted(self.timers.items())
+                },
+                "counters": dict(sorted(self.counters.items())),
+                "notes": {name: list(items) for name, items in sorted(self.notes.items())}
+            }
+        if self.profiler:
+            out = io.StringIO()
+            pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+            report["profile"] = out.getvalue()
+        return report
+
+    def write_report(self, report_dir: Optional[str] = None) -> str:
+        """
+        Write the JSON report (and a .prof file when profiling) under
+        `report_dir`, default RUN_REPORT_DIR or raw-data/reports.
+        Returns the report path.
+        """
+        report_dir = report_dir or os.getenv("RUN_REPORT_DIR") or DEFAULT_REPORT_DIR
+        os.makedirs(report_dir, exist_ok=True)
+        base = os.path.join(report_dir, f"{self.label}-{self.started.strftime('%Y%m%d-%H%M%S')}")
+        if self.profiler:
+            self.profiler.dump_stats(f"{base}.prof")
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return f"{base}.json"
+
+def start_run(label: str, profile: Optional[bool] = None) -> RunStats:
+    """
+    Begin recording a run; stages and API calls anywhere in the process
+    are attributed to it until `finish_run`. `profile` defaults to the
+    PROFILE_RUNS environment variable ("1" to enable cProfile).
+    There is one current run per process: starting another while a
+    run is still recording takes over its stages and counters.
+    """
+    global _current
+    if profile is None:
+        profile = os.getenv("PROFILE_RUNS") == "1"
+    run = RunStats(label, profile)
+    with _current_lock:
+        _current = run
+    return run
+
+def finish_run(run: RunStats) -> RunStats:
+    """Stop recording `run`; it stays readable for reporting."""
+    global _current
+    run.finish()
+    with _current_lock:
+        if _current is run:
+            _current = None
+    return run
+
+def finish_and_report(run: RunStats) -> str:
+    """Stop `run`, write its JSON report and return a one-line summary naming it."""
+    finish_run(run)
+    try:
+        return f"{run.summary()} — report: {run.write_report()}"
+    except OSError as e:
+        return f"{run.summary()} — report not written: {e}"
+
+def current_run() -> Optional[RunStats]:
+    return _current
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block under `name` in the current run, if any."""
+    run = _current
+    if run is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        run.add_time(name, time.perf_counter() - start)
+
+def api_call(method: str):
+    """Time one Sheets API call; recorded as "sheets.<method>"."""
+    return stage(f"sheets.{method}")
+
+def count(name: str, n: int = 1) -> None:
+    """Bump counter `name` in the current run, if any."""
+    run = _current
+    if run is not None:
+        run.count(name, n)
+
+def note(name: str, items: Iterable[str]) -> None:
+    """Add `items` to note `name` in the current run, if any (duplicates are dropped)."""
+    run = _current
+    if run is not None:
+        run.note(name, items)
@@ -1,9 +1,7 @@
 # src/core/services/agent_data_service.py
 
 from typing import Dict, Any, Optional
-from src.data.csv_reader.talk_time_reader import extract_talk_time
-from src.data.csv_reader.dials_reader import extract_dials
-from src.data.csv_reader.leads_reader import extract_leads
+from .metrics_engine import build_metric_index, resolve_agent
 
 def process_agent_data(
         agent_name: str,
@@ -13,6 +11,8 @@ def process_agent_data(
     """
     Process all CSV data for a single agent and return the extracted metrics.
     Attendance status will be determined by user input, not automated logic.
+    Prefer `process_team_data` when handling more than one agent; it
+    parses each file once for the whole roster.
     
     Args:
         agent_name: Name of the agent to process
@@ -23,18 +23,5 @@ def process_agent_data(
     Returns:
         Dictionary containing all agent data (no attendance determination)
     """
-    # Extract data from all three CSV files
-    talk_time: float = extract_talk_time(talk_time_path, agent_name)
-    dials: int = extract_dials(dials_made_path, agent_name)
-
-    # If no CSV provided, default to 0
-    if leads_path:
-        leads = extract_leads(leads_path, agent_name)
-    else:
-        leads = 0
-    return{
-        "agent_name":agent_name,
-        "talk_time": talk_time,
-        "dials":dials,
-        "leads":leads
-    }
\ No newline at end of file
+    index = build_metric_index(talk_time_path, dials_made_path, leads_path)
+    return resolve_agent(agent_name, index)
@@ -0,0 +1,137 @@
+# src/core/services/backfill_service.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import List, Dict, Optional, Tuple
+from src.core.team_metrics import TeamMetrics
+from src.data.file_manager.archive_index import ArchiveIndex, get_archive_index
+from .metrics_engine import (
+    MetricIndex, build_metric_index, classify_metric_file, normalize_metric_index, report_unmatched, resolve_team
+)
+
+
+def discover_archived_days(processed_dir: str, start: date, end: date) -> List[Tuple[date, str]]:
+    """
+    Return (day, folder) for every <processed_dir>/<YYYY-MM-DD>/ folder
+    with start <= day <= end, oldest first. Other entries are ignored.
+    """
+    if not os.path.isdir(processed_dir):
+        raise FileNotFoundError(f"Processed directory not found:{processed_dir}")
+
+    days: List[Tuple[date, str]] = []
+    for name in os.listdir(processed_dir):
+        folder = os.path.join(processed_dir, name)
+        if not os.path.isdir(folder):
+            continue
+        try:
+            day = datetime.strptime(name, "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        if start <= day <= end:
+            days.append((day, folder))
+    return sorted(days)
+
+def classify_archived_files(day_dir: str) -> Dict[str, str]:
+    """
+    Map metric kind → CSV path for one archived day.
+    Archived files keep their export names, so they are told apart by header.
+    """
+    found: Dict[str, str] = {}
+    for name in sorted(os.listdir(day_dir)):
+        if not name.lower().endswith(('csv', '.csv.gz')):
+            continue
+        path = os.path.join(day_dir, name)
+        kind = classify_metric_file(path)
+        if kind is None:
+            continue
+        if kind in found:
+            raise RuntimeError(f"Multible {kind} CSVs in{day_dir}: {[found[kind], path]}")
+        found[kind] = path
+    return found
+
+def load_archived_day(day_dir: str) -> Tuple[MetricIndex, Dict[str, str]]:
+    """
+    Parse one archive folder into its merged metric index.
+    Returns (index, kind → file). Runs in a worker process, so it only
+    takes and returns picklable values.
+    """
+    files = classify_archived_files(day_dir)
+    missing: List[str] = [k for k in ("talk_time", "dials") if k not in files]
+    if missing:
+        raise FileNotFoundError(f"Missing required CSVs in {day_dir}: {missing}")
+    return build_metric_index(files["talk_time"], files["dials"], files.get("leads")), files
+
+def _team_for_day(day: date, team_members: List[str], index: MetricIndex) -> TeamMetrics:
+    """
+    The roster's rows for `day`, stamped with that day's date rather
+    than today's. Unmatched names are left to the caller to report.
+    """
+    team = resolve_team(team_members, index, report=False)
+    team.set_date(day.strftime("%d/%m/%Y"))
+    return team
+
+def process_archived_day(day: date, day_dir: str, team_members: List[str]) -> TeamMetrics:
+    """Rebuild one day's team records from its archive folder."""
+    index, _ = load_archived_day(day_dir)
+    report_unmatched(team_members, index)
+    return _team_for_day(day, team_members, index)
+
+def backfill_team_data(
+        processed_dir: str,
+        team_members: List[str],
+        start: date,
+        end: date,
+        max_workers: Optional[int] = None,
+        archive: Optional[ArchiveIndex] = None
+) -> Tuple[TeamMetrics, Dict[date, str]]:
+    """
+    Replay every archived day in [start, end].
+
+    Days already in the archive index (see `ArchiveIndex`) are read from
+    it directly. The rest, e.g. folders archived before the index
+    existed, are parsed in a process pool and then added to the index.
+
+    Unmatched names are reported once for the whole range: roster
+    agents found in no day's exports, and export agents on no roster.
+
+    Returns:
+        (records, errors) — one table with the rows of all days that
+        processed cleanly, oldest day first and in roster order within a
+        day; errors maps each day that failed to its error message.
+    """
+    archive = archive or get_archive_index()
+    indexed = set(archive.days(start, end))
+    try:
+        folders = discover_archived_days(processed_dir, start, end)
+    except FileNotFoundError:
+        if not indexed:
+            raise
+        folders = []
+
+    by_day: Dict[date, TeamMetrics] = {}
+    errors: Dict[date, str] = {}
+    # Every agent seen on any replayed day, for the one unmatched report
+    seen: MetricIndex = {}
+    for day in indexed:
+        index = normalize_metric_index(archive.metrics_for_day(day))
+        seen.update(index)
+        by_day[day] = _team_for_day(day, team_members, index)
+
+    unindexed = [(day, folder) for day, folder in folders if day not in indexed]
+    if unindexed:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [(day, pool.submit(load_archived_day, folder)) for day, folder in unindexed]
+            for day, future in futures:
+                try:
+                    index, files = future.result()
+                except Exception as e:
+                    errors[day] = str(e)
+                    continue
+                archive.record_day(day, index, files)
+                seen.update(index)
+                by_day[day] = _team_for_day(day, team_members, index)
+
+    report_unmatched(team_members, seen)
+    # Date order, so each agent's rows land chronologically
+    return TeamMetrics.concat(by_day[day] for day in sorted(by_day)), errors
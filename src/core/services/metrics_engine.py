@@ -0,0 +1,279 @@
+# src/core/services/metrics_engine.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from src.data.csv_reader.csv_loader import read_csv_header, index_csv
+from src.data.csv_reader.talk_time_reader import TALK_TIME_COLUMNS
+from src.data.csv_reader.dials_reader import DIALS_COLUMNS
+from src.data.csv_reader.leads_reader import LEADS_COLUMNS
+from src.data.csv_reader.index_cache import cached_index
+from src.data.csv_reader.team_member import load_team_members
+from src.data.csv_reader.agent_aliases import get_agent_aliases
+from src.core.agent_names import agent_key, normalize_agent_name
+from src.core.instrumentation import stage, count, note, current_run
+from src.core.team_metrics import TeamMetrics
+
+# normalized agent name → {"agent_name": export spelling, "talk_time": float, "dials": int, "leads": int}
+MetricIndex = Dict[str, Dict[str, Any]]
+
+# One parsed metric file: normalized agent name → [export spelling, value]
+KeyedValues = Dict[str, List[Any]]
+
+# Per metric export: its (agent, value) columns and how to convert the value
+METRIC_READERS: Dict[str, Tuple[List[str], Callable[[str], Any]]] = {
+    "talk_time": (TALK_TIME_COLUMNS, float),
+    "dials": (DIALS_COLUMNS, int),
+    "leads": (LEADS_COLUMNS, int)
+}
+
+# Required header of each metric export
+METRIC_COLUMNS: Dict[str, List[str]] = {kind: columns for kind, (columns, _) in METRIC_READERS.items()}
+
+# Required header of every input file: the metric exports and the roster
+INPUT_COLUMNS: Dict[str, List[str]] = {**METRIC_COLUMNS, "team_members": ["Agent Name"]}
+
+def key_by_normalized_name(values: Dict[str, Any]) -> KeyedValues:
+    """
+    Re-key one metric's agent → value index by normalized name (see
+    `normalize_agent_name`), keeping the first export spelling; values
+    of names that fold onto one key are added up.
+    """
+    keyed: KeyedValues = {}
+    for name, value in values.items():
+        key = normalize_agent_name(name)
+        entry = keyed.get(key)
+        if entry is None:
+            keyed[key] = [name, value]
+        else:
+            entry[1] += value
+    return keyed
+
+def load_metric_index(kind: str, path: str, use_cache: bool = True) -> KeyedValues:
+    """
+    Parse one metric export (`kind` is "talk_time", "dials" or "leads")
+    into its normalized-name index, going through the on-disk cache by
+    default. Names are normalized at parse time and cached that way, so
+    a warm load does no per-row work.
+    """
+    columns, convert = METRIC_READERS[kind]
+
+    def build(p: str) -> KeyedValues:
+        return key_by_normalized_name(index_csv(p, columns, convert))
+
+    with stage(f"parse.{kind}"):
+        return cached_index(kind, path, build) if use_cache else build(path)
+
+def classify_metric_file(path: str) -> Optional[str]:
+    """
+    Tell which metric export `path` is ("talk_time", "dials" or "leads")
+    from its header alone. Returns None if it matches none of them.
+    """
+    header = read_csv_header(path)
+    for kind, columns in METRIC_COLUMNS.items():
+        if all(c in header for c in columns):
+            return kind
+    return None
+
+def validate_input_headers(paths: Dict[str, str]) -> List[str]:
+    """
+    Check the header of every input file (kind → path, kinds as in
+    `INPUT_COLUMNS`) without reading any data row.
+    Returns one problem per unreadable file or missing column set.
+    """
+    problems: List[str] = []
+    for kind, path in paths.items():
+        try:
+            header = read_csv_header(path)
+        except Exception as e:
+            problems.append(f"{kind} ({os.path.basename(path)}): {e}")
+            continue
+        missing = [c for c in INPUT_COLUMNS[kind] if c not in header]
+        if missing:
+            problems.append(f"{kind} ({os.path.basename(path)}): missing expected columns {missing}")
+    return problems
+
+def _parse_input(kind: str, path: str, use_cache: bool) -> Any:
+    if kind == "team_members":
+        with stage("parse.team_members"):
+            return load_team_members(path)
+    return load_metric_index(kind, path, use_cache)
+
+def load_inputs(paths: Dict[str, Optional[str]], use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Load the input files (kind → path; None entries are skipped): every
+    header is validated first, then all files are parsed concurrently,
+    so loading takes as long as the largest file and a bad export fails
+    before anything is parsed.
+
+    Returns:
+        kind → roster (list of names) or metric index
+
+    Raises:
+        RuntimeError listing the problems of every failing file at once
+    """
+    paths = {kind: path for kind, path in paths.items() if path}
+    problems = validate_input_headers(paths)
+    if problems:
+        raise RuntimeError("Invalid input files:\n  " + "\n  ".join(problems))
+
+    with ThreadPoolExecutor(max_workers=max(1, len(paths))) as pool:
+        futures = {kind: pool.submit(_parse_input, kind, path, use_cache) for kind, path in paths.items()}
+    loaded: Dict[str, Any] = {}
+    for kind, future in futures.items():
+        try:
+            loaded[kind] = future.result()
+        except Exception as e:
+            problems.append(f"{kind} ({os.path.basename(paths[kind])}): {e}")
+    if problems:
+        raise RuntimeError("Invalid input files:\n  " + "\n  ".join(problems))
+    return loaded
+
+def build_metric_index(
+        talk_time_path: str,
+        dials_made_path: str,
+        leads_path: Optional[str] = None,
+        use_cache: bool = True) -> MetricIndex:
+    """
+    Parse each metric CSV exactly once, concurrently and after checking
+    every header (see `load_inputs`), and merge them into a single index
+    keyed by agent name. Unchanged files are served from the on-disk
+    index cache instead of being parsed again.
+
+    Args:
+        talk_time_path: Path to the talk-time CSV file
+        dials_made_path: Path to the dials-made CSV file
+        leads_path: Path to the leads CSV file (optional)
+        use_cache: Read and populate the on-disk index cache
+
+    Returns:
+        Mapping of normalized agent name to its talk_time, dials and leads
+    """
+    # 1) At most one parse per file, all files at once
+    loaded = load_inputs({"talk_time": talk_time_path, "dials": dials_made_path, "leads": leads_path}, use_cache)
+
+    # 2) One join across all three; if no leads CSV, every agent has 0 leads
+    return merge_metric_indexes(loaded["talk_time"], loaded["dials"], loaded.get("leads", {}))
+
+def merge_metric_indexes(
+        talk_time: KeyedValues,
+        dials: KeyedValues,
+        leads: KeyedValues,
+        aliases: Optional[Dict[str, str]] = None) -> MetricIndex:
+    """
+    Merge per-metric indexes (see `load_metric_index`), whatever their
+    source, into one index keyed by normalized agent name mapped through
+    `aliases` (see `agent_key`), so spelling, case and spacing
+    differences between exports and the roster still match.
+    Each entry keeps the first export spelling as "agent_name"; names
+    that fold onto one agent have their values added up.
+    Metrics missing for an agent default to zero.
+
+    `aliases` defaults to the AGENT_ALIASES_FILE aliases, if configured.
+    """
+    aliases = get_agent_aliases() if aliases is None else aliases
+    index: MetricIndex = {}
+    for metric, values in (("talk_time", talk_time), ("dials", dials), ("leads", leads)):
+        for key, (name, value) in values.items():
+            key = aliases.get(key, key)
+            entry = index.get(key)
+            if entry is None:
+                entry = index[key] = {"agent_name": name, "talk_time": 0.0, "dials": 0, "leads": 0}
+            entry[metric] += value
+    return index
+
+def normalize_metric_index(
+        index: Dict[str, Dict[str, Any]],
+        aliases: Optional[Dict[str, str]] = None) -> MetricIndex:
+    """Re-key an index stored by export spelling (e.g. in the archive index) as `merge_metric_indexes` would."""
+    names = [m.get("agent_name", name) for name, m in index.items()]
+    return merge_metric_indexes(
+        *(key_by_normalized_name({name: m[metric] for name, m in zip(names, index.values())})
+          for metric in METRIC_COLUMNS),
+        aliases=aliases
+    )
+
+def unmatched_agents(
+        team_members: List[str],
+        index: MetricIndex,
+        aliases: Optional[Dict[str, str]] = None) -> Tuple[List[str], List[str]]:
+    """
+    Names that matched nothing, in one pass over each side.
+
+    Returns:
+        (roster agents found in no export, export agents on no roster),
+        the latter in their export spelling
+    """
+    aliases = get_agent_aliases() if aliases is None else aliases
+    keys = {agent_key(agent, aliases) for agent in team_members}
+    return (
+        [agent for agent in team_members if agent_key(agent, aliases) not in index],
+        sorted(m["agent_name"] for key, m in index.items() if key not in keys)
+    )
+
+def report_unmatched(
+        team_members: List[str],
+        index: MetricIndex,
+        aliases: Optional[Dict[str, str]] = None) -> Tuple[List[str], List[str]]:
+    """
+    Count and note (see `instrumentation.note`) both sides of
+    `unmatched_agents` in the current run, and return them.
+    """
+    missing, unknown = unmatched_agents(team_members, index, aliases)
+    count("join.unmatched_roster", len(missing))
+    count("join.unmatched_exports", len(unknown))
+    note("unmatched_roster", missing)
+    note("unmatched_exports", unknown)
+    return missing, unknown
+
+def unmatched_warnings(notes: Optional[Dict[str, List[str]]] = None, limit: int = 10) -> List[str]:
+    """
+    One warning line per non-empty side of the unmatched names in
+    `notes` (default: the current run's, see `report_unmatched`),
+    naming at most `limit` agents each; the run report keeps the full
+    lists.
+    """
+    if notes is None:
+        run = current_run()
+        notes = run.notes if run else {}
+    labels = {
+        "unmatched_roster": "roster agents found in no export (uploaded with zero metrics)",
+        "unmatched_exports": "export agents on no roster"
+    }
+    lines: List[str] = []
+    for name, label in labels.items():
+        agents = notes.get(name, [])
+        if agents:
+            more = f" and {len(agents) - limit} more" if len(agents) > limit else ""
+            lines.append(f"{len(agents)} {label}: {', '.join(agents[:limit])}{more}")
+    return lines
+
+def resolve_agent(
+        agent_name: str,
+        index: MetricIndex,
+        aliases: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Look up a single agent in the index.
+    Agents absent from every file get zero for all metrics.
+    """
+    aliases = get_agent_aliases() if aliases is None else aliases
+    metrics: Optional[Dict[str, Any]] = index.get(agent_key(agent_name, aliases))
+    if metrics is None:
+        metrics = {"talk_time": 0.0, "dials": 0, "leads": 0}
+    return {**metrics, "agent_name": agent_name}
+
+def resolve_team(
+        team_members: List[str],
+        index: MetricIndex,
+        aliases: Optional[Dict[str, str]] = None,
+        report: bool = True) -> TeamMetrics:
+    """
+    Join the roster against the index in a single pass, by normalized
+    name. Returns one row per roster entry, in roster order.
+    With `report`, names unmatched on either side go to the run report.
+    """
+    aliases = get_agent_aliases() if aliases is None else aliases
+    if report:
+        report_unmatched(team_members, index, aliases)
+    keys = [agent_key(agent, aliases) for agent in team_members]
+    return TeamMetrics.from_index(team_members, index, keys)
@@ -1,24 +1,88 @@
 # src/core/services/team_data_service.py
 
-from typing import List, Dict, Any, Optional
+from typing import Dict, List, Optional
 from src.data.csv_reader.team_member import load_team_members
-from .agent_data_service import process_agent_data
+from src.data.metabase_client.metabase_client import (
+    MetabaseClient, metabase_client_from_env, card_ids_from_env, fetch_metric_index
+)
+from src.core.instrumentation import stage
+from src.core.team_metrics import TeamMetrics
+from .metrics_engine import (
+    MetricIndex, build_metric_index, load_inputs, merge_metric_indexes, resolve_team, report_unmatched
+)
 
 def process_team_data(
         team_path: str,
         talk_time_path: str,
         dials_made_path: str,
         leads_path: Optional[str] = None
-) -> List[Dict[str,Any]]:
+) -> TeamMetrics:
     """
     Load all team members and process each one’s CSV data.
-    Returns a list of dicts with keys: agent_name, talk_time, dials, leads.
+    Every header is checked, then the roster and each metric file are
+    parsed once, concurrently, and joined.
+    Returns one TeamMetrics row per roster entry, with talk_time,
+    dials and leads filled in.
     """
-    team_members = load_team_members(team_path)
-    result: List[Dict[str,Any]] = []
+    loaded = load_inputs({
+        "team_members": team_path, "talk_time": talk_time_path, "dials": dials_made_path, "leads": leads_path
+    })
+    index = merge_metric_indexes(loaded["talk_time"], loaded["dials"], loaded.get("leads", {}))
+    with stage("join"):
+        return resolve_team(loaded["team_members"], index)
 
-    for agent in team_members:
-        data = process_agent_data(agent, talk_time_path, dials_made_path, leads_path)
-        result.append(data)
-    
-    return result
\ No newline at end of file
+def process_team_data_from_metabase(
+        team_path: str,
+        client: Optional[MetabaseClient] = None,
+        card_ids: Optional[Dict[str, int]] = None
+) -> TeamMetrics:
+    """
+    Same as `process_team_data`, but the talk-time, dials and leads
+    results are pulled straight from their Metabase cards (configured
+    through METABASE_* env vars by default) instead of exported CSVs.
+    """
+    with stage("parse.team_members"):
+        team_members = load_team_members(team_path)
+    with stage("metabase.fetch"):
+        index = fetch_metric_index(client or metabase_client_from_env(), card_ids or card_ids_from_env())
+    with stage("join"):
+        return resolve_team(team_members, index)
+
+def resolve_teams(teams: List[Dict[str, str]], index: MetricIndex) -> Dict[str, TeamMetrics]:
+    """
+    Join every team's roster (see `load_team_manifest`) against one
+    shared metric index. Returns team name → that team's table.
+    Unmatched names are reported once, against all rosters together.
+    """
+    tables: Dict[str, TeamMetrics] = {}
+    everyone: List[str] = []
+    for team in teams:
+        with stage("parse.team_members"):
+            team_members = load_team_members(team["roster"])
+        with stage("join"):
+            tables[team["name"]] = resolve_team(team_members, index, report=False)
+        everyone.extend(team_members)
+    report_unmatched(everyone, index)
+    return tables
+
+def process_teams(
+        teams: List[Dict[str, str]],
+        talk_time_path: str,
+        dials_made_path: str,
+        leads_path: Optional[str] = None
+) -> Dict[str, TeamMetrics]:
+    """
+    Like `process_team_data` for several teams at once: the shared
+    metric files are parsed a single time, whatever the number of teams.
+    """
+    return resolve_teams(teams, build_metric_index(talk_time_path, dials_made_path, leads_path))
+
+def process_teams_from_metabase(
+        teams: List[Dict[str, str]],
+        client: Optional[MetabaseClient] = None,
+        card_ids: Optional[Dict[str, int]] = None
+) -> Dict[str, TeamMetrics]:
+    """Like `process_teams`, with each Metabase card fetched once for every team."""
+    with stage("metabase.fetch"):
+        index = fetch_metric_index(client or metabase_client_from_env(), card_ids or card_ids_from_env())
+    return resolve_teams(teams, index)
@@ -0,0 +1,180 @@
+# src/core/team_metrics.py
+
+import numpy as np
+from datetime import datetime
+from typing import Dict, Any, List, Iterable, Optional, Sequence, Tuple
+
+# Attendance values a row may hold, and those that count as present
+# (coloured green in the sheet)
+ATTENDANCE_VALUES = ("Office", "Home", "UPL")
+PRESENT_ATTENDANCE = ("Office", "Home")
+
+_ZERO_METRICS = {"talk_time": 0.0, "dials": 0, "leads": 0}
+
+
+def minutes_to_hms(minutes: np.ndarray) -> np.ndarray:
+    """Convert an array of talk-time minutes to HH:MM:SS strings, all at once."""
+    # np.rint rounds half to even, like the built-in round() it replaces
+    total_seconds = np.rint(np.asarray(minutes, dtype=np.float64) * 60).astype(np.int64)
+    if not total_seconds.size:
+        # np.char.zfill cannot size an empty array
+        return np.array([], dtype=str)
+    hours = (total_seconds // 3600).astype(str)
+    mins = ((total_seconds % 3600) // 60).astype(str)
+    seconds = (total_seconds % 60).astype(str)
+    return np.char.add(np.char.add(np.char.add(np.char.zfill(hours, 2), ":"),
+                                   np.char.add(np.char.zfill(mins, 2), ":")),
+                       np.char.zfill(seconds, 2))
+
+class TeamMetrics:
+    """
+    Column-oriented table of a team's metrics: one row per agent (or per
+    agent and day, for a backfill), one numpy array per field.
+
+    Loading, the GUI table, the CLI prompts and the Sheets upload all
+    share this one structure and update its columns in place, instead of
+    copying a dict per agent at every step.
+
+    Columns: agent_name, date, attendance, notes (object arrays of str),
+    talk_time (float64 minutes), dials and leads (int64).
+    """
+
+    # Field order of the constructor and of `record()` dicts
+    FIELDS = ("agent_name", "talk_time", "dials", "leads", "attendance", "notes", "date")
+
+    def __init__(
+            self,
+            agent_name: Sequence[str],
+            talk_time: Optional[Sequence[float]] = None,
+            dials: Optional[Sequence[int]] = None,
+            leads: Optional[Sequence[int]] = None,
+            attendance: Optional[Sequence[str]] = None,
+            notes: Optional[Sequence[str]] = None,
+            date: Optional[Sequence[str]] = None):
+        n = len(agent_name)
+        self.agent_name = np.array(agent_name, dtype=object).reshape(n)
+        self.talk_time = np.zeros(n) if talk_time is None else np.array(talk_time, dtype=np.float64)
+        self.dials = np.zeros(n, dtype=np.int64) if dials is None else np.array(dials, dtype=np.int64)
+        self.leads = np.zeros(n, dtype=np.int64) if leads is None else np.array(leads, dtype=np.int64)
+        # Attendance defaults to Office and notes to empty, as in the GUI
+        self.attendance = np.full(n, "Office", dtype=object) if attendance is None else np.array(attendance, dtype=object)
+        self.notes = np.full(n, "", dtype=object) if notes is None else np.array(notes, dtype=object)
+        self.date = np.full(n, "", dtype=object) if date is None else np.array(date, dtype=object)
+
+    @classmethod
+    def empty(cls) -> "TeamMetrics":
+        return cls([])
+
+    @classmethod
+    def from_index(
+            cls,
+            team_members: Sequence[str],
+            index: Dict[str, Dict[str, Any]],
+            keys: Optional[Sequence[str]] = None) -> "TeamMetrics":
+        """
+        Join the roster against an agent → metrics index in one pass,
+        looking each agent up by `keys[i]` if given, else by name.
+        Agents absent from the index get zero for every metric.
+        """
+        n = len(team_members)
+        metrics = [index.get(key) or _ZERO_METRICS for key in (team_members if keys is None else keys)]
+        return cls(
+            team_members,
+            np.fromiter((m["talk_time"] for m in metrics), dtype=np.float64, count=n),
+            np.fromiter((m["dials"] for m in metrics), dtype=np.int64, count=n),
+            np.fromiter((m["leads"] for m in metrics), dtype=np.int64, count=n)
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TeamMetrics":
+        """Build from per-agent dicts; missing fields take their defaults."""
+        records = list(records)
+        columns = {
+            field: [rec[field] for rec in records]
+            for field in cls.FIELDS[1:] if all(field in rec for rec in records)
+        }
+        return cls([rec["agent_name"] for rec in records], **columns)
+
+    @classmethod
+    def concat(cls, tables: Iterable["TeamMetrics"]) -> "TeamMetrics":
+        tables = list(tables)
+        if not tables:
+            return cls.empty()
+        return cls(**{field: np.concatenate([getattr(t, field) for t in tables]) for field in cls.FIELDS})
+
+    def __len__(self) -> int:
+        return len(self.agent_name)
+
+    def take(self, indexes: Sequence[int]) -> "TeamMetrics":
+        """New table holding rows `indexes`, in that order."""
+        indexes = np.asarray(indexes, dtype=np.intp)
+        return TeamMetrics(**{field: getattr(self, field)[indexes] for field in self.FIELDS})
+
+    def copy(self) -> "TeamMetrics":
+        return TeamMetrics(**{field: getattr(self, field).copy() for field in self.FIELDS})
+
+    def set_date(self, date: str) -> None:
+        """Stamp every row with `date` (DD/MM/YYYY, as written to the sheet)."""
+        self.date[:] = date
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Row `i` as a plain dict, for code that handles one agent at a time."""
+        row = {field: getattr(self, field)[i] for field in self.FIELDS}
+        for field in ("talk_time", "dials", "leads"):
+            row[field] = row[field].item()
+        return row
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """(agent, date) per row: the identity of a row in the sheet."""
+        return list(zip(self.agent_name.tolist(), self.date.tolist()))
+
+    def present(self) -> np.ndarray:
+        """Boolean mask of rows whose attendance counts as present."""
+        return np.isin(self.attendance, PRESENT_ATTENDANCE)
+
+    def has_leads(self) -> np.ndarray:
+        """Boolean mask of rows with at least one lead."""
+        return self.leads > 0
+
+    def problems(self) -> List[str]:
+        """
+        Everything that would make a row unfit to upload, checked for
+        the whole table at once: blank agents, attendance other than
+        Office/Home/UPL, negative metrics, dates not DD/MM/YYYY and
+        repeated (agent, date) pairs. Empty when the table is valid.
+        """
+        problems: List[str] = []
+        agents = self.agent_name.tolist()
+        checks = [
+            (np.array([not str(a).strip() for a in agents], dtype=bool), "blank agent name"),
+            (~np.isin(self.attendance, ATTENDANCE_VALUES), "attendance must be one of " + "/".join(ATTENDANCE_VALUES)),
+            ((self.talk_time < 0) | (self.dials < 0) | (self.leads < 0), "negative talk time, dials or leads")
+        ]
+        for mask, message in checks:
+            problems.extend(f"{agents[i]}: {message}" for i in np.flatnonzero(mask))
+
+        seen = set()
+        for i, (agent, date) in enumerate(self.keys()):
+            try:
+                datetime.strptime(date, "%d/%m/%Y")
+            except (TypeError, ValueError):
+                problems.append(f"{agent}: date {date!r} is not DD/MM/YYYY")
+            if (agent, date) in seen:
+                problems.append(f"{agent}: more than one row for {date}")
+            seen.add((agent, date))
+        return problems
+
+    def sheet_values(self) -> List[List[Any]]:
+        """
+        Every row as written to the sheet, columns A–F: date, attendance,
+        leads, dials, talk time as HH:MM:SS, notes. Plain Python values,
+        ready to be JSON-encoded.
+        """
+        return [list(row) for row in zip(
+            self.date.tolist(),
+            self.attendance.tolist(),
+            self.leads.tolist(),
+            self.dials.tolist(),
+            minutes_to_hms(self.talk_time).tolist(),
+            self.notes.tolist()
+        )]
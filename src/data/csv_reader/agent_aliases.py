@@ -0,0 +1,61 @@
+# src/data/csv_reader/agent_aliases.py
+
+import os, threading
+from typing import Any, Dict, Optional, Tuple
+from src.core.agent_names import agent_key, normalize_agent_name
+from .csv_loader import iter_csv_columns
+
+# Columns an alias file must provide: the spelling seen in an export
+# (or roster) and the agent it stands for
+AGENT_ALIAS_COLUMNS = ["Alias", "Agent Name"]
+
+# (path, mtime) → aliases of the configured file, reloaded when it changes
+_loaded: Dict[Tuple[str, float], Dict[str, str]] = {}
+_loaded_lock = threading.Lock()
+
+
+def load_agent_aliases(path: str) -> Dict[str, str]:
+    """
+    Read the alias CSV at `path` and return normalized alias →
+    normalized agent name (see `normalize_agent_name`).
+    Raises RuntimeError on missing columns, blank fields or an alias
+    given for two different agents.
+    """
+    aliases: Dict[str, str] = {}
+    for alias, agent in iter_csv_columns(path, AGENT_ALIAS_COLUMNS):
+        key, target = normalize_agent_name(alias), normalize_agent_name(agent)
+        if not (key and target):
+            raise RuntimeError(f"Incomplete alias row in {path}: {[alias, agent]}")
+        if aliases.get(key, target) != target:
+            raise RuntimeError(f"Alias {alias!r} maps to two agents in {path}")
+        if key != target:
+            aliases[key] = target
+    return aliases
+
+def get_agent_aliases(path: Optional[str] = None) -> Dict[str, str]:
+    """
+    The aliases at `path` (default: AGENT_ALIASES_FILE), or {} if none is
+    configured. The file is parsed again only when its mtime changes.
+    """
+    path = path or os.getenv("AGENT_ALIASES_FILE")
+    if not path:
+        return {}
+    identity = (os.path.abspath(path), os.path.getmtime(path))
+    with _loaded_lock:
+        if identity not in _loaded:
+            _loaded.clear()
+            _loaded[identity] = load_agent_aliases(path)
+        return _loaded[identity]
+
+def lookup_agent(values: Dict[str, Any], agent: str, default: Any, aliases: Optional[Dict[str, str]] = None) -> Any:
+    """
+    The value of `agent` in an export-spelling → value index, matched
+    the way the metrics engine joins names (see `agent_key`): the
+    values of every spelling that normalizes or is aliased to the same
+    agent are added up. Returns `default` if none matches.
+    `aliases` defaults to the AGENT_ALIASES_FILE aliases, if configured.
+    """
+    aliases = get_agent_aliases() if aliases is None else aliases
+    key = agent_key(agent, aliases)
+    matches = [value for name, value in values.items() if agent_key(name, aliases) == key]
+    return sum(matches) if matches else default
@@ -0,0 +1,87 @@
+# src/data/csv_reader/attendance_reader.py
+
+import json
+from typing import Dict, Any, List, Optional
+from src.core.agent_names import agent_key
+from src.core.team_metrics import TeamMetrics, ATTENDANCE_VALUES
+from .agent_aliases import get_agent_aliases
+from .csv_loader import iter_csv_columns, read_csv_header
+
+# Columns an attendance side-file must provide; "Leads" and "Notes" are optional
+ATTENDANCE_COLUMNS = ["Agent Name", "Attendance"]
+OPTIONAL_ATTENDANCE_COLUMNS = ["Leads", "Notes"]
+
+# Keys of each object in a JSON side-file, in the same order
+_JSON_KEYS = {"Agent Name": "agent_name", "Attendance": "attendance", "Leads": "leads", "Notes": "notes"}
+
+
+def _read_rows(path: str) -> List[Dict[str, Any]]:
+    """Side-file rows keyed by CSV column name, from a CSV or a JSON list of objects."""
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            raise RuntimeError(f"{path}: expected a JSON list of objects with {list(_JSON_KEYS.values())}")
+        return [{column: item.get(key) for column, key in _JSON_KEYS.items()} for item in data]
+
+    header = read_csv_header(path)
+    optional = [c for c in OPTIONAL_ATTENDANCE_COLUMNS if c in header]
+    columns = ATTENDANCE_COLUMNS + optional
+    return [dict(zip(columns, row)) for row in iter_csv_columns(path, columns)]
+
+def load_attendance(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read an attendance side-file and return agent → {"attendance",
+    "leads", "notes"}. A CSV needs headers "Agent Name" and "Attendance"
+    (Office, Home or UPL) plus optional "Leads" and "Notes"; a .json
+    file holds a list of objects with agent_name, attendance and
+    optional leads and notes. A blank or absent Leads keeps the
+    exported count (leads is None).
+    Every row is checked before anything is returned; RuntimeError
+    lists all the problems found, not just the first.
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    problems: List[str] = []
+    for n, row in enumerate(_read_rows(path), start=1):
+        agent = str(row["Agent Name"] or "").strip()
+        attendance = str(row["Attendance"] or "").strip()
+        leads_text = str(row.get("Leads") if row.get("Leads") is not None else "").strip()
+        where = f"row {n} ({agent or 'no agent'})"
+        if not agent:
+            problems.append(f"{where}: blank agent name")
+        elif agent in entries:
+            problems.append(f"{where}: agent listed twice")
+        if attendance not in ATTENDANCE_VALUES:
+            problems.append(f"{where}: unknown attendance {attendance!r}")
+        leads: Optional[int] = None
+        if leads_text:
+            try:
+                leads = int(leads_text)
+            except ValueError:
+                leads = -1
+            if leads < 0:
+                problems.append(f"{where}: leads must be a whole number ≥ 0, got {leads_text!r}")
+        entries[agent] = {"attendance": attendance, "leads": leads, "notes": str(row.get("Notes") or "").strip()}
+
+    if problems:
+        raise RuntimeError(f"Invalid attendance file {path}:\n  " + "\n  ".join(problems))
+    return entries
+
+def apply_attendance(team: TeamMetrics, entries: Dict[str, Dict[str, Any]], default: str = "Office") -> List[str]:
+    """
+    Fill `team`'s attendance and notes from side-file `entries`, and
+    its leads where an entry overrides them; agents not listed get
+    `default` and empty notes and keep their exported leads.
+    Names are matched on their normalized form (see `agent_key`).
+    Returns the listed agents that are not on the team (likely typos).
+    """
+    aliases = get_agent_aliases()
+    by_key = {agent_key(agent, aliases): entry for agent, entry in entries.items()}
+    keys = [agent_key(agent, aliases) for agent in team.agent_name.tolist()]
+    team.attendance[:] = [by_key[k]["attendance"] if k in by_key else default for k in keys]
+    team.notes[:] = [by_key[k]["notes"] if k in by_key else "" for k in keys]
+    for i, k in enumerate(keys):
+        if k in by_key and by_key[k]["leads"] is not None:
+            team.leads[i] = by_key[k]["leads"]
+    on_team = set(keys)
+    return [agent for agent in entries if agent_key(agent, aliases) not in on_team]
@@ -1,11 +1,96 @@
 # src/data/csv_reader/csv_loader.py
 
-import os, csv
-from typing import List, Dict
+import os, csv, gzip
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple, TextIO
 
 
+def open_csv(path: str) -> TextIO:
+    """Open a CSV for reading as text; archived ".csv.gz" files are decompressed on the fly."""
+    if path.lower().endswith('.gz'):
+        return gzip.open(path, 'rt', newline='', encoding='utf-8')
+    return open(path, newline='', encoding='utf-8')
+
 def load_csv_dicts(path:str) -> List[Dict[str,str]]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"CSV file not found:{path}")
-    with open(path, newline='', encoding='utf-8') as f:
+    with open_csv(path) as f:
         return list(csv.DictReader(f))
+
+def read_csv_header(path: str) -> List[str]:
+    """Return the header row of the CSV at `path` without reading any data rows."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"CSV file not found:{path}")
+    with open_csv(path) as f:
+        return next(csv.reader(f), [])
+
+def _column_positions(header: Optional[List[str]], columns: Sequence[str]) -> List[int]:
+    """
+    Validate `header` once and return the index of each requested column.
+    Raises RuntimeError listing every missing column.
+    """
+    missing = [c for c in columns if not header or c not in header]
+    if missing:
+        raise RuntimeError(f"Missing expected columns: {missing}")
+    assert header is not None
+    return [header.index(c) for c in columns]
+
+def _project(rows: Iterator[List[str]], positions: List[int]) -> Iterator[Tuple[str, ...]]:
+    """Yield only the cells at `positions`; short rows are padded with ''."""
+    for row in rows:
+        # Blank lines are skipped, as csv.DictReader does
+        if not row:
+            continue
+        yield tuple(row[p] if p < len(row) else '' for p in positions)
+
+def iter_columns(lines: Iterable[str], columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Stream CSV text from `lines` (a file, a response body, ...) and yield
+    one tuple per row holding only `columns`, in that order.
+    The header is read and validated before this function returns.
+    """
+    reader = csv.reader(lines)
+    positions = _column_positions(next(reader, None), columns)
+    return _project(reader, positions)
+
+def _stream_file(f: TextIO, rows: Iterator[Tuple[str, ...]]) -> Iterator[Tuple[str, ...]]:
+    # Closes the file on exhaustion, or when the caller stops early
+    with f:
+        yield from rows
+
+def iter_csv_columns(path: str, columns: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Stream the CSV at `path`, yielding only `columns` as tuples.
+    Memory stays flat regardless of file size. Raises FileNotFoundError
+    or RuntimeError (missing columns) immediately, before any row is read.
+    Breaking out of the loop (or calling .close()) closes the file.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"CSV file not found:{path}")
+    f = open_csv(path)
+    try:
+        rows = iter_columns(f, columns)
+    except Exception:
+        f.close()
+        raise
+    return _stream_file(f, rows)
+
+def build_index(rows: Iterable[Tuple[str, str]], convert: Callable[[str], Any]) -> Dict[str, Any]:
+    """
+    Build an agent → value index from (agent, value) rows, e.g. from
+    `iter_csv_columns` or a streamed Metabase response, converting each
+    value with `convert`. The first row per agent wins, as the old
+    linear scan did.
+    """
+    index: Dict[str, Any] = {}
+    for agent, value in rows:
+        if agent not in index:
+            index[agent] = convert(value)
+    return index
+
+def index_csv(path: str, columns: Sequence[str], convert: Callable[[str], Any]) -> Dict[str, Any]:
+    """
+    Parse the CSV at `path` once into an index of its first column →
+    `convert`(second column). Only those two columns are read.
+    Raises RuntimeError if required columns are missing.
+    """
+    return build_index(iter_csv_columns(path, columns), convert)
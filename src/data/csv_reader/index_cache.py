@@ -0,0 +1,129 @@
+# src/data/csv_reader/index_cache.py
+
+import os, json, hashlib, threading
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from src.core.instrumentation import count
+
+# Where parsed indexes live, and how large the cache may grow
+# (overridable through METRICS_CACHE_DIR / METRICS_CACHE_MAX_BYTES)
+DEFAULT_CACHE_DIR = os.path.join("raw-data", "cache")
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump whenever the shape of a cached index changes
+CACHE_VERSION = 2
+
+_MANIFEST = "manifest.json"
+_lock = threading.Lock()
+
+
+def _file_digest(path: str) -> str:
+    """SHA-256 of the file contents, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_manifest(cache_dir: str) -> Dict[str, str]:
+    try:
+        with open(os.path.join(cache_dir, _MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _write_json(path: str, data: Any) -> None:
+    """Write atomically so a crash never leaves a half-written entry."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+def _evict(cache_dir: str, manifest: Dict[str, str], max_bytes: int) -> None:
+    """Drop least-recently-used entries until the cache fits in `max_bytes`."""
+    entries: List[Tuple[float, int, str]] = []
+    for name in os.listdir(cache_dir):
+        if name == _MANIFEST or not name.endswith(".json"):
+            continue
+        try:
+            st = os.stat(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            continue  # evicted concurrently by another process
+        entries.append((st.st_mtime, st.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+
+    # Forget file identities whose entry is gone
+    live = set(os.listdir(cache_dir))
+    for identity in [i for i, entry in manifest.items() if entry not in live]:
+        del manifest[identity]
+
+def cached_index(
+        kind: str,
+        path: str,
+        build: Callable[[str], Any],
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None) -> Any:
+    """
+    Return `build(path)`, served from the on-disk cache when the file is unchanged.
+
+    Files are identified by path, size and mtime; an unseen identity is
+    hashed, so a moved or re-exported file with identical contents still
+    hits. Each hit refreshes the entry's mtime, which drives LRU eviction
+    once the cache exceeds `max_bytes`.
+
+    Args:
+        kind: Which index this is (e.g. "talk_time"); part of the key
+        path: Path to the source CSV
+        build: Parses `path` into a JSON-serialisable index
+    """
+    # Read settings at call time so a late load_dotenv() still applies
+    if cache_dir is None:
+        cache_dir = os.getenv("METRICS_CACHE_DIR") or DEFAULT_CACHE_DIR
+    if max_bytes is None:
+        max_bytes = int(os.getenv("METRICS_CACHE_MAX_BYTES") or DEFAULT_CACHE_MAX_BYTES)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    st = os.stat(path)
+    identity = f"{CACHE_VERSION}|{kind}|{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+
+    # 1) Resolve file identity → cache entry, hashing only on a miss
+    with _lock:
+        manifest = _load_manifest(cache_dir)
+        entry = manifest.get(identity)
+    if entry is None:
+        entry = f"{CACHE_VERSION}-{kind}-{_file_digest(path)}.json"
+    entry_path = os.path.join(cache_dir, entry)
+
+    # 2) Hit: touch for LRU and return
+    try:
+        with open(entry_path, encoding="utf-8") as f:
+            index = json.load(f)
+        os.utime(entry_path)
+        if manifest.get(identity) != entry:
+            with _lock:
+                manifest = _load_manifest(cache_dir)
+                manifest[identity] = entry
+                _write_json(os.path.join(cache_dir, _MANIFEST), manifest)
+        count("cache.hits")
+        return index
+    except (FileNotFoundError, ValueError):
+        pass
+
+    # 3) Miss: parse, store, then trim the cache back under its cap
+    count("cache.misses")
+    index = build(path)
+    with _lock:
+        _write_json(entry_path, index)
+        manifest = _load_manifest(cache_dir)
+        manifest[identity] = entry
+        _evict(cache_dir, manifest, max_bytes)
+        _write_json(os.path.join(cache_dir, _MANIFEST), manifest)
+    return index
@@ -1,27 +1,17 @@
 # src/data/csv_reader/leads_reader.py
 
-from typing import List, Dict, Optional
-from .csv_loader import load_csv_dicts
+from typing import Optional
+from .agent_aliases import lookup_agent
+from .csv_loader import index_csv
+
+# Columns the Metabase export must provide: (agent name, metric)
+LEADS_COLUMNS = ["Sales Rep", "Count"]
 
 def extract_leads(path: str, agent: str) -> Optional[int]:
     """
     Read the leads CSV at `path` and return the total count
     for the given agent. Returns 0 if the agent is not present.
+    Names match as in the team join (see `lookup_agent`).
     """
-    # Load all rows as dicts
-    rows: List[Dict[str,str]] = load_csv_dicts(path)
-
-    # Schema validation
-    REQUIRED_COLUMNS = ["Sales Rep", "Count"]
-    missing = [c for c in REQUIRED_COLUMNS if not rows or c not in rows[0]]
-    if missing:
-        raise RuntimeError(f"Missing expected columns: {missing}")
-    
-    # Search for exact match on 'Sales Rep'
-    for row in rows:
-        if row.get("Sales Rep") == agent:
-            # Convert the count string to int
-            return int(row["Count"])
-    
     # Agent not found → zero leads/sales
-    return 0
\ No newline at end of file
+    return lookup_agent(index_csv(path, LEADS_COLUMNS, int), agent, 0)
@@ -1,27 +1,17 @@
 # src/data/csv_reader/talk_time_reader.py
 
-from typing import List, Dict
-from .csv_loader import load_csv_dicts
+from .agent_aliases import lookup_agent
+from .csv_loader import index_csv
+
+# Columns the Metabase export must provide: (agent name, metric)
+TALK_TIME_COLUMNS = ["User Name", "Sum of Duration in Minutes"]
 
 def extract_talk_time(path: str, agent: str) -> float:
     """
     Return total talk time in minutes for `agent`.
     Raises RuntimeError if required columns are missing.
-    Returns None if the agent is not present in the CSV.
+    Returns 0.0 if the agent is not present in the CSV.
+    Names match as in the team join (see `lookup_agent`).
     """
-    # Load all rows as dicts
-    rows: List[Dict[str,str]] = load_csv_dicts(path)
-
-    # Schema validation: ensure required columns exist
-    REQUIRED_COLUMNS = ["User Name", "Sum of Duration in Minutes"]
-    missing = [c for c in REQUIRED_COLUMNS if not rows or c not in rows[0]]
-    if missing:
-        raise RuntimeError(f"Missing expected columns: {missing}")
-    
-    # Search for exact match on 'User Name'
-    for row in rows:
-        if row.get("User Name") == agent:
-            return float(row["Sum of Duration in Minutes"])
-    
     # Agent not found → no talk time recorded
-    return 0.0
\ No newline at end of file
+    return lookup_agent(index_csv(path, TALK_TIME_COLUMNS, float), agent, 0.0)
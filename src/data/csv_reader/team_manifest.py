@@ -0,0 +1,33 @@
+# src/data/csv_reader/team_manifest.py
+
+import os
+from typing import Dict, List
+from .csv_loader import iter_csv_columns
+
+# Columns the teams manifest must provide, one row per team
+TEAM_MANIFEST_COLUMNS = ["Team Name", "Roster Path", "Spreadsheet ID"]
+
+def load_team_manifest(path: str) -> List[Dict[str, str]]:
+    """
+    Read the teams manifest CSV at `path` and return one dict per team
+    with keys name, roster (path to its team_members.csv) and
+    spreadsheet_id. Relative roster paths are taken relative to the
+    manifest's own folder.
+    Raises RuntimeError on missing columns, blank fields or duplicate teams.
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    teams: List[Dict[str, str]] = []
+    seen = set()
+    for name, roster, spreadsheet_id in iter_csv_columns(path, TEAM_MANIFEST_COLUMNS):
+        name, roster, spreadsheet_id = name.strip(), roster.strip(), spreadsheet_id.strip()
+        if not (name and roster and spreadsheet_id):
+            raise RuntimeError(f"Incomplete manifest row in {path}: {[name, roster, spreadsheet_id]}")
+        if name in seen:
+            raise RuntimeError(f"Duplicate team in {path}: {name}")
+        seen.add(name)
+        teams.append({
+            "name": name,
+            "roster": os.path.join(base_dir, roster),
+            "spreadsheet_id": spreadsheet_id
+        })
+    return teams
@@ -0,0 +1,106 @@
+# src/data/file_manager/archive_index.py
+
+import os
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Tuple
+from src.data.sqlite_store import SQLiteStore, shared_store
+
+# Default location of the index (overridable through ARCHIVE_INDEX_PATH)
+DEFAULT_ARCHIVE_INDEX_PATH = os.path.join("raw-data", "archive_index.sqlite")
+
+
+class ArchiveIndex(SQLiteStore):
+    """
+    SQLite index of the processed-exports archive: the per-agent metrics
+    extracted on each day (every agent in the exports, not just one
+    roster) and the archived file behind each metric. Historical lookups
+    and backfills read it instead of decompressing and re-parsing files.
+    """
+
+    SCHEMA = [
+        """
+            CREATE TABLE IF NOT EXISTS daily_metrics (
+                day TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                talk_time REAL NOT NULL,
+                dials INTEGER NOT NULL,
+                leads INTEGER NOT NULL,
+                PRIMARY KEY (day, agent)
+            )
+        """,
+        "CREATE INDEX IF NOT EXISTS daily_metrics_agent ON daily_metrics (agent, day)",
+        """
+            CREATE TABLE IF NOT EXISTS archived_files (
+                day TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                path TEXT NOT NULL,
+                archived_at TEXT NOT NULL,
+                PRIMARY KEY (day, kind)
+            )
+        """
+    ]
+
+    def record_day(self, day: date, index: Dict[str, Dict[str, Any]], files: Dict[str, str]) -> None:
+        """
+        Store one day's merged metric index (agent → talk_time, dials,
+        leads) and its archived files (kind → path), replacing whatever
+        was indexed for that day before, in one transaction. Agents are
+        stored under their export spelling where the index has one.
+        """
+        key = day.isoformat()
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM daily_metrics WHERE day = ?", (key,))
+            self._conn.executemany(
+                "INSERT INTO daily_metrics (day, agent, talk_time, dials, leads) VALUES (?, ?, ?, ?, ?)",
+                [(key, m.get("agent_name", agent), m["talk_time"], m["dials"], m["leads"]) for agent, m in index.items()]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO archived_files (day, kind, path, archived_at) VALUES (?, ?, ?, ?)",
+                [(key, kind, path, now) for kind, path in files.items()]
+            )
+
+    def days(self, start: date, end: date) -> List[date]:
+        """Indexed days in [start, end], oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT day FROM daily_metrics WHERE day BETWEEN ? AND ? ORDER BY day",
+                (start.isoformat(), end.isoformat())
+            ).fetchall()
+        return [date.fromisoformat(day) for (day,) in rows]
+
+    def metrics_for_day(self, day: date) -> Dict[str, Dict[str, Any]]:
+        """
+        The metric index stored for `day` ({} if not indexed), keyed by
+        export spelling; see `normalize_metric_index`.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT agent, talk_time, dials, leads FROM daily_metrics WHERE day = ?",
+                (day.isoformat(),)
+            ).fetchall()
+        return {agent: {"talk_time": talk_time, "dials": dials, "leads": leads}
+                for agent, talk_time, dials, leads in rows}
+
+    def agent_history(self, agent: str, start: date, end: date) -> List[Tuple[date, float, int, int]]:
+        """(day, talk_time, dials, leads) for `agent` on every indexed day in [start, end]."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, talk_time, dials, leads FROM daily_metrics "
+                "WHERE agent = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (agent, start.isoformat(), end.isoformat())
+            ).fetchall()
+        return [(date.fromisoformat(day), talk_time, dials, leads) for day, talk_time, dials, leads in rows]
+
+    def files_for_day(self, day: date) -> Dict[str, str]:
+        """kind → archived file path for `day`."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, path FROM archived_files WHERE day = ?", (day.isoformat(),)
+            ).fetchall()
+        return dict(rows)
+
+def get_archive_index(path: Optional[str] = None) -> ArchiveIndex:
+    """Return the shared index at `path` (default: ARCHIVE_INDEX_PATH)."""
+    path = path or os.getenv("ARCHIVE_INDEX_PATH") or DEFAULT_ARCHIVE_INDEX_PATH
+    return shared_store(ArchiveIndex, path)
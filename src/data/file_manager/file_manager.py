@@ -1,12 +1,25 @@
 # src/data/file_manager/file_manager.py
 
 
-import os, shutil
+import os, gzip, shutil
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from src.core.services.team_data_service import process_team_data
+from typing import Optional, List, Dict
+from src.core.services.metrics_engine import (
+    MetricIndex, build_metric_index, load_inputs, merge_metric_indexes, resolve_team
+)
+from src.core.services.team_data_service import resolve_teams
+from src.core.instrumentation import stage
+from src.core.team_metrics import TeamMetrics
+from .archive_index import get_archive_index
 
-def _get_single_file(dir_path: str) -> Optional[str]:
+# Default root of the per-day archive: <PROCESSED_DIR>/<YYYY-MM-DD>/
+DEFAULT_PROCESSED_DIR = os.path.join("raw-data", "processed")
+
+def get_processed_dir() -> str:
+    """Archive root, read at call time so a late load_dotenv() still applies."""
+    return os.getenv("PROCESSED_DIR") or DEFAULT_PROCESSED_DIR
+
+def get_single_file(dir_path: str) -> Optional[str]:
     """
     Return the first (and only) CSV filepath in dir_path,
     or None if the directory is empty.
@@ -19,50 +32,129 @@ def _get_single_file(dir_path: str) -> Optional[str]:
         raise RuntimeError(f"Multible CSVs in{dir_path}: {files}")
     return os.path.join(dir_path, files[0])
 
+def _locate_daily_files(
+        dirs: Dict[str, str],
+        required: Dict[str, str],
+        also_missing: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+    """
+    The single CSV of each input directory (kind → dir), reporting
+    every problem at once: FileNotFoundError naming each missing
+    `required` file (kind → label) plus `also_missing`, or RuntimeError
+    if any directory holds several CSVs.
+    """
+    files: Dict[str, Optional[str]] = {}
+    problems: List[str] = []
+    for kind, dir_path in dirs.items():
+        try:
+            files[kind] = get_single_file(dir_path)
+        except Exception as e:
+            problems.append(str(e))
+    missing: List[str] = [label for kind, label in required.items() if files.get(kind, "") is None]
+    missing += also_missing or []
+    if problems:
+        raise RuntimeError("; ".join(problems + ([f"Missing required CSVs: {missing}"] if missing else [])))
+    if missing:
+        raise FileNotFoundError(f"Missing required CSVs: {missing}")
+    return files
+
+def _compress_into(path: str, archived_dir: str) -> str:
+    """Gzip `path` into `archived_dir` as <name>.gz, then delete the original."""
+    target = os.path.join(archived_dir, os.path.basename(path) + ".gz")
+    tmp = target + ".tmp"
+    with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.replace(tmp, target)
+    os.remove(path)
+    return target
+
+def _archive_daily_files(files: Dict[str, Optional[str]], run_date: datetime, index: MetricIndex) -> None:
+    """
+    Compress the processed input files (kind → path) into
+    <processed>/<YYYY-MM-DD>/ and index the day's metrics, so history
+    never needs the files parsed again.
+    """
+    archived_dir = os.path.join(get_processed_dir(), run_date.strftime("%Y-%m-%d"))
+    os.makedirs(archived_dir, exist_ok=True)       # ← ensure the folder exists
+    with stage("archive_files"):
+        archived = {kind: _compress_into(path, archived_dir) for kind, path in files.items() if path}
+        get_archive_index().record_day(run_date.date(), index, archived)
+
 def process_daily_files(
         leads_dir: str,
         talk_time_dir: str,
         dials_made_dir: str,
-        team_members_dir: str
-) -> List[Dict[str, Any]]:
+        team_members_dir: str,
+        run_date: Optional[datetime] = None
+) -> TeamMetrics:
     """
-    Finds the single CSV in each input directory, processes
-    all team members, archives the files, and returns the results.
+    Finds the single CSV in each input directory, validates every
+    header and then parses all four files concurrently (see
+    `load_inputs`), processes all team members, archives the files
+    (gzipped, with their metrics indexed per agent), and returns the
+    results. Problems with several files are reported together.
+    `run_date` (default: now) names the archive folder and is
+    stamped on every record.
     """
-    # 1. Locate files
-    leads_file: Optional[str] = _get_single_file(leads_dir)
-    talk_time_file: Optional[str] = _get_single_file(talk_time_dir)
-    dials_made_file: Optional[str] = _get_single_file(dials_made_dir)
-    team_members_file: Optional[str] = _get_single_file(team_members_dir)
-
-    # 2. Ensure all files are present
-    missing:List[str] = []
-    if not talk_time_file: missing.append("talk time")
-    if not dials_made_file: missing.append("dials-made")
-    if not team_members_file: missing.append("team members")
-    if missing:
-        raise FileNotFoundError(f"Missing required CSVs: {missing}")
-
-    assert team_members_file and talk_time_file and dials_made_file
-    # 3. Process team data
-    result: List[Dict[str, Any]] = process_team_data(
-        team_members_file,
-        talk_time_file,
-        dials_made_file,
-        leads_file
+    # 1. Locate files, all of them present
+    files = _locate_daily_files(
+        {"team_members": team_members_dir, "talk_time": talk_time_dir, "dials": dials_made_dir, "leads": leads_dir},
+        {"talk_time": "talk time", "dials": "dials-made", "team_members": "team members"}
     )
+    return process_input_files(files, run_date)
+
+def process_input_files(files: Dict[str, Optional[str]], run_date: Optional[datetime] = None) -> TeamMetrics:
+    """
+    `process_daily_files` for files already located: kind
+    ("team_members", "talk_time", "dials", optional "leads") → path.
+    Only these files are read and archived, so a caller that vetted
+    them (e.g. the folder watcher) gets exactly what it checked.
+    """
+    run_date = run_date or datetime.now()
+
+    # 2. Check every header, then parse the four files side by side
+    loaded = load_inputs(files)
+
+    # 3. Process team data (the merged index is kept for the archive)
+    index = merge_metric_indexes(loaded["talk_time"], loaded["dials"], loaded.get("leads", {}))
+    with stage("join"):
+        result: TeamMetrics = resolve_team(loaded["team_members"], index)
 
     # 4. Archive processed files
-    today: str = datetime.now().strftime("%Y-%m-%d")
-    archived_dir = os.path.join("raw-data", "processed", today)
-    os.makedirs(archived_dir, exist_ok=True)       # ← ensure the folder exists
-    for path in (talk_time_file, leads_file, dials_made_file):
-        if not path: continue
-        shutil.move(path, archived_dir)
-    
-        # --- Inject today's date in DD/MM/YYYY format ---
-    formatted_today = datetime.now().strftime("%d/%m/%Y")  # Day/Month/Year format[3]
-    for rec in result:
-        rec["date"] = formatted_today
-
-    return result
\ No newline at end of file
+    _archive_daily_files({kind: path for kind, path in files.items() if kind != "team_members"},
+                         run_date, index)
+
+    # --- Inject the run date in DD/MM/YYYY format ---
+    formatted_today = run_date.strftime("%d/%m/%Y")  # Day/Month/Year format[3]
+    result.set_date(formatted_today)
+
+    return result
+
+def process_daily_files_for_teams(
+        leads_dir: str,
+        talk_time_dir: str,
+        dials_made_dir: str,
+        teams: List[Dict[str, str]],
+        run_date: Optional[datetime] = None
+) -> Dict[str, TeamMetrics]:
+    """
+    `process_daily_files` for every team of a manifest (see
+    `load_team_manifest`): the shared exports are parsed once, joined
+    against each roster, then archived. Returns team name → table.
+    """
+    run_date = run_date or datetime.now()
+
+    files = _locate_daily_files(
+        {"talk_time": talk_time_dir, "dials": dials_made_dir, "leads": leads_dir},
+        {"talk_time": "talk time", "dials": "dials-made"},
+        [f"team members ({team['name']})" for team in teams if not os.path.isfile(team["roster"])]
+    )
+
+    index = build_metric_index(files["talk_time"], files["dials"], files["leads"])  # type: ignore[arg-type]
+    tables = resolve_teams(teams, index)
+
+    _archive_daily_files(files, run_date, index)
+
+    formatted_today = run_date.strftime("%d/%m/%Y")
+    for table in tables.values():
+        table.set_date(formatted_today)
+    return tables
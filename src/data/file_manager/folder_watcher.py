@@ -0,0 +1,137 @@
+# src/data/file_manager/folder_watcher.py
+
+import os, time, threading
+from typing import Dict, Optional, Set, Tuple
+from .file_manager import get_single_file
+
+# Optional: OS file notifications (inotify, FSEvents, ...). Without it
+# the watcher polls the folders instead.
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# (path, size, mtime_ns) of the single CSV in a folder
+FileSignature = Tuple[str, int, int]
+
+
+class _ChangeHandler(FileSystemEventHandler): # type:ignore
+    def __init__(self, changed: threading.Event):
+        super().__init__()
+        self.changed = changed
+
+    def on_any_event(self, event) -> None:
+        self.changed.set()
+
+class FolderWatcher:
+    """
+    Watch input folders for their single CSV and report which files have
+    settled, i.e. kept the same size and mtime for `settle_seconds`, so
+    an export still being written is never picked up half-way.
+
+    Uses watchdog notifications when installed (and `use_notifications`),
+    otherwise polls every `poll_interval` seconds.
+    """
+
+    def __init__(
+            self,
+            folders: Dict[str, str],
+            settle_seconds: float = 5.0,
+            poll_interval: float = 2.0,
+            use_notifications: bool = True):
+        self.folders = folders
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self._changed = threading.Event()
+        # key → (signature, monotonic time it was first seen unchanged)
+        self._seen: Dict[str, Tuple[FileSignature, float]] = {}
+        self._observer = None
+        if use_notifications and Observer is not None:
+            self._observer = Observer()
+            handler = _ChangeHandler(self._changed)
+            for folder in set(folders.values()):
+                self._observer.schedule(handler, folder, recursive=False)
+            self._observer.start()
+
+    @property
+    def mode(self) -> str:
+        return "notifications" if self._observer else "polling"
+
+    def _signature(self, folder: str) -> Optional[FileSignature]:
+        path = get_single_file(folder)
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None  # moved away between listing and stat
+        return path, st.st_size, st.st_mtime_ns
+
+    def poll(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Look at every folder once.
+
+        Returns:
+            (settled, problems) — key → path of each settled CSV, and
+            key → error for folders that cannot be used as they are
+            (e.g. more than one CSV)
+        """
+        now = time.monotonic()
+        settled: Dict[str, str] = {}
+        problems: Dict[str, str] = {}
+        for key, folder in self.folders.items():
+            try:
+                signature = self._signature(folder)
+            except (OSError, RuntimeError) as e:
+                problems[key] = str(e)
+                signature = None
+            if signature is None:
+                self._seen.pop(key, None)
+                continue
+            previous = self._seen.get(key)
+            if previous is None or previous[0] != signature:
+                self._seen[key] = (signature, now)
+            elif now - previous[1] >= self.settle_seconds:
+                settled[key] = signature[0]
+        return settled, problems
+
+    def present(self) -> Set[str]:
+        """Keys whose folder currently holds a CSV, settled or not."""
+        return set(self._seen)
+
+    def unchanged(self, settled: Dict[str, str]) -> bool:
+        """
+        Whether every file in `settled` (as returned by `poll`) still has
+        the signature it settled with; re-checked right before use, so a
+        file replaced since the poll is never read.
+        """
+        for key, path in settled.items():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return False
+            if key not in self._seen or self._seen[key][0] != (path, st.st_size, st.st_mtime_ns):
+                return False
+        return True
+
+    def signature(self, keys) -> Tuple[FileSignature, ...]:
+        """Current signatures of `keys`, to tell one set of files from the next."""
+        return tuple(self._seen[key][0] for key in sorted(keys) if key in self._seen)
+
+    def wait(self) -> None:
+        """
+        Sleep until the next poll is due: a notification, or at most one
+        poll interval (files that are still settling need a re-check).
+        """
+        if self._observer:
+            self._changed.wait(self.poll_interval)
+            self._changed.clear()
+        else:
+            time.sleep(self.poll_interval)
+
+    def stop(self) -> None:
+        if self._observer:
+            self._observer.stop()
+            self._observer.join()
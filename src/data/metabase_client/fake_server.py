@@ -0,0 +1,129 @@
+# src/data/metabase_client/fake_server.py
+
+import json, re, secrets, argparse, threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Optional
+
+# Bytes written per chunk, so clients really exercise streaming
+CHUNK_SIZE = 4096
+
+
+class FakeMetabaseServer:
+    """
+    Local stand-in for the parts of the Metabase API the client uses:
+    POST /api/session and POST /api/card/<id>/query/csv.
+    Card results are served from CSV files with chunked transfer encoding.
+
+    Usage:
+        with FakeMetabaseServer({101: "talk.csv", 102: "dials.csv"}) as server:
+            client = MetabaseClient(server.url, api_key=server.api_key)
+    """
+
+    def __init__(
+            self,
+            cards: Dict[int, str],
+            host: str = "127.0.0.1",
+            port: int = 0,
+            username: str = "user@example.com",
+            password: str = "password"):
+        self.cards = cards
+        self.username = username
+        self.password = password
+        self.api_key = secrets.token_hex(8)
+        self.sessions = set()
+        self.requests = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, body: object) -> None:
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _authorized(self) -> bool:
+                return (self.headers.get("x-api-key") == server.api_key
+                        or self.headers.get("X-Metabase-Session") in server.sessions)
+
+            def do_POST(self):
+                server.requests += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+
+                if self.path == "/api/session":
+                    creds = json.loads(body or b"{}")
+                    if creds.get("username") != server.username or creds.get("password") != server.password:
+                        return self._send_json(401, {"errors": {"password": "did not match stored password"}})
+                    token = secrets.token_hex(16)
+                    server.sessions.add(token)
+                    return self._send_json(200, {"id": token})
+
+                match = re.fullmatch(r"/api/card/(\d+)/query/csv", self.path)
+                if not match:
+                    return self._send_json(404, {"message": "Not found."})
+                if not self._authorized():
+                    return self._send_json(401, {"message": "Unauthenticated"})
+                card_path = server.cards.get(int(match.group(1)))
+                if card_path is None:
+                    return self._send_json(404, {"message": "Not found."})
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                with open(card_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                        self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+        return Handler
+
+    def start(self) -> "FakeMetabaseServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeMetabaseServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve CSV files as Metabase card results.")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--card", action="append", default=[], metavar="ID=PATH",
+                        help="serve PATH as the CSV result of card ID (repeatable)")
+    args = parser.parse_args()
+
+    cards = {int(card_id): path for card_id, path in (c.split("=", 1) for c in args.card)}
+    server = FakeMetabaseServer(cards, port=args.port)
+    print(f"Fake Metabase on {server.url} (x-api-key: {server.api_key})")
+    server.serve_forever()
+
+if __name__ == '__main__':
+    main()
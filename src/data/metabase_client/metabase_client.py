@@ -0,0 +1,113 @@
+# src/data/metabase_client/metabase_client.py
+
+import io, os, threading, requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+from src.core.services.metrics_engine import (
+    MetricIndex, KeyedValues, METRIC_READERS, key_by_normalized_name, merge_metric_indexes
+)
+from src.data.csv_reader.csv_loader import iter_columns, build_index
+
+
+class MetabaseClient:
+    """
+    Minimal Metabase API client for pulling saved-question (card) results.
+    Authenticates with an API key, or with username/password on first use.
+    One keep-alive session is shared by all requests.
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            api_key: Optional[str] = None,
+            username: Optional[str] = None,
+            password: Optional[str] = None,
+            timeout: float = 120):
+        if not api_key and not (username and password):
+            raise RuntimeError("Metabase needs either an API key or a username and password")
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.session = requests.Session()
+        if api_key:
+            self.session.headers["x-api-key"] = api_key
+        self._lock = threading.Lock()
+
+    def _ensure_session(self) -> None:
+        """Log in once with username/password when no API key was given."""
+        with self._lock:
+            if "x-api-key" in self.session.headers or "X-Metabase-Session" in self.session.headers:
+                return
+            response = self.session.post(
+                f"{self.base_url}/api/session",
+                json={"username": self.username, "password": self.password},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            self.session.headers["X-Metabase-Session"] = response.json()["id"]
+
+    def stream_card_csv(self, card_id: int) -> Iterator[str]:
+        """
+        Run card `card_id` and stream its CSV export line by line.
+        The body is decoded as it arrives and never held in memory whole.
+        """
+        self._ensure_session()
+        response = self.session.post(
+            f"{self.base_url}/api/card/{card_id}/query/csv",
+            stream=True,
+            timeout=self.timeout
+        )
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # undo gzip transfer encoding
+            yield from io.TextIOWrapper(response.raw, encoding="utf-8", newline="")
+
+def metabase_client_from_env() -> MetabaseClient:
+    """Build a client from METABASE_URL and METABASE_API_KEY (or METABASE_USERNAME/PASSWORD)."""
+    base_url = os.getenv("METABASE_URL")
+    if not base_url:
+        raise RuntimeError("METABASE_URL is not set")
+    return MetabaseClient(
+        base_url,
+        api_key=os.getenv("METABASE_API_KEY"),
+        username=os.getenv("METABASE_USERNAME"),
+        password=os.getenv("METABASE_PASSWORD")
+    )
+
+def card_ids_from_env() -> Dict[str, int]:
+    """
+    Read the card ID of each metric from METABASE_TALK_TIME_CARD_ID,
+    METABASE_DIALS_CARD_ID and (optional) METABASE_LEADS_CARD_ID.
+    """
+    card_ids: Dict[str, int] = {}
+    for kind in METRIC_READERS:
+        value = os.getenv(f"METABASE_{kind.upper()}_CARD_ID")
+        if value:
+            card_ids[kind] = int(value)
+    missing: List[str] = [k for k in ("talk_time", "dials") if k not in card_ids]
+    if missing:
+        raise RuntimeError(f"Missing Metabase card IDs: {missing}")
+    return card_ids
+
+def _fetch_metric(client: MetabaseClient, kind: str, card_id: int) -> KeyedValues:
+    # Each card returns the same columns as the matching CSV export
+    columns, convert = METRIC_READERS[kind]
+    # Header is validated on the first line, then rows are indexed as they stream in
+    return key_by_normalized_name(build_index(iter_columns(client.stream_card_csv(card_id), columns), convert))
+
+def fetch_metric_index(client: MetabaseClient, card_ids: Dict[str, int]) -> MetricIndex:
+    """
+    Fetch every metric card concurrently and merge the results into the
+    same agent-keyed index the CSV readers produce.
+
+    Args:
+        client: Authenticated Metabase client
+        card_ids: Metric kind ("talk_time", "dials", optional "leads") → card ID
+    """
+    with ThreadPoolExecutor(max_workers=len(card_ids)) as pool:
+        futures = {kind: pool.submit(_fetch_metric, client, kind, card_id) for kind, card_id in card_ids.items()}
+        indexes: Dict[str, KeyedValues] = {kind: future.result() for kind, future in futures.items()}
+
+    # No leads card → every agent defaults to 0 leads
+    return merge_metric_indexes(indexes["talk_time"], indexes["dials"], indexes.get("leads", {}))
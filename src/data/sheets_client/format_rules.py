@@ -0,0 +1,59 @@
+# src/data/sheets_client/format_rules.py
+
+from typing import Dict, Any, List
+
+# Colours shared with the per-cell formatting in sheets_client
+GREEN = {'red': 0.416, 'green': 0.659, 'blue': 0.310}  # #6aa84f
+RED = {'red': 0.882, 'green': 0.016, 'blue': 0.016}    # #e10404
+
+# Column indexes (0-based) of the Attendance (B) and Leads (C) cells
+ATTENDANCE_COL = 1
+LEADS_COL = 2
+
+# (column, condition, colour) of each rule; rows below the header only
+FORMAT_RULES = [
+    (ATTENDANCE_COL, {"type": "CUSTOM_FORMULA",
+                      "values": [{"userEnteredValue": '=OR($B2="Office",$B2="Home")'}]}, GREEN),
+    (ATTENDANCE_COL, {"type": "TEXT_EQ", "values": [{"userEnteredValue": "UPL"}]}, RED),
+    (LEADS_COL, {"type": "NUMBER_GREATER", "values": [{"userEnteredValue": "0"}]}, GREEN)
+]
+
+
+def _rule_key(column: int, condition: Dict[str, Any]) -> tuple:
+    """What identifies a rule, ignoring row extents and colour rounding the API may apply."""
+    values = tuple(v.get("userEnteredValue") for v in condition.get("values", []))
+    return column, condition.get("type"), values
+
+def missing_rule_requests(sheet_id: int, conditional_formats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    addConditionalFormatRule requests for the rules of `FORMAT_RULES`
+    not yet among a tab's `conditional_formats` (as returned in the
+    spreadsheet metadata). Empty once the tab is fully set up.
+    """
+    present = set()
+    for rule in conditional_formats:
+        condition = rule.get("booleanRule", {}).get("condition", {})
+        for grid in rule.get("ranges", []):
+            present.add(_rule_key(grid.get("startColumnIndex", 0), condition))
+
+    return [
+        {
+            "addConditionalFormatRule": {
+                "index": 0,
+                "rule": {
+                    "ranges": [{
+                        "sheetId": sheet_id,
+                        "startRowIndex": 1,
+                        "startColumnIndex": column,
+                        "endColumnIndex": column + 1
+                    }],
+                    "booleanRule": {
+                        "condition": condition,
+                        "format": {"backgroundColor": color}
+                    }
+                }
+            }
+        }
+        for column, condition, color in FORMAT_RULES
+        if _rule_key(column, condition) not in present
+    ]
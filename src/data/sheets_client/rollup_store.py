@@ -0,0 +1,125 @@
+# src/data/sheets_client/rollup_store.py
+
+import os
+from datetime import datetime, date, timedelta
+from typing import Dict, Any, List, Optional
+from src.data.sqlite_store import SQLiteStore, shared_store
+from src.core.team_metrics import TeamMetrics
+
+# Default location of the store (overridable through ROLLUP_STORE_PATH)
+DEFAULT_ROLLUP_STORE_PATH = os.path.join("raw-data", "rollups.sqlite")
+
+
+def _periods(day: date) -> List[tuple]:
+    """(period, key, first day) of the ISO week and the month containing `day`."""
+    iso = day.isocalendar()
+    return [
+        ("week", f"{iso[0]}-W{iso[1]:02d}", day - timedelta(days=day.weekday())),
+        ("month", day.strftime("%Y-%m"), day.replace(day=1))
+    ]
+
+class RollupStore(SQLiteStore):
+    """
+    Weekly and monthly per-agent totals of everything uploaded, kept
+    locally and updated incrementally as rows are written, so the
+    summary tab never has to be rebuilt by reading the agent tabs.
+
+    Each uploaded day is also kept, so writing the same (agent, date)
+    again replaces its contribution instead of counting it twice.
+    """
+
+    SCHEMA = [
+        """
+            CREATE TABLE IF NOT EXISTS daily (
+                spreadsheet_id TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                day TEXT NOT NULL,
+                talk_time REAL NOT NULL,
+                dials INTEGER NOT NULL,
+                leads INTEGER NOT NULL,
+                present INTEGER NOT NULL,
+                PRIMARY KEY (spreadsheet_id, agent, day)
+            )
+        """,
+        """
+            CREATE TABLE IF NOT EXISTS rollups (
+                spreadsheet_id TEXT NOT NULL,
+                period TEXT NOT NULL,
+                period_key TEXT NOT NULL,
+                period_start TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                days INTEGER NOT NULL,
+                present_days INTEGER NOT NULL,
+                talk_time REAL NOT NULL,
+                dials INTEGER NOT NULL,
+                leads INTEGER NOT NULL,
+                PRIMARY KEY (spreadsheet_id, period, period_key, agent)
+            )
+        """,
+        """
+            CREATE TABLE IF NOT EXISTS pushed (
+                spreadsheet_id TEXT PRIMARY KEY,
+                rows INTEGER NOT NULL
+            )
+        """
+    ]
+
+    def record(self, spreadsheet_id: str, team: TeamMetrics) -> None:
+        """Add the rows of `team` (dated DD/MM/YYYY) to the rollups, in one transaction."""
+        rows = zip(team.agent_name.tolist(), team.date.tolist(), team.talk_time.tolist(),
+                   team.dials.tolist(), team.leads.tolist(), team.present().tolist())
+        with self._lock, self._conn:
+            for agent, date_str, talk_time, dials, leads, present in rows:
+                day = datetime.strptime(date_str, "%d/%m/%Y").date()
+                old = self._conn.execute(
+                    "SELECT talk_time, dials, leads, present FROM daily WHERE spreadsheet_id = ? AND agent = ? AND day = ?",
+                    (spreadsheet_id, agent, day.isoformat())
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO daily VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (spreadsheet_id, agent, day.isoformat(), talk_time, dials, leads, int(present))
+                )
+                # Apply only the difference to what this day contributed before
+                delta = (
+                    0 if old else 1,
+                    int(present) - (old[3] if old else 0),
+                    talk_time - (old[0] if old else 0.0),
+                    dials - (old[1] if old else 0),
+                    leads - (old[2] if old else 0)
+                )
+                for period, key, start in _periods(day):
+                    self._conn.execute("""
+                        INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (spreadsheet_id, period, period_key, agent) DO UPDATE SET
+                            days = days + excluded.days,
+                            present_days = present_days + excluded.present_days,
+                            talk_time = talk_time + excluded.talk_time,
+                            dials = dials + excluded.dials,
+                            leads = leads + excluded.leads
+                    """, (spreadsheet_id, period, key, start.isoformat(), agent, *delta))
+
+    def summary(self, spreadsheet_id: str) -> List[Dict[str, Any]]:
+        """Every rollup of `spreadsheet_id`: weeks then months, newest first, agents A–Z."""
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT period, period_key, period_start, agent, days, present_days, talk_time, dials, leads
+                FROM rollups WHERE spreadsheet_id = ?
+                ORDER BY period = 'month', period_key DESC, agent
+            """, (spreadsheet_id,)).fetchall()
+        fields = ("period", "period_key", "period_start", "agent", "days", "present_days", "talk_time", "dials", "leads")
+        return [dict(zip(fields, row)) for row in rows]
+
+    def pushed_rows(self, spreadsheet_id: str) -> int:
+        """How many rows the last summary push wrote (to blank out leftovers)."""
+        with self._lock:
+            row = self._conn.execute("SELECT rows FROM pushed WHERE spreadsheet_id = ?", (spreadsheet_id,)).fetchone()
+        return row[0] if row else 0
+
+    def set_pushed_rows(self, spreadsheet_id: str, rows: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO pushed VALUES (?, ?)", (spreadsheet_id, rows))
+
+def get_rollup_store(path: Optional[str] = None) -> RollupStore:
+    """Return the shared store at `path` (default: ROLLUP_STORE_PATH)."""
+    path = path or os.getenv("ROLLUP_STORE_PATH") or DEFAULT_ROLLUP_STORE_PATH
+    return shared_store(RollupStore, path)
@@ -1,77 +1,573 @@
 # src/data/sheets_client/sheets_client.py
 
-import os, gspread
+import os, threading, gspread
+from datetime import datetime
+from gspread.exceptions import APIError
 from google.oauth2.service_account import Credentials
-from typing import Dict, Any
-from gspread.utils import ValueInputOption
+from typing import Dict, Any, List, Optional, Set
+from gspread.utils import ValueInputOption, absolute_range_name, a1_range_to_grid_range
+from src.core.instrumentation import api_call, stage, count
+from src.core.team_metrics import TeamMetrics, minutes_to_hms
+from .upload_journal import UploadJournal
+from .rollup_store import RollupStore
+from .format_rules import GREEN, RED, ATTENDANCE_COL, LEADS_COL, missing_rule_requests
 
 
-# 1) Load configuration from environment
-SERVICE_ACCOUNT_PATH = os.environ['GOOGLE_SHEETS_SERVICE_ACCOUNT_PATH']
-SPREADSHEET_ID = os.environ['GOOGLE_SHEETS_TEMPLATE_ID']
+# Define the OAuth scopes for Sheets API
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
+# One authorized gspread client per process. It wraps a single
+# AuthorizedSession, so every spreadsheet shares the same keep-alive
+# connection pool and the token is refreshed transparently on expiry.
+_gc: Optional[gspread.Client] = None
+_gc_lock = threading.Lock()
 
-# 2) Define the OAuth scopes for Sheets API
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+# The only parts of the spreadsheet metadata the session cache needs
+TAB_METADATA_FIELDS = "sheets(properties(sheetId,title,gridProperties(rowCount)),conditionalFormats)"
+
+# Tab that new agent tabs are copied from (overridable through AGENT_TAB_TEMPLATE)
+DEFAULT_AGENT_TAB_TEMPLATE = "Template"
+
+# Pooled spreadsheet clients, keyed by spreadsheet ID
+_clients: Dict[str, "SheetsClient"] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_gspread_client() -> gspread.Client:
+    """Authenticate with the service account on first use and reuse it afterwards."""
+    global _gc
+    with _gc_lock:
+        if _gc is None:
+            service_account_path = os.environ.get('GOOGLE_SHEETS_SERVICE_ACCOUNT_PATH')
+            if not service_account_path:
+                raise RuntimeError("GOOGLE_SHEETS_SERVICE_ACCOUNT_PATH is not set")
+            creds = Credentials.from_service_account_file( # type:ignore
+                service_account_path,
+                scopes=SCOPES
+            )
+            _gc = gspread.authorize(creds)
+        return _gc
+
+class SheetsClient:
+    """
+    Lazily opened handle on one spreadsheet.
+    Nothing touches the network until `spreadsheet` is first used.
+    Also holds the upload session's caches: the tab list (fetched once)
+    with each tab's sheet ID, grid size and whether it carries the
+    conditional-format rules, and the per-worksheet tail rows.
+    """
+
+    def __init__(self, spreadsheet_id: str, spreadsheet: Optional[gspread.Spreadsheet] = None):
+        """`spreadsheet` pre-supplies an opened spreadsheet (or a stand-in for it)."""
+        self.spreadsheet_id = spreadsheet_id
+        self._spreadsheet: Optional[gspread.Spreadsheet] = spreadsheet
+        self._lock = threading.Lock()
+        # Next free row per worksheet title, so row discovery only
+        # re-reads a tab from there on instead of its whole history
+        self.next_row: Dict[str, int] = {}
+        # Sheet IDs and grid row counts by title, kept current as tabs
+        # are created or grown, so metadata is fetched once per session;
+        # plus each tab's conditional formats, to tell which tabs need
+        # no per-cell colours
+        self._sheet_ids: Optional[Dict[str, int]] = None
+        self.row_counts: Dict[str, int] = {}
+        self.conditional_formats: Dict[str, List[Dict[str, Any]]] = {}
+        self._tabs_lock = threading.RLock()
+
+    @property
+    def spreadsheet(self) -> gspread.Spreadsheet:
+        with self._lock:
+            if self._spreadsheet is None:
+                with api_call("open_by_key"):
+                    self._spreadsheet = _get_gspread_client().open_by_key(self.spreadsheet_id) # type:ignore
+            return self._spreadsheet
+
+    def reset_row_cache(self) -> None:
+        """Forget all tracked tail rows and tabs, e.g. after tabs were renamed or deleted by hand."""
+        self.next_row.clear()
+        with self._tabs_lock:
+            self._sheet_ids = None
+            self.row_counts.clear()
+            self.conditional_formats.clear()
+
+    def sheet_ids(self, refresh: bool = False) -> Dict[str, int]:
+        """Title → sheet ID, from one metadata call per session (or on `refresh`)."""
+        with self._tabs_lock:
+            if self._sheet_ids is None or refresh:
+                with api_call("fetch_sheet_metadata"):
+                    metadata = self.spreadsheet.fetch_sheet_metadata({"fields": TAB_METADATA_FIELDS})
+                sheets = metadata.get("sheets", [])
+                self._sheet_ids = {s["properties"]["title"]: s["properties"]["sheetId"] for s in sheets}
+                self.row_counts = {
+                    s["properties"]["title"]: s["properties"].get("gridProperties", {}).get("rowCount", 0)
+                    for s in sheets
+                }
+                self.conditional_formats = {s["properties"]["title"]: s.get("conditionalFormats", []) for s in sheets}
+            return self._sheet_ids
+
+    def formatted_tabs(self) -> Set[str]:
+        """Tabs whose conditional-format rules colour new rows, so writes can send values only."""
+        with self._tabs_lock:
+            sheet_ids = self.sheet_ids()
+            return {
+                title for title, sheet_id in sheet_ids.items()
+                if not missing_rule_requests(sheet_id, self.conditional_formats.get(title, []))
+            }
+
+    def ensure_tabs(self, titles: List[str], template: Optional[str] = None) -> List[str]:
+        """
+        Preflight `titles` against the cached worksheet list and create
+        every missing tab as a copy of `template` (default:
+        AGENT_TAB_TEMPLATE or "Template") in a single batchUpdate.
+
+        Returns:
+            The titles still missing because the template tab does not exist
+        """
+        with self._tabs_lock:
+            tabs = self.sheet_ids()
+            missing = [t for t in dict.fromkeys(titles) if t not in tabs]
+            if not missing:
+                return []
+            template = template or os.getenv("AGENT_TAB_TEMPLATE") or DEFAULT_AGENT_TAB_TEMPLATE
+            if template not in tabs:
+                return missing
+            source = tabs[template]
+            with api_call("batch_update"):
+                self.spreadsheet.batch_update({"requests": [
+                    {"duplicateSheet": {"sourceSheetId": source, "insertSheetIndex": len(tabs) + k, "newSheetName": title}}
+                    for k, title in enumerate(missing)
+                ]})
+            count("upload.tabs_created", len(missing))
+            # Copies inherit the template's conditional formats, if any
+            self.sheet_ids(refresh=True)
+            return []
 
-# 3) Authenticate once at import time
-_creds = Credentials.from_service_account_file( # type:ignore
-    SERVICE_ACCOUNT_PATH,
-    scopes=SCOPES
-)
-_gc = gspread.authorize(_creds)
+def get_client(spreadsheet_id: Optional[str] = None) -> SheetsClient:
+    """
+    Return the pooled client for `spreadsheet_id`,
+    defaulting to GOOGLE_SHEETS_TEMPLATE_ID.
+    """
+    if spreadsheet_id is None:
+        spreadsheet_id = os.environ.get('GOOGLE_SHEETS_TEMPLATE_ID')
+        if not spreadsheet_id:
+            raise RuntimeError("GOOGLE_SHEETS_TEMPLATE_ID is not set")
+    with _clients_lock:
+        if spreadsheet_id not in _clients:
+            _clients[spreadsheet_id] = SheetsClient(spreadsheet_id)
+        return _clients[spreadsheet_id]
+
+# How many trailing rows per tab the optional read-back check inspects
+VERIFY_TAIL_ROWS = 5
+
+# Day 0 of spreadsheet date serials
+SERIAL_EPOCH = datetime(1899, 12, 30)
 
-# 4) Open the spreadsheet by ID
-_spreadsheet = _gc.open_by_key(SPREADSHEET_ID) # type:ignore
 
+def _row_from_updated_range(updated_range: str) -> int:
+    """Return the last (1-based) row of an A1 range like "'Tab'!A15:F15"."""
+    cells = updated_range.rsplit("!", 1)[-1]
+    return a1_range_to_grid_range(cells)["endRowIndex"]
+
+
+def _date_key(value: Any) -> Any:
+    """
+    Comparable form of a column-A cell read unformatted, or of a
+    DD/MM/YYYY date: the date serial (days since 30/12/1899) where it is
+    a date, the value itself otherwise (text the sheet did not parse).
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return (datetime.strptime(value, "%d/%m/%Y") - SERIAL_EPOCH).days
+    except (TypeError, ValueError):
+        return value
+
+def _attendance_colors(team: TeamMetrics) -> List[Dict[str, float]]:
+    """Per row: green for Office/Home, red for anything else (UPL)."""
+    return [GREEN if present else RED for present in team.present().tolist()]
 
-def update_sheet_for_agent(record: Dict[str, Any]) -> None:
+def update_sheet_for_agent(
+        record: Dict[str, Any],
+        client: Optional[SheetsClient] = None,
+        journal: Optional[UploadJournal] = None,
+        rollups: Optional[RollupStore] = None) -> None:
     """
     1) Locate or create the agent’s worksheet tab.
     2) Format talk_time as HH:MM:SS.
     3) Append a new row.
-    4) Apply background colors to Attendance and Leads cells.
+    4) Apply background colors to Attendance and Leads cells, unless
+       the tab's conditional-format rules already do.
+    Rows already in `journal` are skipped; new ones are recorded there
+    and added to `rollups`.
+    Prefer `update_sheets_for_team` for more than one agent.
     """
+    client = client or get_client()
     agent = record['agent_name']
+    if journal and journal.completed(client.spreadsheet_id, [(agent, record['date'])]):
+        return
+    # Same row layout and formatting as a team upload
+    single = TeamMetrics.from_records([record])
+
+    # 1) Get or create the worksheet for this agent, from the session's tab list
+    if client.ensure_tabs([agent]):
+        raise RuntimeError(_missing_tab_error(agent))
+    sheet_id = client.sheet_ids()[agent]
+
+    # 2) + 3) Append the data row
+    # The append response names the written range, so the new row
+    # comes for free instead of re-reading the whole tab
+    with api_call("values_append"):
+        response = client.spreadsheet.values_append(
+            absolute_range_name(agent, "A:F"),
+            {"valueInputOption": ValueInputOption.user_entered},
+            {"values": single.sheet_values()}
+        )
+    new_row = _row_from_updated_range(response["updates"]["updatedRange"])
+    client.next_row[agent] = new_row + 1
+    client.row_counts[agent] = max(client.row_counts.get(agent, 0), new_row)
+    if journal:
+        journal.record(client.spreadsheet_id, [(agent, record['date'], new_row)])
+    if rollups:
+        rollups.record(client.spreadsheet_id, single)
+    # 4) Attendance (B) and Leads (C) colours in one batchUpdate,
+    #    only for tabs without the conditional-format rules
+    if agent in client.formatted_tabs():
+        return
+    requests = [_color_request(sheet_id, new_row, ATTENDANCE_COL, _attendance_colors(single)[0])]
+    if single.has_leads()[0]:
+        requests.append(_color_request(sheet_id, new_row, LEADS_COL, GREEN))
+    with api_call("batch_update"):
+        client.spreadsheet.batch_update({"requests": requests})
+
+def _missing_tab_error(agent: str) -> str:
+    template = os.getenv("AGENT_TAB_TEMPLATE") or DEFAULT_AGENT_TAB_TEMPLATE
+    return f"Worksheet for agent '{agent}' not found and there is no '{template}' tab to create it from."
+
+def _color_request(sheet_id: int, row: int, col: int, color: Dict[str, float]) -> Dict[str, Any]:
+    """Build a repeatCell request painting the single cell at (row, col), 1-based row."""
+    return {
+        "repeatCell": {
+            "range": {
+                "sheetId": sheet_id,
+                "startRowIndex": row - 1,
+                "endRowIndex": row,
+                "startColumnIndex": col,
+                "endColumnIndex": col + 1
+            },
+            "cell": {"userEnteredFormat": {"backgroundColor": color}},
+            "fields": "userEnteredFormat.backgroundColor"
+        }
+    }
+
+def new_results(team: TeamMetrics) -> List[Dict[str, Any]]:
+    """One not-yet-successful result per row, in table order."""
+    return [
+        {"agent_name": agent, "success": False, "skipped": False, "error": None}
+        for agent in team.agent_name.tolist()
+    ]
+
+def write_team_batch(
+        team: TeamMetrics,
+        results: List[Dict[str, Any]],
+        client: SheetsClient,
+        journal: Optional[UploadJournal] = None,
+        verify: bool = False,
+        rollups: Optional[RollupStore] = None
+) -> None:
+    """
+    Upload every row of `team` in a fixed number of API calls.
+
+    1) Check every agent has a tab against the session's worksheet
+       list, creating missing ones from the template tab in one
+       spreadsheets.batchUpdate.
+    2) Re-check the tail of every tab in one values.batchGet: from
+       the last row this session (or the journal) knows of, so rows
+       added by hand since are found and never overwritten, while the
+       read stays as small as the rows added since. Tabs with no known
+       row have all of column A read once.
+    3) Grow the grids and colour Attendance/Leads cells in one
+       spreadsheets.batchUpdate. Tabs with the conditional-format
+       rules (see `install_format_rules`) need no colouring, so when
+       no grid grows either, this call is skipped.
+    4) Write every row in one values.batchUpdate.
+
+    Rows for the same agent (e.g. several dates) land on
+    consecutive sheet rows, in table order. Per-agent failures (missing
+    tab and no template) are written into `results`; API errors propagate so callers
+    can decide whether to retry.
+
+    With a `journal`, rows it already holds are skipped (success and
+    skipped set) and newly written rows are recorded. With `verify`,
+    the same batchGet also reads the last few column-A cells before
+    the known tail, and any row whose date is among the cells read
+    (the whole column on a tab with no known row) is treated as
+    written. Dates are read unformatted and compared as date
+    serials, so how the spreadsheet's locale displays them does not
+    matter.
+    Newly written (and verified) rows are added to `rollups`, if given.
+    """
+    spreadsheet = client.spreadsheet
+    keys = team.keys()
+
+    # Rows committed by an earlier run need no work at all
+    done = journal.completed(client.spreadsheet_id, keys) if journal else set()
+    for i, key in enumerate(keys):
+        if key in done:
+            results[i].update(success=True, skipped=True)
+    count("upload.journal_skipped", len(done))
+    if all(result["skipped"] for result in results):
+        return
+
+    # 1) Preflight every tab before any write; metadata is cached per session
+    missing = set(client.ensure_tabs([agent for i, (agent, _) in enumerate(keys) if not results[i]["skipped"]]))
+    sheet_ids = client.sheet_ids()
+    formatted = client.formatted_tabs()
+
+    # Agents without a tab fail individually; everyone else proceeds
+    pending: List[int] = []
+    for i, (agent, _) in enumerate(keys):
+        if results[i]["skipped"]:
+            continue
+        if agent not in missing:
+            pending.append(i)
+        else:
+            results[i]["error"] = _missing_tab_error(agent)
+    if not pending:
+        return
+
+    # 2) Next free row per tab, re-checked from the last known row on:
+    #    a hand-added row moves the tail instead of being overwritten.
+    #    Verification rides on the same batchGet by starting a few rows
+    #    earlier.
+    titles: List[str] = list(dict.fromkeys(keys[i][0] for i in pending))
+    known: Dict[str, int] = {t: client.next_row[t] for t in titles if t in client.next_row}
+    if journal:
+        seeds = journal.last_rows(client.spreadsheet_id, [t for t in titles if t not in known])
+        known.update({t: row + 1 for t, row in seeds.items()})
+    count("upload.tail_probes", len(titles) - len(known))
+    starts: Dict[str, int] = {
+        t: max(1, known[t] - VERIFY_TAIL_ROWS) if verify else known[t]
+        for t in titles if t in known
+    }
+    ranges: List[str] = [
+        absolute_range_name(t, f"A{starts[t]}:A") if t in starts else absolute_range_name(t, "A:A")
+        for t in titles
+    ]
+    with api_call("values_batch_get"):
+        response = spreadsheet.values_batch_get(ranges, params={"valueRenderOption": "UNFORMATTED_VALUE"})
+    next_row: Dict[str, int] = {}
+    written: Dict[str, set] = {}
+    for title, value_range in zip(titles, response.get("valueRanges", [])):
+        values = value_range.get("values", [])
+        next_row[title] = starts.get(title, 1) + len(values)
+        if verify:
+            written[title] = {_date_key(row[0]) for row in values if row}
+
+    if verify:
+        already: List[int] = []
+        for i in list(pending):
+            agent, date = keys[i]
+            if _date_key(date) in written.get(agent, ()):
+                results[i].update(success=True, skipped=True)
+                already.append(i)
+                pending.remove(i)
+        count("upload.verify_skipped", len(already))
+        if journal and already:
+            journal.record(client.spreadsheet_id, [(*keys[i], None) for i in already])
+        if rollups and already:
+            # Re-recording a day replaces it, so rows a failed attempt
+            # committed still count once in the totals
+            rollups.record(client.spreadsheet_id, team.take(already))
+        if not pending:
+            client.next_row.update(next_row)
+            return
+
+    # 3) Assign rows and collect value/format payloads; talk time and
+    #    colours are worked out for the whole batch at once
+    batch = team.take(pending)
+    values = batch.sheet_values()
+    colors = _attendance_colors(batch)
+    has_leads = batch.has_leads().tolist()
+    data: List[Dict[str, Any]] = []
+    requests: List[Dict[str, Any]] = []
+    rows: List[int] = []
+    for j, i in enumerate(pending):
+        agent = keys[i][0]
+        row = next_row[agent]
+        next_row[agent] = row + 1
+        rows.append(row)
+        sheet_id = sheet_ids[agent]
+
+        data.append({
+            "range": absolute_range_name(agent, f"A{row}:F{row}"),
+            "values": [values[j]]
+        })
+        if agent in formatted:
+            continue
+        requests.append(_color_request(sheet_id, row, ATTENDANCE_COL, colors[j]))
+        if has_leads[j]:
+            requests.append(_color_request(sheet_id, row, LEADS_COL, GREEN))
+
+    # Unlike append_row, values.batchUpdate cannot write past the grid,
+    # so extend any tab that is full before painting or writing
+    grow: List[Dict[str, Any]] = []
+    grown: Dict[str, int] = {}
+    for title in titles:
+        missing_rows = (next_row[title] - 1) - client.row_counts[title]
+        if missing_rows > 0:
+            grown[title] = next_row[title] - 1
+            grow.append({
+                "appendDimension": {
+                    "sheetId": sheet_ids[title],
+                    "dimension": "ROWS",
+                    "length": missing_rows
+                }
+            })
+
+    # 4) Formatting (and grid growth), then values
+    if grow or requests:
+        with api_call("batch_update"):
+            spreadsheet.batch_update({"requests": grow + requests})
+        client.row_counts.update(grown)
+    with api_call("values_batch_update"):
+        spreadsheet.values_batch_update({
+            "valueInputOption": ValueInputOption.user_entered,
+            "data": data
+        })
+
+    # Rows are committed; advance the session cache past them
+    client.next_row.update(next_row)
+    if journal:
+        journal.record(client.spreadsheet_id, [
+            (*keys[i], row) for i, row in zip(pending, rows)
+        ])
+    if rollups:
+        rollups.record(client.spreadsheet_id, batch)
+    for i in pending:
+        results[i]["success"] = True
+    count("upload.rows_written", len(pending))
+
+def update_sheets_for_team(
+        team: TeamMetrics,
+        client: Optional[SheetsClient] = None,
+        journal: Optional[UploadJournal] = None,
+        verify: bool = False,
+        rollups: Optional[RollupStore] = None
+) -> List[Dict[str, Any]]:
+    """
+    Upload the whole team in one batch (see `write_team_batch`).
+
+    Returns:
+        One result per row, in table order, with keys
+        agent_name, success, skipped (already written) and
+        error (None on success).
+    """
+    results = new_results(team)
+    if not len(team):
+        return results
+
+    try:
+        with stage("upload"):
+            write_team_batch(team, results, client or get_client(), journal, verify, rollups)
+    except Exception as e:
+        # A failed call leaves every not-yet-failed row unwritten
+        for result in results:
+            if result["error"] is None:
+                result["error"] = str(e)
+    return results
+
+# Title of the rollup tab and its columns
+SUMMARY_TAB = "Summary"
+SUMMARY_HEADER = ["Period", "Starting", "Agent", "Days", "Present Days", "Talk Time", "Dials", "Leads"]
+
+def push_summary(
+        rollups: RollupStore,
+        client: Optional[SheetsClient] = None,
+        title: str = SUMMARY_TAB) -> int:
+    """
+    Write the weekly and monthly rollups of `client`'s spreadsheet to
+    the `title` tab in one values.batchUpdate, replacing its contents.
+    The tab is created (or grown) only when that write is rejected.
 
-    # 1) Get or create the worksheet for this agent
+    Returns:
+        Number of summary rows written, header excluded
+    """
+    client = client or get_client()
+    summary = rollups.summary(client.spreadsheet_id)
+    talk_times = minutes_to_hms([r["talk_time"] for r in summary]).tolist()
+    values: List[List[Any]] = [SUMMARY_HEADER] + [
+        [
+            f"{r['period'].title()} {r['period_key']}",
+            datetime.strptime(r["period_start"], "%Y-%m-%d").strftime("%d/%m/%Y"),
+            r["agent"], r["days"], r["present_days"], talk_time, r["dials"], r["leads"]
+        ]
+        for r, talk_time in zip(summary, talk_times)
+    ]
+    # Blank out whatever the previous, longer push left below the table
+    leftover = rollups.pushed_rows(client.spreadsheet_id) - len(values)
+    values.extend([[""] * len(SUMMARY_HEADER)] * max(0, leftover))
+
+    body = {
+        "valueInputOption": ValueInputOption.user_entered,
+        "data": [{"range": absolute_range_name(title, f"A1:H{len(values)}"), "values": values}]
+    }
+    spreadsheet = client.spreadsheet
     try:
-        ws = _spreadsheet.worksheet(agent)
-    except gspread.exceptions.WorksheetNotFound:
-        raise RuntimeError(f"Worksheet for agent '{agent}' not found. Please add a tab named '{agent}'.")
-
-    # 2) Convert talk_time (minutes float) to HH:MM:SS
-    total_seconds: int = round(record['talk_time'] * 60)
-    hours: int = total_seconds // 3600
-    minutes: int = (total_seconds % 3600) // 60
-    seconds: int = total_seconds % 60
-    talk_time_str: str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-    # 3) Append the data row
-    # Capture current number of rows to compute new row index
-    ws.append_row([
-        record['date'],
-        record['attendance'],
-        record['leads'],
-        record['dials'],
-        talk_time_str,
-        record['notes']
-    ], ValueInputOption.user_entered)
-    all_rows = ws.get_all_values()  # Get all rows after appending
-    new_row = len(all_rows) 
-    # 4) Conditional coloring using gspread's `format` method [22]
-    #    Attendance cell (column B)
-    attendance_cell = f"B{new_row}"
-    if record['attendance'] in ("Office", "Home"):
-        color = {'red': 0.416, 'green': 0.659, 'blue': 0.310}
-    else:
-        color = {'red': 0.882, 'green': 0.016, 'blue': 0.016}
-    ws.format(attendance_cell, {'backgroundColor': color})
-
-    #    Leads cell (column C)
-    leads_cell = f"C{new_row}"
-    if record['leads'] > 0:
-        ws.format(leads_cell, {'backgroundColor': {'red': 0.416, 'green': 0.659, 'blue': 0.310}})
-
-# color1 = {'red': 0.416, 'green': 0.659, 'blue': 0.310}  # #6aa84f
-# color2 = {'red': 0.882, 'green': 0.016, 'blue': 0.016}  # #e10404
\ No newline at end of file
+        with api_call("values_batch_update"):
+            spreadsheet.values_batch_update(body)
+    except APIError as e:
+        # 400: the tab is missing or too small; fix that and write again
+        if e.code != 400:
+            raise
+        sheet_ids = client.sheet_ids(refresh=True)
+        if title not in sheet_ids:
+            with api_call("add_worksheet"):
+                spreadsheet.add_worksheet(title, rows=len(values) + 100, cols=len(SUMMARY_HEADER))
+        elif client.row_counts[title] < len(values):
+            with api_call("batch_update"):
+                spreadsheet.batch_update({"requests": [{"appendDimension": {
+                    "sheetId": sheet_ids[title],
+                    "dimension": "ROWS",
+                    "length": len(values) - client.row_counts[title] + 100
+                }}]})
+        else:
+            raise
+        with api_call("values_batch_update"):
+            spreadsheet.values_batch_update(body)
+
+    rollups.set_pushed_rows(client.spreadsheet_id, len(values))
+    return len(summary)
+
+def install_format_rules(
+        titles: List[str],
+        client: Optional[SheetsClient] = None,
+        template: Optional[str] = None) -> int:
+    """
+    Add the conditional-format rules (Office/Home green, UPL red,
+    Leads > 0 green) to every agent tab in `titles` (e.g. a roster)
+    that lacks them, and to the template tab (default:
+    AGENT_TAB_TEMPLATE or "Template") if there is one, so new agent
+    tabs inherit them; all in one spreadsheets.batchUpdate. Other tabs
+    (summary, dashboards, ...) are left alone.
+    Idempotent: rules a tab already has are not added again.
+    Once a tab has them, uploads to it send values only.
+
+    Returns:
+        Number of rules added
+    """
+    client = client or get_client()
+    sheet_ids = client.sheet_ids(refresh=True)
+    unknown = [t for t in titles if t not in sheet_ids]
+    if unknown:
+        raise RuntimeError(f"No such tabs in {client.spreadsheet_id}: {unknown}")
+    template = template or os.getenv("AGENT_TAB_TEMPLATE") or DEFAULT_AGENT_TAB_TEMPLATE
+    titles = list(dict.fromkeys(titles + ([template] if template in sheet_ids else [])))
+
+    requests: List[Dict[str, Any]] = []
+    for title in titles:
+        requests.extend(missing_rule_requests(sheet_ids[title], client.conditional_formats.get(title, [])))
+    if requests:
+        with api_call("batch_update"):
+            client.spreadsheet.batch_update({"requests": requests})
+        client.sheet_ids(refresh=True)
+    return len(requests)
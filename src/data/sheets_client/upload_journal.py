@@ -0,0 +1,80 @@
+# src/data/sheets_client/upload_journal.py
+
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from src.data.sqlite_store import SQLiteStore, shared_store
+
+# Default location of the journal (overridable through UPLOAD_JOURNAL_PATH)
+DEFAULT_JOURNAL_PATH = os.path.join("raw-data", "upload_journal.sqlite")
+
+
+class UploadJournal(SQLiteStore):
+    """
+    Local record of every row committed to a spreadsheet, keyed by
+    (spreadsheet, agent, date). Uploads consult it to skip rows that a
+    previous, interrupted run already wrote, so a re-run only does the
+    remaining work and never appends duplicates.
+    """
+
+    SCHEMA = [
+        """
+            CREATE TABLE IF NOT EXISTS uploads (
+                spreadsheet_id TEXT NOT NULL,
+                agent TEXT NOT NULL,
+                date TEXT NOT NULL,
+                row INTEGER,
+                uploaded_at TEXT NOT NULL,
+                PRIMARY KEY (spreadsheet_id, agent, date)
+            )
+        """
+    ]
+
+    def completed(self, spreadsheet_id: str, keys: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+        """Return the (agent, date) pairs among `keys` already committed."""
+        keys = set(keys)
+        done: Set[Tuple[str, str]] = set()
+        with self._lock:
+            # Primary-key lookups: cost depends on the batch, not the history
+            for agent, date in keys:
+                if self._conn.execute(
+                    "SELECT 1 FROM uploads WHERE spreadsheet_id = ? AND agent = ? AND date = ?",
+                    (spreadsheet_id, agent, date)
+                ).fetchone():
+                    done.add((agent, date))
+        return done
+
+    def record(self, spreadsheet_id: str, entries: List[Tuple[str, str, Optional[int]]]) -> None:
+        """Mark (agent, date, row) entries as committed, in one transaction."""
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO uploads (spreadsheet_id, agent, date, row, uploaded_at) VALUES (?, ?, ?, ?, ?)",
+                [(spreadsheet_id, agent, date, row, now) for agent, date, row in entries]
+            )
+
+    def last_rows(self, spreadsheet_id: str, agents: Iterable[str]) -> Dict[str, int]:
+        """The last sheet row recorded for each of `agents` that has one, to seed row discovery."""
+        rows: Dict[str, int] = {}
+        with self._lock:
+            for agent in set(agents):
+                (row,) = self._conn.execute(
+                    "SELECT MAX(row) FROM uploads WHERE spreadsheet_id = ? AND agent = ?",
+                    (spreadsheet_id, agent)
+                ).fetchone()
+                if row is not None:
+                    rows[agent] = row
+        return rows
+
+    def forget(self, spreadsheet_id: str, agent: str, date: str) -> None:
+        """Drop one entry, e.g. after its row was deleted from the sheet by hand."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM uploads WHERE spreadsheet_id = ? AND agent = ? AND date = ?",
+                (spreadsheet_id, agent, date)
+            )
+
+def get_journal(path: Optional[str] = None) -> UploadJournal:
+    """Return the shared journal at `path` (default: UPLOAD_JOURNAL_PATH)."""
+    path = path or os.getenv("UPLOAD_JOURNAL_PATH") or DEFAULT_JOURNAL_PATH
+    return shared_store(UploadJournal, path)
@@ -0,0 +1,82 @@
+# src/data/sheets_client/upload_queue.py
+
+import queue, threading
+from typing import Dict, Any, List, Optional
+from src.core.instrumentation import count
+from src.core.team_metrics import TeamMetrics
+from .sheets_client import new_results
+from .upload_scheduler import UploadScheduler
+
+# Marks the end of the queue for the worker
+_CLOSED = None
+
+
+class UploadQueue:
+    """
+    Uploads rows in the background while the caller keeps working,
+    e.g. while the CLI prompts for the next agent.
+
+    `put` returns at once. A single worker thread takes everything that
+    queued up while the previous upload was in flight and sends it as
+    one batch through `scheduler` (retries, pacing and tab preflight
+    included), so human input and network time overlap. One worker
+    keeps each tab's rows in order without racing for its next row.
+    """
+
+    def __init__(self, scheduler: Optional[UploadScheduler] = None, max_batch: int = 50):
+        self.scheduler = scheduler or UploadScheduler()
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[TeamMetrics]]" = queue.Queue()
+        self._results: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="upload-queue", daemon=True)
+        self._worker.start()
+
+    def put(self, rows: TeamMetrics) -> None:
+        """Queue `rows` for upload; results come back from `close` in put order."""
+        self._queue.put(rows.copy())
+
+    @property
+    def uploaded(self) -> int:
+        """Rows finished so far, successfully or not."""
+        with self._lock:
+            return len(self._results)
+
+    def _next_batch(self) -> List[TeamMetrics]:
+        """Block for one put, then take whatever else is already waiting (up to `max_batch` rows)."""
+        batch = [self._queue.get()]
+        rows = len(batch[0]) if batch[0] is not _CLOSED else 0
+        while batch[-1] is not _CLOSED and rows < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            if batch[-1] is not _CLOSED:
+                rows += len(batch[-1])
+        return batch
+
+    def _run(self) -> None:
+        closed = False
+        while not closed:
+            batch = self._next_batch()
+            closed = batch[-1] is _CLOSED
+            tables = [t for t in batch if t is not _CLOSED]
+            if not tables:
+                continue
+            team = TeamMetrics.concat(tables)
+            count("upload.queue_batches")
+            try:
+                results = self.scheduler.run(team)
+            except Exception as e:
+                results = new_results(team)
+                for result in results:
+                    result["error"] = str(e)
+            with self._lock:
+                self._results.extend(results)
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Wait for everything queued to be uploaded; one result per row, in put order."""
+        self._queue.put(_CLOSED)
+        self._worker.join()
+        with self._lock:
+            return list(self._results)
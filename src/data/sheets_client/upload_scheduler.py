@@ -0,0 +1,259 @@
+# src/data/sheets_client/upload_scheduler.py
+
+import random, threading, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from gspread.exceptions import APIError
+from src.core.instrumentation import stage, count
+from src.core.team_metrics import TeamMetrics
+from .sheets_client import SheetsClient, get_client, new_results, write_team_batch
+from .upload_journal import UploadJournal
+from .rollup_store import RollupStore
+
+# Sheets API write quota: 60 requests per minute per user (service account)
+SHEETS_REQUESTS_PER_MINUTE = 60
+
+# Worst-case API calls made by one `write_team_batch`: on a cold
+# session, tab metadata, duplicateSheet and the metadata refresh after
+# it, then values.batchGet, spreadsheets.batchUpdate and values.batchUpdate
+CALLS_PER_BATCH = 6
+
+# HTTP statuses worth retrying: rate limited or server-side trouble
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate_per_minute`.
+    On a 429 the rate is halved; each success recovers it gradually
+    toward the configured ceiling. `capacity` (default: a quarter
+    minute's worth) caps the burst and so the largest single `acquire`.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.max_rate = rate_per_minute / 60.0
+        self.rate = self.max_rate
+        self.capacity = capacity if capacity is not None else rate_per_minute / 4
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Block until `tokens` are available, then take them.
+        Raises ValueError if `tokens` exceeds the capacity, as the
+        bucket could never hold that many.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket holding at most {self.capacity}")
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def slow_down(self) -> None:
+        """Halve the refill rate after the server pushed back."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def recover(self) -> None:
+        """Creep back toward the full rate after a success."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate * 1.25)
+
+def quota_bucket(requests_per_minute: float = SHEETS_REQUESTS_PER_MINUTE) -> TokenBucket:
+    """A bucket for the Sheets write quota, with room for at least one whole batch however low the rate."""
+    return TokenBucket(requests_per_minute, max(requests_per_minute / 4, CALLS_PER_BATCH))
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, APIError) and error.code in RETRYABLE_STATUSES
+
+def _group_by_agent(agents: List[str], batch_size: int) -> List[List[int]]:
+    """
+    Split row indexes into batches of roughly `batch_size`.
+    All rows for one agent share a batch, so concurrent batches
+    never race for the same worksheet's next row.
+    """
+    by_agent: Dict[str, List[int]] = {}
+    for i, agent in enumerate(agents):
+        by_agent.setdefault(agent, []).append(i)
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for indexes in by_agent.values():
+        if current and len(current) + len(indexes) > batch_size:
+            batches.append(current)
+            current = []
+        current.extend(indexes)
+    if current:
+        batches.append(current)
+    return batches
+
+class UploadScheduler:
+    """
+    Upload team rows through a bounded worker pool, paced by a token
+    bucket sized to the Sheets per-minute quota. Rate-limit (429) and
+    5xx errors are retried with jittered exponential backoff.
+    With a `journal`, rows committed by an earlier run are skipped, so a
+    failed upload resumes where it stopped. With `rollups`, written rows
+    are added to the weekly/monthly totals.
+    """
+
+    def __init__(
+            self,
+            client: Optional[SheetsClient] = None,
+            max_workers: int = 4,
+            batch_size: int = 20,
+            requests_per_minute: float = SHEETS_REQUESTS_PER_MINUTE,
+            max_retries: int = 5,
+            bucket: Optional[TokenBucket] = None,
+            journal: Optional[UploadJournal] = None,
+            verify: bool = False,
+            rollups: Optional[RollupStore] = None):
+        self.client = client
+        self.journal = journal
+        self.rollups = rollups
+        self.verify = verify
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.bucket = bucket or quota_bucket(requests_per_minute)
+        if self.bucket.capacity < CALLS_PER_BATCH:
+            raise ValueError(f"Token bucket capacity {self.bucket.capacity} is below the {CALLS_PER_BATCH} calls of one batch")
+
+    def _upload_batch(self, batch: TeamMetrics, client: SheetsClient) -> List[Dict[str, Any]]:
+        """
+        Upload one batch, retrying transient failures. Retries always
+        verify, since a write can succeed even though its response was
+        an error.
+        """
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            with stage("upload.quota_wait"):
+                self.bucket.acquire(CALLS_PER_BATCH)
+            results = new_results(batch)
+            try:
+                if attempt:
+                    # The failed attempt may have been committed before the
+                    # error came back: re-fetch grid sizes, and read back from
+                    # where it started writing to skip the dates it wrote
+                    client.sheet_ids(refresh=True)
+                write_team_batch(batch, results, client, self.journal, self.verify or attempt > 0, self.rollups)
+                self.bucket.recover()
+                return results
+            except Exception as e:
+                if not _is_retryable(e) or attempt == self.max_retries:
+                    for result in results:
+                        if result["error"] is None:
+                            result["error"] = str(e)
+                    return results
+                count("upload.retries")
+                if isinstance(e, APIError) and e.code == 429:
+                    count("upload.rate_limited")
+                    self.bucket.slow_down()
+                time.sleep(delay + random.uniform(0, delay))
+                delay = min(delay * 2, 60.0)
+        return results
+
+    def run(
+            self,
+            team: TeamMetrics,
+            progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload every row of `team` and return one result per row, in table order.
+        `progress(done, total)` is called after each batch completes.
+        """
+        results: List[Dict[str, Any]] = new_results(team)
+        if not len(team):
+            return results
+
+        client = self.client or get_client()
+        # Create any missing tabs up front, so no batch races to add one
+        with stage("upload.preflight"):
+            client.ensure_tabs(team.agent_name.tolist())
+        batches = _group_by_agent(team.agent_name.tolist(), self.batch_size)
+        done = 0
+        with stage("upload"), ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._upload_batch, team.take(batch), client): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                for i, result in zip(batch, future.result()):
+                    results[i] = result
+                done += len(batch)
+                if progress:
+                    progress(done, len(team))
+        return results
+
+def upload_to_spreadsheets(
+        jobs: List[Tuple[str, TeamMetrics]],
+        journal: Optional[UploadJournal] = None,
+        verify: bool = False,
+        requests_per_minute: float = SHEETS_REQUESTS_PER_MINUTE,
+        max_workers_per_spreadsheet: int = 4,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+        rollups: Optional[RollupStore] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Upload several (spreadsheet ID, table) jobs concurrently, one
+    UploadScheduler per spreadsheet. Jobs aimed at the same spreadsheet
+    are merged first, so its rows never race for a worksheet's next row.
+
+    The write quota is per user, not per spreadsheet, so every
+    scheduler draws from one token bucket of `requests_per_minute`,
+    and a 429 on any spreadsheet slows them all down.
+
+    Returns:
+        One result list per job, in job order (see `UploadScheduler.run`).
+        `progress(spreadsheet_id, done, total)` reports per spreadsheet.
+    """
+    by_sheet: Dict[str, List[int]] = {}
+    for j, (spreadsheet_id, _) in enumerate(jobs):
+        by_sheet.setdefault(spreadsheet_id, []).append(j)
+
+    bucket = quota_bucket(requests_per_minute)
+
+    def upload_sheet(spreadsheet_id: str, team: TeamMetrics) -> List[Dict[str, Any]]:
+        scheduler = UploadScheduler(
+            get_client(spreadsheet_id),
+            max_workers=max_workers_per_spreadsheet,
+            bucket=bucket,
+            journal=journal,
+            verify=verify,
+            rollups=rollups
+        )
+        report = (lambda done, total: progress(spreadsheet_id, done, total)) if progress else None
+        return scheduler.run(team, report)
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in jobs]
+    if not jobs:
+        return results
+    with ThreadPoolExecutor(max_workers=len(by_sheet)) as pool:
+        futures = {
+            pool.submit(upload_sheet, spreadsheet_id, TeamMetrics.concat(jobs[j][1] for j in indexes)): indexes
+            for spreadsheet_id, indexes in by_sheet.items()
+        }
+        for future in as_completed(futures):
+            merged = future.result()
+            # Split the merged results back into their jobs
+            start = 0
+            for j in futures[future]:
+                results[j] = merged[start:start + len(jobs[j][1])]
+                start += len(jobs[j][1])
+    return results
@@ -0,0 +1,41 @@
+# src/data/sqlite_store.py
+
+import os, sqlite3, threading
+from typing import Dict, List, Tuple, Type, TypeVar
+
+S = TypeVar("S", bound="SQLiteStore")
+
+# Shared stores, keyed by class and database path
+_stores: Dict[Tuple[type, str], "SQLiteStore"] = {}
+_stores_lock = threading.Lock()
+
+
+class SQLiteStore:
+    """
+    Base of the local SQLite stores (upload journal, rollups, archive
+    index): one connection per database file, shared across threads
+    and serialised by `_lock`, with the tables of `SCHEMA` created on
+    first open.
+    """
+
+    # CREATE TABLE / CREATE INDEX statements, each IF NOT EXISTS
+    SCHEMA: List[str] = []
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+def shared_store(cls: Type[S], path: str) -> S:
+    """Return the one `cls` store opened on `path`, opening it on first use."""
+    with _stores_lock:
+        key = (cls, path)
+        if key not in _stores:
+            _stores[key] = cls(path)
+        return _stores[key]  # type: ignore[return-value]
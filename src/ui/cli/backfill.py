@@ -0,0 +1,85 @@
+# src/ui/cli/backfill.py
+
+import os, argparse
+from datetime import datetime, date
+from dotenv import load_dotenv
+from src.core.services.backfill_service import backfill_team_data
+from src.core.services.metrics_engine import unmatched_warnings
+from src.data.csv_reader.team_member import load_team_members
+from src.data.file_manager.file_manager import get_single_file, get_processed_dir
+from src.data.sheets_client.sheets_client import update_sheets_for_team, push_summary
+from src.data.sheets_client.upload_journal import get_journal
+from src.data.sheets_client.rollup_store import get_rollup_store
+from src.core.instrumentation import start_run, finish_and_report, stage
+
+
+def _parse_day(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="Replay archived days from the processed folder and upload them in one batch."
+    )
+    parser.add_argument("--from", dest="start", type=_parse_day, required=True, help="first day, YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", type=_parse_day, required=True, help="last day, YYYY-MM-DD")
+    parser.add_argument("--attendance", default="Office", choices=["Office", "Home", "UPL"],
+                        help="attendance recorded for every replayed row (default: Office)")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="process the archive but do not upload")
+    parser.add_argument("--verify", action="store_true",
+                        help="read back the last rows of each tab and skip dates already written")
+    parser.add_argument("--profile", action="store_true",
+                        help="also run cProfile and save the profile next to the run report")
+    args = parser.parse_args()
+
+    stats = start_run("backfill", profile=args.profile or None)
+    try:
+        run(args)
+    finally:
+        print(f"\n⏱  {finish_and_report(stats)}")
+
+def run(args: argparse.Namespace) -> None:
+    team_dir = os.getenv('TEAM_DIR')
+    assert team_dir
+    team_file = get_single_file(team_dir)
+    if not team_file:
+        raise FileNotFoundError(f"Missing required CSVs: ['team members']")
+
+    with stage("backfill"):
+        records, errors = backfill_team_data(
+            get_processed_dir(),
+            load_team_members(team_file),
+            args.start,
+            args.end,
+            args.workers
+        )
+    for day, error in sorted(errors.items()):
+        print(f"❌ {day}: {error}")
+    for warning in unmatched_warnings():
+        print(f"⚠️  {warning}")
+    days = len(set(records.date.tolist()))
+    print(f"Replayed {days} days, {len(records)} rows.")
+    if args.dry_run or not len(records):
+        return
+
+    records.attendance[:] = args.attendance
+    records.notes[:] = ""
+
+    # One batched upload for the whole range
+    rollups = get_rollup_store()
+    results = update_sheets_for_team(records, journal=get_journal(), verify=args.verify, rollups=rollups)
+    failed = [r for r in results if not r["success"]]
+    for r in failed:
+        print(f"❌ {r['agent_name']}: {r['error']}")
+    try:
+        push_summary(rollups)
+    except Exception as e:
+        print(f"⚠️  Summary tab not updated: {e}")
+    print(f"\n✅ {len(records) - len(failed)} rows uploaded successfully.")
+
+if __name__ == '__main__':
+    main()
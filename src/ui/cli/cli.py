@@ -1,19 +1,29 @@
 # src/ui/cli/cli.py
 
-import os 
+import os, sys, argparse
 from dotenv import load_dotenv
 from datetime import datetime
-from src.data.file_manager.file_manager import process_daily_files
-from typing import Dict, Any
-from src.data.sheets_client.sheets_client import update_sheet_for_agent  
+from src.data.file_manager.file_manager import process_daily_files, get_single_file
+from src.core.services.team_data_service import process_team_data_from_metabase
+from src.core.services.metrics_engine import unmatched_warnings
+from typing import Dict, Any, List
+from src.data.sheets_client.sheets_client import update_sheets_for_team, push_summary
+from src.data.sheets_client.upload_journal import get_journal
+from src.data.sheets_client.rollup_store import RollupStore, get_rollup_store
+from src.data.sheets_client.upload_scheduler import UploadScheduler
+from src.data.sheets_client.upload_queue import UploadQueue
+from src.core.instrumentation import start_run, finish_and_report, stage
+from src.core.team_metrics import TeamMetrics, ATTENDANCE_VALUES
+from src.data.csv_reader.attendance_reader import load_attendance, apply_attendance
 
 
 
-def prompt_user(record: Dict[str, Any]) -> Dict[str, Any]: 
-    agent = record["agent_name"]
+def prompt_user(team: TeamMetrics, i: int) -> None:
+    """Ask for row `i`'s attendance, leads and notes and store them in `team`."""
+    agent = team.agent_name[i]
     print(f"\n Agent: {agent}")
-    print(f" • Talk Time: {record['talk_time']} mins")
-    print(f" • Dials Made: {record['dials']}")
+    print(f" • Talk Time: {team.talk_time[i]} mins")
+    print(f" • Dials Made: {team.dials[i]}")
 
     # 1) Date is always today
     date_str: str = datetime.now().strftime("%d/%m/%Y")
@@ -26,7 +36,7 @@ def prompt_user(record: Dict[str, Any]) -> Dict[str, Any]:
     attendance_map: Dict[str,str] = {"1":"Office", "2":"Home", "3":"UPL"}
 
     # 3) Leads: if extracted >0, show and allow override; if CSV missing, prompt fresh
-    default_leads: int = record.get('leads', 0)
+    default_leads: int = int(team.leads[i])
     while True:
         if default_leads:
             entry: str = input(f"Leads (found {default_leads}; press Enter to keep or type new number): ").strip()
@@ -43,31 +53,137 @@ def prompt_user(record: Dict[str, Any]) -> Dict[str, Any]:
     notes: str = input(f"any notes for {agent}? Press enter to skip: ").strip()
     if not notes: notes = ''
 
-    # Merge all fields
-    merged: Dict[str, Any] = {
-        **record,
-        "date": date_str,
-        "attendance":attendance_map[attendance],
-        "leads": leads,
-        "notes": notes
-    }
-    return merged
+    # Fill the row in place
+    team.date[i] = date_str
+    team.attendance[i] = attendance_map[attendance]
+    team.leads[i] = leads
+    team.notes[i] = notes
 
 def main():
     load_dotenv()
+    parser = argparse.ArgumentParser(description="Process today's team data and upload it to Google Sheets.")
+    parser.add_argument("--metabase", action="store_true",
+                        help="pull talk time, dials and leads straight from Metabase instead of the input folders")
+    parser.add_argument("--verify", action="store_true",
+                        help="read back the last rows of each tab and skip dates already written")
+    parser.add_argument("--profile", action="store_true",
+                        help="also run cProfile and save the profile next to the run report")
+    parser.add_argument("--batch", action="store_true",
+                        help="no prompts: take attendance, lead overrides and notes from --attendance-file "
+                             "or the defaults, and exit non-zero if anything fails (for cron/CI)")
+    parser.add_argument("--attendance-file", default=os.getenv("ATTENDANCE_FILE"),
+                        help="with --batch: CSV (Agent Name, Attendance[, Leads, Notes]) or JSON list of "
+                             "{agent_name, attendance[, leads, notes]} (default: ATTENDANCE_FILE)")
+    parser.add_argument("--attendance", default="Office", choices=ATTENDANCE_VALUES,
+                        help="with --batch: attendance for agents not in the file (default: Office)")
+    args = parser.parse_args()
+
+    stats = start_run("cli-batch" if args.batch else "cli", profile=args.profile or None)
+    try:
+        ok = run(args)
+    finally:
+        print(f"\n⏱  {finish_and_report(stats)}")
+    if args.batch and not ok:
+        sys.exit(1)
+
+def fill_from_side_file(team: TeamMetrics, args: argparse.Namespace) -> None:
+    """Headless stand-in for `prompt_user`: today's date plus the side-file (or default) values."""
+    team.set_date(datetime.now().strftime("%d/%m/%Y"))
+    entries = load_attendance(args.attendance_file) if args.attendance_file else {}
+    unknown = apply_attendance(team, entries, args.attendance)
+    if unknown:
+        print(f"⚠️  Attendance file lists agents not on the team: {unknown}")
+    print(f"{len(team)} agents: {len(entries) - len(unknown)} from the attendance file, the rest {args.attendance}")
+
+def retry_failed(
+        team: TeamMetrics,
+        results: List[Dict[str, Any]],
+        args: argparse.Namespace,
+        rollups: RollupStore) -> List[Dict[str, Any]]:
+    """Offer to upload the failed rows again, as often as the operator likes; returns the updated results."""
+    results = list(results)
+    while True:
+        failed = [i for i, r in enumerate(results) if not r["success"]]
+        if not failed or input(f"\nRetry the {len(failed)} failed uploads? [y/N]: ").strip().lower() != "y":
+            return results
+        retried = update_sheets_for_team(team.take(failed), journal=get_journal(), verify=args.verify, rollups=rollups)
+        for i, result in zip(failed, retried):
+            results[i] = result
+            if not result["success"]:
+                print(f"❌ {result['agent_name']}: {result['error']}")
+
+def run(args: argparse.Namespace) -> bool:
+    """
+    Process and upload today's data; returns False if any row failed.
+    Ctrl+C or end of input during the prompts still uploads the agents
+    already confirmed, then reports the ones that were not.
+    """
     leads_dir = os.getenv("LEADS_DIR")
     talk_time_dir  = os.getenv('TALK_TIME_DIR')
     dials_dir = os.getenv('DIALS_DIR')
     team_dir  = os.getenv('TEAM_DIR')
 
-    assert leads_dir and talk_time_dir and dials_dir and team_dir
-    team_data = process_daily_files(leads_dir, talk_time_dir, dials_dir, team_dir)
+    if args.metabase:
+        assert team_dir
+        team_file = get_single_file(team_dir)
+        if not team_file:
+            raise FileNotFoundError(f"Missing required CSVs: ['team members']")
+        team_data = process_team_data_from_metabase(team_file)
+    else:
+        assert leads_dir and talk_time_dir and dials_dir and team_dir
+        team_data = process_daily_files(leads_dir, talk_time_dir, dials_dir, team_dir)
+    for warning in unmatched_warnings():
+        print(f"⚠️  {warning}")
+
+    rollups = get_rollup_store()
+    skipped: List[str] = []
+    if args.batch:
+        # Every row is checked before anything is uploaded
+        fill_from_side_file(team_data, args)
+        problems = team_data.problems()
+        if problems:
+            print(f"❌ {len(problems)} invalid rows, nothing uploaded:")
+            for problem in problems:
+                print(f"  {problem}")
+            return False
+        # Upload the whole team in one batch
+        results = update_sheets_for_team(team_data, journal=get_journal(), verify=args.verify, rollups=rollups)
+    else:
+        # Each agent is uploaded in the background as soon as it is
+        # confirmed, so the next prompt never waits on the network
+        uploads = UploadQueue(UploadScheduler(journal=get_journal(), verify=args.verify, rollups=rollups))
+        confirmed = 0
+        try:
+            # Time spent answering prompts is kept apart from processing time
+            with stage("prompt"):
+                for i in range(len(team_data)):
+                    print("\n" + "-"*40 + f" ({uploads.uploaded}/{i} uploaded)")
+                    prompt_user(team_data, i)
+                    uploads.put(team_data.take([i]))
+                    confirmed = i + 1
+        except (KeyboardInterrupt, EOFError):
+            # Agents already confirmed still get uploaded below
+            skipped = team_data.agent_name[confirmed:].tolist()
+            print(f"\n⚠️  Stopped: {len(skipped)} agents not confirmed, not uploaded: {skipped}")
+        print("\nFinishing uploads...")
+        with stage("upload.drain"):
+            results = uploads.close()
+
+    failed = [r for r in results if not r["success"]]
+    for r in failed:
+        print(f"❌ {r['agent_name']}: {r['error']}")
+    if not args.batch and not skipped:
+        results = retry_failed(team_data, results, args, rollups)
+        failed = [r for r in results if not r["success"]]
+    try:
+        push_summary(rollups)
+    except Exception as e:
+        print(f"⚠️  Summary tab not updated: {e}")
+
+    print(f"\n✅ {len(results) - len(failed)} agents processed successfully.")
+    if skipped:
+        print(f"⚠️  Not uploaded (stopped before confirming): {skipped}")
+    return not failed and not skipped
 
-    for rec in team_data:
-        print("\n" + "-"*40)
-        filled = prompt_user(rec)
-        update_sheet_for_agent(filled)
-    
-    print(f"\n✅ {len(team_data)} agents processed successfully.")
 if __name__ == '__main__':
     main()
\ No newline at end of file
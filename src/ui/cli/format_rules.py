@@ -0,0 +1,63 @@
+# src/ui/cli/format_rules.py
+
+import os, argparse
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+from src.data.csv_reader.team_manifest import load_team_manifest
+from src.data.csv_reader.team_member import load_team_members
+from src.data.file_manager.file_manager import get_single_file
+from src.data.sheets_client.sheets_client import get_client, install_format_rules
+
+
+def default_roster(path: Optional[str] = None) -> List[str]:
+    """Agents of the roster at `path`, or of the single CSV in TEAM_DIR."""
+    if not path:
+        team_dir = os.getenv('TEAM_DIR')
+        path = get_single_file(team_dir) if team_dir and os.path.isdir(team_dir) else None
+    if not path:
+        raise RuntimeError("No roster: pass --roster or set TEAM_DIR")
+    return load_team_members(path)
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="Add the Attendance/Leads conditional-format rules to the roster's agent tabs "
+                    "and the template tab, so daily uploads send values only. Safe to run again."
+    )
+    parser.add_argument("--spreadsheet", action="append", default=[],
+                        help="spreadsheet ID; repeat for several (default: GOOGLE_SHEETS_TEMPLATE_ID)")
+    parser.add_argument("--roster", default=None,
+                        help="team members CSV whose agent tabs get the rules (default: the CSV in TEAM_DIR)")
+    parser.add_argument("--manifest", default=None,
+                        help="also set up every spreadsheet in this teams CSV, each for its teams' rosters")
+    parser.add_argument("--tab", action="append", default=None,
+                        help="only this tab; repeat for several (default: the roster's tabs)")
+    args = parser.parse_args()
+
+    # Spreadsheet → agents whose tabs get the rules (none needed with --tab)
+    spreadsheet_ids = args.spreadsheet or ([] if args.manifest else [get_client().spreadsheet_id])
+    agents: Dict[str, List[str]] = {spreadsheet_id: [] for spreadsheet_id in spreadsheet_ids}
+    if spreadsheet_ids and not args.tab:
+        roster = default_roster(args.roster)
+        for spreadsheet_id in spreadsheet_ids:
+            agents[spreadsheet_id].extend(roster)
+    for team in load_team_manifest(args.manifest) if args.manifest else []:
+        team_agents = agents.setdefault(team["spreadsheet_id"], [])
+        if not args.tab:
+            team_agents.extend(load_team_members(team["roster"]))
+
+    for spreadsheet_id, roster in agents.items():
+        client = get_client(spreadsheet_id)
+        if args.tab:
+            titles = args.tab
+        else:
+            # Agents without a tab yet get the rules from the template when it is copied
+            tabs = client.sheet_ids()
+            titles = [agent for agent in dict.fromkeys(roster) if agent in tabs]
+            if len(titles) < len(set(roster)):
+                print(f"ℹ️  {spreadsheet_id}: {len(set(roster)) - len(titles)} roster agents have no tab yet")
+        added = install_format_rules(titles, client)
+        print(f"✅ {spreadsheet_id}: {added} rules added" if added else f"✅ {spreadsheet_id}: already set up")
+
+if __name__ == '__main__':
+    main()
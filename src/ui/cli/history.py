@@ -0,0 +1,32 @@
+# src/ui/cli/history.py
+
+import argparse
+from datetime import datetime, date
+from dotenv import load_dotenv
+from src.data.file_manager.archive_index import get_archive_index
+
+
+def _parse_day(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD, got {value!r}")
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Show an agent's archived daily metrics from the archive index.")
+    parser.add_argument("agent", help="agent name, as it appears in the exports")
+    parser.add_argument("--from", dest="start", type=_parse_day, default=date.min, help="first day, YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", type=_parse_day, default=date.max, help="last day, YYYY-MM-DD")
+    args = parser.parse_args()
+
+    history = get_archive_index().agent_history(args.agent, args.start, args.end)
+    if not history:
+        print(f"No archived metrics for {args.agent}")
+        return
+    print(f"{'Day':<12}{'Talk Time':>12}{'Dials':>8}{'Leads':>8}")
+    for day, talk_time, dials, leads in history:
+        print(f"{day.isoformat():<12}{talk_time:>10.1f} m{dials:>8}{leads:>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# src/ui/cli/teams.py
+
+import os, argparse
+from datetime import datetime
+from dotenv import load_dotenv
+from src.core.services.team_data_service import process_teams_from_metabase
+from src.core.services.metrics_engine import unmatched_warnings
+from src.data.csv_reader.team_manifest import load_team_manifest
+from src.data.file_manager.file_manager import process_daily_files_for_teams
+from src.data.sheets_client.upload_scheduler import upload_to_spreadsheets
+from src.data.sheets_client.sheets_client import get_client, push_summary
+from src.data.sheets_client.upload_journal import get_journal
+from src.data.sheets_client.rollup_store import get_rollup_store
+from src.core.instrumentation import start_run, finish_and_report
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="Process today's exports once for every team in a manifest and upload each team to its own spreadsheet."
+    )
+    parser.add_argument("--manifest", default=None,
+                        help="teams CSV with Team Name, Roster Path, Spreadsheet ID (default: TEAMS_MANIFEST)")
+    parser.add_argument("--metabase", action="store_true",
+                        help="pull talk time, dials and leads straight from Metabase instead of the input folders")
+    parser.add_argument("--attendance", default="Office", choices=["Office", "Home", "UPL"],
+                        help="attendance recorded for every row (default: Office)")
+    parser.add_argument("--dry-run", action="store_true", help="process the exports but do not upload")
+    parser.add_argument("--verify", action="store_true",
+                        help="read back the last rows of each tab and skip dates already written")
+    parser.add_argument("--profile", action="store_true",
+                        help="also run cProfile and save the profile next to the run report")
+    args = parser.parse_args()
+
+    stats = start_run("teams", profile=args.profile or None)
+    try:
+        run(args)
+    finally:
+        print(f"\n⏱  {finish_and_report(stats)}")
+
+def run(args: argparse.Namespace) -> None:
+    manifest = args.manifest or os.getenv("TEAMS_MANIFEST")
+    if not manifest:
+        raise RuntimeError("No teams manifest: pass --manifest or set TEAMS_MANIFEST")
+    teams = load_team_manifest(manifest)
+
+    # 1) Shared exports are parsed once, whatever the number of teams
+    if args.metabase:
+        tables = process_teams_from_metabase(teams)
+        for table in tables.values():
+            table.set_date(datetime.now().strftime("%d/%m/%Y"))
+    else:
+        leads_dir = os.getenv("LEADS_DIR")
+        talk_time_dir = os.getenv('TALK_TIME_DIR')
+        dials_dir = os.getenv('DIALS_DIR')
+        assert leads_dir and talk_time_dir and dials_dir
+        tables = process_daily_files_for_teams(leads_dir, talk_time_dir, dials_dir, teams)
+    for warning in unmatched_warnings():
+        print(f"⚠️  {warning}")
+
+    for team in teams:
+        table = tables[team["name"]]
+        table.attendance[:] = args.attendance
+        print(f"{team['name']}: {len(table)} agents")
+    if args.dry_run:
+        return
+
+    # 2) Every spreadsheet uploads concurrently, each under its own rate limit
+    rollups = get_rollup_store()
+    results = upload_to_spreadsheets(
+        [(team["spreadsheet_id"], tables[team["name"]]) for team in teams],
+        journal=get_journal(),
+        verify=args.verify,
+        progress=lambda sheet, done, total: print(f"  {sheet}: {done}/{total} uploaded"),
+        rollups=rollups
+    )
+    for team, team_results in zip(teams, results):
+        failed = [r for r in team_results if not r["success"]]
+        for r in failed:
+            print(f"❌ {team['name']} / {r['agent_name']}: {r['error']}")
+        print(f"✅ {team['name']}: {len(team_results) - len(failed)} agents uploaded.")
+
+    # 3) One summary tab per spreadsheet, even if several teams share it
+    for spreadsheet_id in dict.fromkeys(team["spreadsheet_id"] for team in teams):
+        try:
+            push_summary(rollups, get_client(spreadsheet_id))
+        except Exception as e:
+            print(f"⚠️  Summary tab of {spreadsheet_id} not updated: {e}")
+
+if __name__ == '__main__':
+    main()
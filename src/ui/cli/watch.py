@@ -0,0 +1,164 @@
+# src/ui/cli/watch.py
+
+import os, time, argparse
+from datetime import datetime, date
+from typing import Dict, Optional, Tuple
+from dotenv import load_dotenv
+from src.data.csv_reader.attendance_reader import load_attendance, apply_attendance
+from src.core.team_metrics import TeamMetrics, ATTENDANCE_VALUES
+from src.core.services.metrics_engine import unmatched_warnings
+from src.data.file_manager.file_manager import process_input_files
+from src.data.file_manager.folder_watcher import FolderWatcher
+from src.data.sheets_client.sheets_client import update_sheets_for_team, push_summary
+from src.data.sheets_client.upload_journal import get_journal
+from src.data.sheets_client.rollup_store import get_rollup_store
+from src.core.instrumentation import start_run, finish_and_report
+
+
+def log(message: str) -> None:
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
+
+def _todays_attendance(path: str):
+    """Entries of the side-file at `path`, or {} if it is absent or not from today."""
+    if not path or not os.path.exists(path):
+        return {}
+    if date.fromtimestamp(os.path.getmtime(path)) != date.today():
+        log(f"⚠️  Ignoring {path}: not updated today, using the default attendance")
+        return {}
+    return load_attendance(path)
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    """(path, size, mtime_ns) of `path`, or None if it is unset or absent."""
+    if not path or not os.path.exists(path):
+        return None
+    st = os.stat(path)
+    return path, st.st_size, st.st_mtime_ns
+
+def upload(args: argparse.Namespace, team: TeamMetrics) -> TeamMetrics:
+    """Upload `team` and refresh the summary tab; returns the rows that failed."""
+    rollups = get_rollup_store()
+    results = update_sheets_for_team(team, journal=get_journal(), verify=args.verify, rollups=rollups)
+    failed = [i for i, r in enumerate(results) if not r["success"]]
+    for i in failed:
+        log(f"❌ {results[i]['agent_name']}: {results[i]['error']}")
+    try:
+        push_summary(rollups)
+    except Exception as e:
+        log(f"⚠️  Summary tab not updated: {e}")
+    log(f"✅ {len(team) - len(failed)} agents processed successfully.")
+    return team.take(failed)
+
+def process_and_upload(args: argparse.Namespace, files: Dict[str, str]) -> TeamMetrics:
+    """
+    One daily run over the settled `files` (kind → path): process,
+    archive, apply attendance and upload. Returns the rows whose upload
+    failed, to be retried; processing errors raise.
+    """
+    stats = start_run("watch")
+    try:
+        team = process_input_files(files)
+        for warning in unmatched_warnings(stats.notes):
+            log(f"⚠️  {warning}")
+        unknown = apply_attendance(team, _todays_attendance(args.attendance_file), args.attendance)
+        if unknown:
+            log(f"⚠️  Attendance side-file lists agents not on the team: {unknown}")
+        return upload(args, team)
+    finally:
+        log(f"⏱  {finish_and_report(stats)}")
+
+def retry_upload(args: argparse.Namespace, team: TeamMetrics) -> TeamMetrics:
+    """Upload rows that failed before; returns those that failed again."""
+    stats = start_run("watch.retry")
+    try:
+        log(f"Retrying {len(team)} failed uploads")
+        return upload(args, team)
+    finally:
+        log(f"⏱  {finish_and_report(stats)}")
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="Watch the input folders and process and upload the exports as soon as they land."
+    )
+    parser.add_argument("--attendance", default="Office", choices=ATTENDANCE_VALUES,
+                        help="attendance for agents not in the side-file (default: Office)")
+    parser.add_argument("--attendance-file", default=os.getenv("ATTENDANCE_FILE"),
+                        help="CSV with Agent Name, Attendance[, Leads, Notes] (or the JSON equivalent); "
+                             "only used if updated today (default: ATTENDANCE_FILE)")
+    parser.add_argument("--wait-for-leads", action="store_true",
+                        help="do not process until the leads export has landed too")
+    parser.add_argument("--settle", type=float, default=5.0,
+                        help="seconds a file must stay unchanged before it is used (default: 5)")
+    parser.add_argument("--poll", type=float, default=2.0, help="polling interval in seconds (default: 2)")
+    parser.add_argument("--no-notifications", action="store_true", help="always poll, even if watchdog is installed")
+    parser.add_argument("--verify", action="store_true",
+                        help="read back the last rows of each tab and skip dates already written")
+    parser.add_argument("--retry-every", type=float, default=60.0,
+                        help="seconds between retries of failed uploads (default: 60)")
+    args = parser.parse_args()
+
+    dirs = {
+        "leads": os.getenv("LEADS_DIR"),
+        "talk_time": os.getenv('TALK_TIME_DIR'),
+        "dials": os.getenv('DIALS_DIR'),
+        "team": os.getenv('TEAM_DIR')
+    }
+    missing = [key for key, folder in dirs.items() if not folder or not os.path.isdir(folder)]
+    if missing:
+        raise FileNotFoundError(f"Input folders not set or not found: {missing}")
+
+    required = ["talk_time", "dials", "team"] + (["leads"] if args.wait_for_leads else [])
+    watcher = FolderWatcher(dirs, args.settle, args.poll, not args.no_notifications)
+    log(f"Watching {', '.join(dirs.values())} ({watcher.mode}); Ctrl+C to stop")
+
+    # A set of files (and side-file) that failed is not retried until one of them changes
+    failed_signature = None
+    reported_problems = {}
+    # Rows already processed and archived whose upload failed, kept
+    # until a retry gets them through
+    unsent: Optional[TeamMetrics] = None
+    retry_at = 0.0
+    try:
+        while True:
+            settled, problems = watcher.poll()
+            if problems != reported_problems:
+                for key, error in problems.items():
+                    log(f"⚠️  {key}: {error}")
+                reported_problems = problems
+
+            # Every required file settled, and no other file still being
+            # written (an optional export is waited for, not skipped)
+            ready = all(key in settled for key in required) and not problems and watcher.present() <= set(settled)
+            if ready:
+                signature = (watcher.signature(settled), _file_signature(args.attendance_file))
+                if signature != failed_signature and watcher.unchanged(settled):
+                    log(f"Processing {', '.join(os.path.basename(p) for p in settled.values())}")
+                    files = {("team_members" if key == "team" else key): path for key, path in settled.items()}
+                    try:
+                        failed = process_and_upload(args, files)
+                        failed_signature = None
+                        if len(failed):
+                            unsent = TeamMetrics.concat([unsent, failed]) if unsent is not None else failed
+                            retry_at = time.monotonic() + args.retry_every
+                    except Exception as e:
+                        log(f"❌ Run failed, waiting for new files: {e}")
+                        failed_signature = signature
+
+            if unsent is not None and time.monotonic() >= retry_at:
+                try:
+                    unsent = retry_upload(args, unsent)
+                except Exception as e:
+                    log(f"❌ Retry failed: {e}")
+                if not len(unsent):
+                    unsent = None
+                retry_at = time.monotonic() + args.retry_every
+            watcher.wait()
+    except KeyboardInterrupt:
+        if unsent is not None:
+            log(f"⚠️  Stopping with {len(unsent)} uploads not sent: {sorted(set(unsent.agent_name.tolist()))}")
+        log("Stopping")
+    finally:
+        watcher.stop()
+
+if __name__ == '__main__':
+    main()
@@ -8,44 +8,167 @@ from datetime import datetime
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QTableWidget, QTableWidgetItem, QFileDialog, QProgressBar,
-    QComboBox, QSpinBox, QGroupBox, QMessageBox, QHeaderView, QScrollArea
+    QLabel, QTableView, QAbstractItemView, QFileDialog, QProgressBar,
+    QGroupBox, QMessageBox, QHeaderView
 )
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QFont
 
-from src.core.services.team_data_service import process_team_data
-from src.data.sheets_client.sheets_client import update_sheet_for_agent
+from src.core.instrumentation import start_run, finish_and_report, stage
+from src.core.services.metrics_engine import (
+    KeyedValues, load_metric_index, merge_metric_indexes, resolve_team, report_unmatched, unmatched_warnings,
+    validate_input_headers
+)
+from src.data.csv_reader.agent_aliases import get_agent_aliases
+from src.core.team_metrics import TeamMetrics
+from src.data.csv_reader.team_member import load_team_members
+from src.data.sheets_client.upload_scheduler import UploadScheduler
+from src.data.sheets_client.sheets_client import push_summary
+from src.data.sheets_client.upload_journal import get_journal
+from src.data.sheets_client.rollup_store import get_rollup_store
+from .team_table_model import (
+    TeamTableModel, AttendanceDelegate, LeadsDelegate, NotesDelegate,
+    ATTENDANCE_COL, LEADS_COL, NOTES_COL
+)
 
 class DataProcessingThread(QThread):
     progress_update = Signal(int)
     status_update = Signal(str)
     upload_complete = Signal(bool, str)
+    run_summary = Signal(str)
 
-    def __init__(self, agent_data_list):
+    def __init__(self, team: TeamMetrics):
         super().__init__()
-        self.agent_data_list = agent_data_list
+        self.team = team
+
+    def report_progress(self, done, total):
+        self.status_update.emit(f"Uploaded {done} of {total} agents...")
+        self.progress_update.emit(int(done / total * 100))
 
     def run(self):
+        stats = start_run("gui-upload")
+        try:
+            self.upload()
+        finally:
+            self.run_summary.emit(finish_and_report(stats))
+
+    def upload(self):
         try:
-            total_agents = len(self.agent_data_list)
-            for i, agent_data in enumerate(self.agent_data_list):
-                self.status_update.emit(f"Uploading {agent_data['agent_name']}...")
-                agent_data['date'] = datetime.now().strftime("%d/%m/%Y")
-                update_sheet_for_agent(agent_data)
-                progress = int((i + 1) / total_agents * 100)
-                self.progress_update.emit(progress)
-                self.msleep(500)
-            self.upload_complete.emit(True, "All data uploaded successfully!")
+            total_agents = len(self.team)
+            self.status_update.emit(f"Uploading {total_agents} agents...")
+            self.team.set_date(datetime.now().strftime("%d/%m/%Y"))
+            rollups = get_rollup_store()
+            results = UploadScheduler(journal=get_journal(), rollups=rollups).run(self.team, self.report_progress)
+            failed = [r for r in results if not r['success']]
+            try:
+                self.status_update.emit("Updating the summary tab...")
+                push_summary(rollups)
+                summary_note = ""
+            except Exception as e:
+                summary_note = f"\nThe summary tab was not updated: {e}"
+            if failed:
+                details = "\n".join(f"{r['agent_name']}: {r['error']}" for r in failed)
+                self.upload_complete.emit(False, f"Upload failed for {len(failed)} of {total_agents} agents:\n{details}{summary_note}")
+            else:
+                skipped = sum(r['skipped'] for r in results)
+                note = f" ({skipped} already uploaded earlier, skipped)" if skipped else ""
+                self.upload_complete.emit(True, f"All data uploaded successfully!{note}{summary_note}")
         except Exception as e:
             self.upload_complete.emit(False, f"Upload failed: {str(e)}")
 
+class TeamDataLoadingThread(QThread):
+    """
+    Loads the roster and metric files off the UI thread.
+    Every header is checked first, so a malformed file fails the load
+    before anything is shown. The roster then reaches the table (in
+    chunks, metrics at zero) so attendance can be edited right away;
+    each metric column is filled in as soon as its file is parsed.
+    Cancel with requestInterruption().
+    """
+    progress_update = Signal(int)
+    status_update = Signal(str)
+    rows_loaded = Signal(object)            # TeamMetrics rows to append
+    metric_loaded = Signal(str, object, object)   # key, agent → value index, default
+    load_complete = Signal(bool, str)
+    run_summary = Signal(str)
+
+    ROW_CHUNK = 500
+
+    def __init__(self, file_paths):
+        super().__init__()
+        self.file_paths = dict(file_paths)
+
+    def run(self):
+        stats = start_run("gui-load")
+        try:
+            self.load()
+        finally:
+            self.run_summary.emit(finish_and_report(stats))
+
+    def load(self):
+        try:
+            metrics = [
+                ('talk_time', 'talk_time', 0.0),
+                ('dials_made', 'dials', 0),
+                ('leads', 'leads', 0)
+            ]
+            metrics = [m for m in metrics if self.file_paths[m[0]]]
+            total_steps = 1 + len(metrics)
+
+            # 0) Every header up front, so a bad file fails before any row is shown
+            problems = validate_input_headers({
+                "team_members": self.file_paths['team_members'],
+                **{key: self.file_paths[path_key] for path_key, key, _ in metrics}
+            })
+            if problems:
+                self.load_complete.emit(False, "Invalid input files:\n  " + "\n  ".join(problems))
+                return
+
+            # 1) Roster first, so rows appear before any metric is parsed
+            self.status_update.emit("Loading team members...")
+            with stage("parse.team_members"):
+                team_members = load_team_members(self.file_paths['team_members'])
+            for start in range(0, len(team_members), self.ROW_CHUNK):
+                if self.isInterruptionRequested():
+                    self.load_complete.emit(False, "Loading cancelled")
+                    return
+                self.rows_loaded.emit(TeamMetrics(team_members[start:start + self.ROW_CHUNK]))
+            self.progress_update.emit(int(1 / total_steps * 100))
+
+            # 2) One metric file at a time, each filling its column;
+            # joined exactly as in the CLI, on normalized names
+            aliases = get_agent_aliases()
+            loaded: Dict[str, KeyedValues] = {}
+            index: Dict[str, Dict[str, Any]] = {}
+            for step, (path_key, key, default) in enumerate(metrics, start=2):
+                if self.isInterruptionRequested():
+                    self.load_complete.emit(False, "Loading cancelled")
+                    return
+                path = self.file_paths[path_key]
+                self.status_update.emit(f"Loading {Path(path).name}...")
+                loaded[key] = load_metric_index(key, path)
+                index = merge_metric_indexes(loaded.get("talk_time", {}), loaded.get("dials", {}),
+                                             loaded.get("leads", {}), aliases)
+                column = getattr(resolve_team(team_members, index, aliases, report=False), key)
+                self.metric_loaded.emit(key, dict(zip(team_members, column.tolist())), default)
+                self.progress_update.emit(int(step / total_steps * 100))
+
+            # 3) Names that matched nothing, once every file is in
+            missing, unknown = report_unmatched(team_members, index, aliases)
+            warnings = unmatched_warnings({"unmatched_roster": missing, "unmatched_exports": unknown})
+            self.load_complete.emit(True, "\n".join([f"Loaded {len(team_members)} agents"] + warnings))
+        except Exception as e:
+            self.load_complete.emit(False, f"Failed to load data: {str(e)}")
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setup_ui()
         self.apply_dark_theme()
-        self.agent_data = []
+        self.agent_data = TeamMetrics.empty()
+        self.load_thread = None
+        # Set while an upload runs; loads wait for it (see check_ready_to_load)
+        self.uploading = False
         self.file_paths = {
             'team_members': 'raw-data/team/team_members.csv',  # Set automatically
             'talk_time': None,
@@ -69,16 +192,13 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(file_group)
 
         self.load_button = QPushButton("Load Team Data")
-        self.load_button.clicked.connect(self.load_team_data)
+        self.load_button.clicked.connect(self.on_load_clicked)
         self.load_button.setMinimumHeight(40)
         main_layout.addWidget(self.load_button)
 
-        # --- Table and Scroll Area ---
+        # --- Table (the view scrolls and virtualizes on its own) ---
         self.create_data_table()
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(self.data_table)
-        main_layout.addWidget(self.scroll_area)
+        main_layout.addWidget(self.data_table)
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -93,6 +213,9 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Ready - Select CSV files and load team data")
         main_layout.addWidget(self.status_label)
 
+        # Timing and API-call summary of the last load or upload
+        self.statusBar().showMessage("No runs yet")
+
     def create_file_selection_group(self):
         group = QGroupBox("Select CSV Files")
         layout = QVBoxLayout(group)
@@ -118,19 +241,28 @@ class MainWindow(QMainWindow):
         return group
 
     def create_data_table(self):
-        self.data_table = QTableWidget()
-        columns = ["Agent Name", "Attendance", "Leads", "Talk Time", "Dials Made", "Notes"]
-        self.data_table.setColumnCount(len(columns))
-        self.data_table.setHorizontalHeaderLabels(columns)
+        self.table_model = TeamTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
+        # Editors exist only while a cell is being edited
+        self.data_table.setItemDelegateForColumn(ATTENDANCE_COL, AttendanceDelegate(self.data_table))
+        self.data_table.setItemDelegateForColumn(LEADS_COL, LeadsDelegate(self.data_table))
+        self.data_table.setItemDelegateForColumn(NOTES_COL, NotesDelegate(self.data_table))
+        self.data_table.setEditTriggers(
+            QAbstractItemView.CurrentChanged | QAbstractItemView.DoubleClicked |
+            QAbstractItemView.SelectedClicked | QAbstractItemView.EditKeyPressed
+        )
         self.data_table.setAlternatingRowColors(True)
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.data_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         header = self.data_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Interactive)
         header.setStretchLastSection(True)
+        # Fixed row height keeps scrolling O(visible rows)
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         # Set column widths for better visibility
         self.data_table.setColumnWidth(0, 180)  # Agent Name
         self.data_table.setColumnWidth(1, 120)  # Attendance
-        self.data_table.setColumnWidth(2, 120)   # Leads
+        self.data_table.setColumnWidth(2, 90)   # Leads
         self.data_table.setColumnWidth(3, 110)  # Talk Time
         self.data_table.setColumnWidth(4, 100)  # Dials Made
         self.data_table.setColumnWidth(5, 200)  # Notes
@@ -138,10 +270,6 @@ class MainWindow(QMainWindow):
         self.data_table.setMinimumWidth(900)
         self.data_table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.data_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.data_table.setSizeAdjustPolicy(QTableWidget.AdjustToContents)
-        
-        self.data_table.setColumnWidth(1, 120)  # Attendance
-        self.data_table.setColumnWidth(2, 90)   # Leads
     
     def select_file(self, file_type):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -159,83 +287,80 @@ class MainWindow(QMainWindow):
     def check_ready_to_load(self):
         required_files = ['talk_time', 'dials_made']
         all_required = all(self.file_paths[key] for key in required_files)
-        self.load_button.setEnabled(all_required)
+        # Loads and uploads each record the process-wide current run,
+        # so a load started mid-upload would take over the upload's report
+        self.load_button.setEnabled(all_required and not self.uploading)
+
+    def on_load_clicked(self):
+        # The load button doubles as "Cancel" while a load is running
+        if self.load_thread and self.load_thread.isRunning():
+            self.load_thread.requestInterruption()
+            self.load_button.setEnabled(False)
+            self.status_label.setText("Cancelling...")
+        else:
+            self.load_team_data()
 
     def load_team_data(self):
-        try:
-            self.status_label.setText("Loading team data...")
-            self.agent_data = process_team_data(
-                self.file_paths['team_members'],
-                self.file_paths['talk_time'],
-                self.file_paths['dials_made'],
-                self.file_paths['leads']
-            )
-            self.populate_table()
-            self.status_label.setText(f"Loaded {len(self.agent_data)} agents")
+        self.agent_data = TeamMetrics.empty()
+        self.table_model.set_team(TeamMetrics.empty())
+        self.upload_button.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.load_button.setText("Cancel Loading")
+        self.status_label.setText("Loading team data...")
+        self.load_thread = TeamDataLoadingThread(self.file_paths)
+        self.load_thread.progress_update.connect(self.progress_bar.setValue)
+        self.load_thread.status_update.connect(self.status_label.setText)
+        self.load_thread.rows_loaded.connect(self.table_model.append_team)
+        self.load_thread.metric_loaded.connect(self.table_model.apply_metric)
+        self.load_thread.load_complete.connect(self.load_finished)
+        self.load_thread.run_summary.connect(self.statusBar().showMessage)
+        self.load_thread.start()
+
+    def load_finished(self, success, message):
+        self.progress_bar.setVisible(False)
+        self.load_button.setText("Load Team Data")
+        self.check_ready_to_load()
+        # A successful load lists unmatched names below its first line
+        summary, _, warnings = message.partition("\n")
+        self.status_label.setText(summary if success else message)
+        if success:
+            self.agent_data = self.table_model.team()
             self.upload_button.setEnabled(True)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}")
-            self.status_label.setText("Error loading data")
-
-    def populate_table(self):
-        self.data_table.setRowCount(len(self.agent_data))
-        for row, agent in enumerate(self.agent_data):
-            self.data_table.setItem(row, 0, QTableWidgetItem(agent['agent_name']))
-            self.data_table.item(row, 0).setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-
-            attendance_combo = QComboBox()
-            attendance_combo.addItems(['Office', 'Home', 'UPL'])
-            attendance_combo.setCurrentText('Office')
-            attendance_combo.setFixedWidth(100)  # 20px less than column
-            attendance_combo.setStyleSheet("margin-left:10px; margin-right:10px;")
-            self.data_table.setCellWidget(row, 1, attendance_combo)
-
-            leads_spin = QSpinBox()
-            leads_spin.setRange(0, 999)
-            leads_spin.setValue(agent.get('leads', 0))
-            leads_spin.setFixedWidth(70)  # 20px less than column
-            leads_spin.setStyleSheet("margin-left:10px; margin-right:10px;")
-            self.data_table.setCellWidget(row, 2, leads_spin)
-
-            talk_time_minutes = agent.get('talk_time', 0)
-            talk_time_str = f"{talk_time_minutes:.1f} min"
-            self.data_table.setItem(row, 3, QTableWidgetItem(talk_time_str))
-            self.data_table.item(row, 3).setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.data_table.setItem(row, 4, QTableWidgetItem(str(agent.get('dials', 0))))
-            self.data_table.item(row, 4).setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            notes_item = QTableWidgetItem("")
-            self.data_table.setItem(row, 5, notes_item)
-        # Only resize rows, not columns
-        self.data_table.resizeRowsToContents()
+            if warnings:
+                QMessageBox.warning(self, "Unmatched agents", warnings)
+        elif message != "Loading cancelled":
+            QMessageBox.critical(self, "Error", message)
 
     def get_table_data(self):
-        table_data = []
-        for row in range(self.data_table.rowCount()):
-            agent_data = self.agent_data[row].copy()
-            attendance_combo = self.data_table.cellWidget(row, 1)
-            leads_spin = self.data_table.cellWidget(row, 2)
-            notes_item = self.data_table.item(row, 5)
-            agent_data['attendance'] = attendance_combo.currentText()
-            agent_data['leads'] = leads_spin.value()
-            agent_data['notes'] = notes_item.text() if notes_item else ""
-            table_data.append(agent_data)
-        return table_data
+        # Commit any cell still being edited before reading the model
+        self.data_table.setCurrentIndex(self.data_table.currentIndex().siblingAtColumn(0))
+        return self.table_model.team()
 
     def upload_data(self):
-        if not self.agent_data:
+        if not len(self.agent_data):
             QMessageBox.warning(self, "Warning", "No data to upload")
             return
         current_data = self.get_table_data()
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.upload_button.setEnabled(False)
+        self.uploading = True
+        self.load_button.setEnabled(False)
         self.status_label.setText("Starting upload...")
         self.upload_thread = DataProcessingThread(current_data)
         self.upload_thread.progress_update.connect(self.progress_bar.setValue)
         self.upload_thread.status_update.connect(self.status_label.setText)
         self.upload_thread.upload_complete.connect(self.upload_finished)
+        self.upload_thread.run_summary.connect(self.statusBar().showMessage)
+        # Only once run() has returned has the upload's run been finished
+        self.upload_thread.finished.connect(self.upload_thread_finished)
         self.upload_thread.start()
 
+    def upload_thread_finished(self):
+        self.uploading = False
+        self.check_ready_to_load()
+
     def upload_finished(self, success, message):
         self.progress_bar.setVisible(False)
         self.upload_button.setEnabled(True)
@@ -250,14 +375,15 @@ class MainWindow(QMainWindow):
         QMainWindow { background-color: #2b2b2b; color: #ffffff; }
         QWidget { background-color: #2b2b2b; color: #ffffff; }
         QLabel { color: #ffffff; font-size: 12px; }
+        QStatusBar { color: #aaaaaa; font-size: 11px; }
         QPushButton { background-color: #0078d4; color: white; border: none; padding: 10px 20px; border-radius: 5px; font-weight: bold; }
         QPushButton:hover { background-color: #106ebe; }
         QPushButton:disabled { background-color: #555555; color: #888888; }
         QGroupBox { font-weight: bold; border: 2px solid #555555; border-radius: 5px; margin-top: 10px; padding-top: 10px; }
         QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px 0 5px; color: #0078d4; }
-        QTableWidget { background-color: #3c3c3c; border: 1px solid #555555; gridline-color: #555555; selection-background-color: #0078d4; }
-        QTableWidget::item { padding: 5px; border-bottom: 1px solid #555555; }
-        QTableWidget::item:alternate { background-color: #404040; }
+        QTableView { background-color: #3c3c3c; border: 1px solid #555555; gridline-color: #555555; selection-background-color: #0078d4; }
+        QTableView::item { padding: 5px; border-bottom: 1px solid #555555; }
+        QTableView::item:alternate { background-color: #404040; }
         QHeaderView::section { background-color: #555555; color: white; padding: 5px; border: 1px solid #666666; font-weight: bold; }
         QComboBox, QSpinBox { background-color: #3c3c3c; border: 1px solid #555555; padding: 5px; color: white; }
         QComboBox::drop-down { border: none; }
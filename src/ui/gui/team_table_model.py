@@ -0,0 +1,173 @@
+# src/ui/gui/team_table_model.py
+
+import numpy as np
+from typing import Dict, Any
+
+from PySide6.QtWidgets import QStyledItemDelegate, QComboBox, QSpinBox, QWidget, QStyleOptionViewItem
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from src.core.team_metrics import TeamMetrics
+
+COLUMNS = ["Agent Name", "Attendance", "Leads", "Talk Time", "Dials Made", "Notes"]
+AGENT_COL, ATTENDANCE_COL, LEADS_COL, TALK_TIME_COL, DIALS_COL, NOTES_COL = range(len(COLUMNS))
+
+ATTENDANCE_OPTIONS = ['Office', 'Home', 'UPL']
+EDITABLE_COLUMNS = (ATTENDANCE_COL, LEADS_COL, NOTES_COL)
+
+# Column showing each metric, for incremental updates while loading
+METRIC_COLUMNS = {"talk_time": TALK_TIME_COL, "dials": DIALS_COL, "leads": LEADS_COL}
+
+
+class TeamTableModel(QAbstractTableModel):
+    """
+    Table model over a TeamMetrics table. Attendance, leads and notes
+    are edited in place in its columns; the view only creates an editor
+    widget for the cell currently being edited.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._team = TeamMetrics.empty()
+        # Rows whose leads the user typed in; later metric loads leave them alone
+        self._edited_leads = np.zeros(0, dtype=bool)
+
+    def set_team(self, team: TeamMetrics) -> None:
+        """Replace the table contents with `team` (used as is, not copied)."""
+        self.beginResetModel()
+        self._team = team
+        self._edited_leads = np.zeros(len(team), dtype=bool)
+        self.endResetModel()
+
+    def append_team(self, team: TeamMetrics) -> None:
+        """Add rows at the bottom without resetting the view or open editors."""
+        if not len(team):
+            return
+        first = len(self._team)
+        self.beginInsertRows(QModelIndex(), first, first + len(team) - 1)
+        self._team = TeamMetrics.concat([self._team, team])
+        self._edited_leads = np.concatenate([self._edited_leads, np.zeros(len(team), dtype=bool)])
+        self.endInsertRows()
+
+    def apply_metric(self, key: str, index: Dict[str, Any], default: Any) -> None:
+        """
+        Fill metric `key` for every row from an agent → value `index`,
+        e.g. once its file has been parsed. Leads the user already
+        edited by hand are kept.
+        """
+        column = getattr(self._team, key)
+        values = np.fromiter((index.get(agent, default) for agent in self._team.agent_name.tolist()),
+                             dtype=column.dtype, count=len(column))
+        if key == 'leads':
+            keep = self._edited_leads
+            column[~keep] = values[~keep]
+        else:
+            column[:] = values
+        if len(column):
+            col = METRIC_COLUMNS[key]
+            self.dataChanged.emit(self.index(0, col), self.index(len(column) - 1, col),
+                                  [Qt.DisplayRole, Qt.EditRole])
+
+    def team(self) -> TeamMetrics:
+        """Return a copy of the table, including the user's edits."""
+        return self._team.copy()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._team)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        team = self._team
+        row = index.row()
+        col = index.column()
+        if role == Qt.EditRole:
+            if col == ATTENDANCE_COL:
+                return team.attendance[row]
+            if col == LEADS_COL:
+                return int(team.leads[row])
+            if col == NOTES_COL:
+                return team.notes[row]
+            return None
+        if role == Qt.DisplayRole:
+            if col == AGENT_COL:
+                return team.agent_name[row]
+            if col == ATTENDANCE_COL:
+                return team.attendance[row]
+            if col == LEADS_COL:
+                return str(team.leads[row])
+            if col == TALK_TIME_COL:
+                return f"{team.talk_time[row]:.1f} min"
+            if col == DIALS_COL:
+                return str(team.dials[row])
+            if col == NOTES_COL:
+                return team.notes[row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if role != Qt.EditRole or not index.isValid() or index.column() not in EDITABLE_COLUMNS:
+            return False
+        row = index.row()
+        col = index.column()
+        if col == ATTENDANCE_COL:
+            if value not in ATTENDANCE_OPTIONS:
+                return False
+            self._team.attendance[row] = value
+        elif col == LEADS_COL:
+            self._team.leads[row] = int(value)
+            self._edited_leads[row] = True
+        else:
+            self._team.notes[row] = str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in EDITABLE_COLUMNS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+class AttendanceDelegate(QStyledItemDelegate):
+    """Office/Home/UPL drop-down, created only while the cell is edited."""
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index) -> QWidget:
+        combo = QComboBox(parent)
+        combo.addItems(ATTENDANCE_OPTIONS)
+        # Commit as soon as a choice is made, like the old always-on combo box
+        combo.activated.connect(lambda _: self.commitData.emit(combo))
+        return combo
+
+    def setEditorData(self, editor: QWidget, index) -> None:
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor: QWidget, model, index) -> None:
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+class LeadsDelegate(QStyledItemDelegate):
+    """0–999 spin box, created only while the cell is edited."""
+
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index) -> QWidget:
+        spin = QSpinBox(parent)
+        spin.setRange(0, 999)
+        return spin
+
+    def setEditorData(self, editor: QWidget, index) -> None:
+        editor.setValue(int(index.data(Qt.EditRole) or 0))
+
+    def setModelData(self, editor: QWidget, model, index) -> None:
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.EditRole)
+
+class NotesDelegate(QStyledItemDelegate):
+    """Free-text line edit (the default editor), created only while the cell is edited."""
+
+    def setModelData(self, editor: QWidget, model, index) -> None:
+        model.setData(index, editor.text().strip(), Qt.EditRole)
@@ -0,0 +1,23 @@
+# tests/conftest.py
+
+import pytest
+
+# Every local store, cache and report the app writes, kept out of the repo
+_PATH_VARS = {
+    "UPLOAD_JOURNAL_PATH": "upload_journal.sqlite",
+    "ROLLUP_STORE_PATH": "rollups.sqlite",
+    "ARCHIVE_INDEX_PATH": "archive_index.sqlite",
+    "METRICS_CACHE_DIR": "cache",
+    "PROCESSED_DIR": "processed",
+    "RUN_REPORT_DIR": "reports"
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """Point every store at a fresh temp dir and drop settings that change matching or tab creation."""
+    for var, name in _PATH_VARS.items():
+        monkeypatch.setenv(var, str(tmp_path / name))
+    for var in ("AGENT_ALIASES_FILE", "AGENT_TAB_TEMPLATE"):
+        monkeypatch.delenv(var, raising=False)
+    return tmp_path
@@ -0,0 +1,18 @@
+# tests/helpers.py
+
+from typing import Any, Dict, List
+from src.core.team_metrics import TeamMetrics
+
+
+def make_team(agents: List[str], date: str = "01/10/2026", **fields: Any) -> TeamMetrics:
+    """One row per agent on `date`, with small non-zero metrics unless overridden."""
+    record: Dict[str, Any] = {"date": date, "attendance": "Office", "leads": 1, "dials": 20,
+                              "talk_time": 90.0, "notes": ""}
+    record.update(fields)
+    return TeamMetrics.from_records([{"agent_name": agent, **record} for agent in agents])
+
+def write_csv(path, header: List[str], rows: List[List[Any]]) -> str:
+    """Write a CSV with `header` and `rows` to `path` and return it as a string path."""
+    lines = [",".join(header)] + [",".join(str(cell) for cell in row) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
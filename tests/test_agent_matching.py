@@ -0,0 +1,52 @@
+# tests/test_agent_matching.py
+
+import pytest
+from src.core.services.agent_data_service import process_agent_data
+from src.data.csv_reader.dials_reader import extract_dials
+from src.data.csv_reader.leads_reader import extract_leads
+from src.data.csv_reader.talk_time_reader import extract_talk_time
+
+# Export spellings of roster agents; "Kat Lee" is only known through the alias file
+EXPORT_ROWS = [("ann smith ", 120.5, 30, 3), ("ＢＯＢ  Jones", 45.0, 12, 1), ("Kat Lee", 10.0, 4, 2)]
+
+
+@pytest.fixture
+def exports(tmp_path, monkeypatch):
+    paths = {
+        "talk_time": tmp_path / "talk.csv",
+        "dials": tmp_path / "dials.csv",
+        "leads": tmp_path / "leads.csv"
+    }
+    paths["talk_time"].write_text("User Name,Sum of Duration in Minutes\n"
+                                  + "".join(f"{n},{t}\n" for n, t, _, _ in EXPORT_ROWS), encoding="utf-8")
+    paths["dials"].write_text("User Name,Distinct values of Started At\n"
+                              + "".join(f"{n},{d}\n" for n, _, d, _ in EXPORT_ROWS), encoding="utf-8")
+    paths["leads"].write_text("Sales Rep,Count\n"
+                              + "".join(f"{n},{l}\n" for n, _, _, l in EXPORT_ROWS), encoding="utf-8")
+    aliases = tmp_path / "aliases.csv"
+    aliases.write_text("Alias,Agent Name\nKat Lee,Katherine Lee\n", encoding="utf-8")
+    monkeypatch.setenv("AGENT_ALIASES_FILE", str(aliases))
+    return {kind: str(path) for kind, path in paths.items()}
+
+@pytest.mark.parametrize("agent, expected", [
+    ("Ann Smith", (120.5, 30, 3)),       # case and trailing space
+    ("Bob Jones", (45.0, 12, 1)),        # full-width letters (NFKC) and doubled space
+    ("Katherine Lee", (10.0, 4, 2)),     # alias
+    ("Nobody Here", (0.0, 0, 0))
+])
+def test_single_agent_readers_match_like_the_team_join(exports, agent, expected):
+    found = (
+        extract_talk_time(exports["talk_time"], agent),
+        extract_dials(exports["dials"], agent),
+        extract_leads(exports["leads"], agent)
+    )
+    assert found == expected
+
+    engine = process_agent_data(agent, exports["talk_time"], exports["dials"], exports["leads"])
+    assert (engine["talk_time"], engine["dials"], engine["leads"]) == expected
+
+def test_spellings_of_one_agent_are_added_up(tmp_path):
+    path = tmp_path / "dials.csv"
+    path.write_text("User Name,Distinct values of Started At\nAnn Smith,5\nANN SMITH,7\nBob,1\n", encoding="utf-8")
+
+    assert extract_dials(str(path), "ann smith") == 12
@@ -0,0 +1,39 @@
+# tests/test_archive.py
+
+import os
+from datetime import date, datetime
+from src.core.services.metrics_engine import build_metric_index, normalize_metric_index
+from src.data.file_manager.archive_index import get_archive_index
+from src.data.file_manager.file_manager import process_input_files
+from tests.helpers import write_csv
+
+
+def test_processed_exports_are_gzipped_and_indexed(tmp_path):
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    files = {
+        "team_members": write_csv(inputs / "team.csv", ["Agent Name"], [["Ann Smith"], ["Bob"]]),
+        "talk_time": write_csv(inputs / "talk.csv", ["User Name", "Sum of Duration in Minutes"],
+                               [["ann smith", 61.5], ["Zed", 3]]),
+        "dials": write_csv(inputs / "dials.csv", ["User Name", "Distinct values of Started At"], [["Bob", 9]]),
+        "leads": write_csv(inputs / "leads.csv", ["Sales Rep", "Count"], [["Ann Smith", 2]])
+    }
+    fresh = build_metric_index(files["talk_time"], files["dials"], files["leads"], use_cache=False)
+
+    team = process_input_files(files, datetime(2026, 10, 1, 18, 30))
+
+    assert team.date.tolist() == ["01/10/2026", "01/10/2026"]
+    day_dir = tmp_path / "processed" / "2026-10-01"
+    assert sorted(os.listdir(day_dir)) == ["dials.csv.gz", "leads.csv.gz", "talk.csv.gz"]
+    # The exports move into the archive; the roster stays put
+    assert sorted(os.listdir(inputs)) == ["team.csv"]
+
+    archive = get_archive_index()
+    assert archive.files_for_day(date(2026, 10, 1)) == {
+        kind: str(day_dir / f"{name}.csv.gz") for kind, name in (("talk_time", "talk"), ("dials", "dials"), ("leads", "leads"))
+    }
+    # Round trip: the stored metrics, and the archived files re-parsed, match the day as processed
+    assert normalize_metric_index(archive.metrics_for_day(date(2026, 10, 1))) == fresh
+    archived = archive.files_for_day(date(2026, 10, 1))
+    assert build_metric_index(archived["talk_time"], archived["dials"], archived["leads"], use_cache=False) == fresh
+    assert archive.agent_history("ann smith", date(2026, 9, 1), date(2026, 10, 31)) == [(date(2026, 10, 1), 61.5, 0, 2)]
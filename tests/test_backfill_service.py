@@ -0,0 +1,64 @@
+# tests/test_backfill_service.py
+
+import gzip
+from datetime import date
+from src.core.instrumentation import finish_run, start_run
+from src.core.services.backfill_service import backfill_team_data
+from src.data.file_manager.archive_index import get_archive_index
+from tests.helpers import write_csv
+
+TALK_HEADER = ["User Name", "Sum of Duration in Minutes"]
+DIALS_HEADER = ["User Name", "Distinct values of Started At"]
+
+
+def _archive_legacy_day(processed, day: str, talk_rows, dials_rows) -> None:
+    """A day folder as archived before the index existed: talk time plain, dials gzipped."""
+    folder = processed / day
+    folder.mkdir(parents=True)
+    write_csv(folder / "talk_export.csv", TALK_HEADER, talk_rows)
+    plain = write_csv(folder / "dials_export.tmp", DIALS_HEADER, dials_rows)
+    with open(plain, "rb") as src, gzip.open(folder / "dials_export.csv.gz", "wb") as dst:
+        dst.write(src.read())
+    (folder / "dials_export.tmp").unlink()
+
+def test_mixed_indexed_and_legacy_days_are_stamped_with_their_own_date(tmp_path):
+    processed = tmp_path / "processed"
+    _archive_legacy_day(processed, "2026-10-01", [["Ann", 60], ["Bob", 30]], [["Ann", 10], ["Bob", 5]])
+    # Indexed day: no folder needed
+    archive = get_archive_index()
+    archive.record_day(date(2026, 10, 2), {
+        "ann": {"agent_name": "Ann", "talk_time": 15.0, "dials": 3, "leads": 1}
+    }, {})
+    # Missing its dials export
+    (processed / "2026-10-03").mkdir()
+    write_csv(processed / "2026-10-03" / "talk.csv", TALK_HEADER, [["Ann", 1]])
+    # Outside the range
+    _archive_legacy_day(processed, "2026-09-01", [["Ann", 99]], [["Ann", 99]])
+
+    records, errors = backfill_team_data(str(processed), ["Ann", "Bob"], date(2026, 10, 1), date(2026, 10, 3),
+                                         max_workers=1, archive=archive)
+
+    assert records.date.tolist() == ["01/10/2026", "01/10/2026", "02/10/2026", "02/10/2026"]
+    assert records.agent_name.tolist() == ["Ann", "Bob", "Ann", "Bob"]
+    assert records.talk_time.tolist() == [60.0, 30.0, 15.0, 0.0]
+    assert records.dials.tolist() == [10, 5, 3, 0]
+    assert list(errors) == [date(2026, 10, 3)] and "dials" in errors[date(2026, 10, 3)]
+    # The legacy day is indexed now, so the next backfill skips parsing it
+    assert archive.days(date(2026, 10, 1), date(2026, 10, 3)) == [date(2026, 10, 1), date(2026, 10, 2)]
+    assert set(archive.files_for_day(date(2026, 10, 1))) == {"talk_time", "dials"}
+
+def test_unmatched_names_are_reported_once_for_the_range(tmp_path):
+    processed = tmp_path / "processed"
+    _archive_legacy_day(processed, "2026-10-01", [["Ann", 60], ["Zed", 1]], [["Ann", 10]])
+    _archive_legacy_day(processed, "2026-10-02", [["Ann", 30], ["Bob", 5]], [["Ann", 4]])
+    run = start_run("test")
+    try:
+        backfill_team_data(str(processed), ["Ann", "Bob", "Cat"], date(2026, 10, 1), date(2026, 10, 2), max_workers=1)
+    finally:
+        finish_run(run)
+
+    # Bob is only absent on the 1st; Cat is in no export at all
+    assert run.notes["unmatched_roster"] == ["Cat"]
+    assert run.notes["unmatched_exports"] == ["Zed"]
+    assert run.counters["join.unmatched_roster"] == 1
+    assert run.counters["join.unmatched_exports"] == 1
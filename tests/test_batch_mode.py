@@ -0,0 +1,89 @@
+# tests/test_batch_mode.py
+
+import argparse, json
+import pytest
+from datetime import datetime
+from benchmarks.fake_sheets import FakeSpreadsheet
+from src.data.csv_reader.attendance_reader import apply_attendance, load_attendance
+from src.data.sheets_client import sheets_client
+from src.data.sheets_client.sheets_client import SheetsClient
+from src.ui.cli import cli
+from tests.helpers import make_team, write_csv
+
+
+def test_side_file_problems_are_reported_together(tmp_path):
+    path = write_csv(tmp_path / "attendance.csv", ["Agent Name", "Attendance", "Leads"], [
+        ["Ann", "Office", "2"],
+        ["", "Home", ""],
+        ["Bob", "Sick", ""],
+        ["Ann", "Home", ""],
+        ["Cat", "UPL", "-1"],
+    ])
+
+    with pytest.raises(RuntimeError) as e:
+        load_attendance(path)
+    message = str(e.value)
+    assert "row 2 (no agent): blank agent name" in message
+    assert "row 3 (Bob): unknown attendance 'Sick'" in message
+    assert "row 4 (Ann): agent listed twice" in message
+    assert "row 5 (Cat): leads must be a whole number" in message
+
+def test_json_side_file_overrides_matched_agents(tmp_path):
+    path = tmp_path / "attendance.json"
+    path.write_text(json.dumps([
+        {"agent_name": "  ann SMITH ", "attendance": "Home", "leads": 4, "notes": "late"},
+        {"agent_name": "Zoe", "attendance": "UPL"},
+    ]), encoding="utf-8")
+    team = make_team(["Ann Smith", "Bob"], leads=1)
+
+    unknown = apply_attendance(team, load_attendance(str(path)), "Office")
+
+    assert unknown == ["Zoe"]
+    assert team.attendance.tolist() == ["Home", "Office"]
+    assert team.leads.tolist() == [4, 1]
+    assert team.notes.tolist() == ["late", ""]
+
+def test_problems_checks_every_row():
+    team = make_team(["Ann", "Ann", "", "Bob"])
+    team.attendance[3] = "Sick"
+    team.dials[3] = -1
+
+    problems = team.problems()
+
+    assert ": blank agent name" in problems
+    assert "Bob: attendance must be one of Office/Home/UPL" in problems
+    assert "Bob: negative talk time, dials or leads" in problems
+    assert "Ann: more than one row for 01/10/2026" in problems
+    assert make_team(["Ann", "Bob"]).problems() == []
+
+@pytest.fixture
+def fake(monkeypatch, tmp_path):
+    fake = FakeSpreadsheet(["Ann", "Bob"])
+    monkeypatch.setenv("GOOGLE_SHEETS_TEMPLATE_ID", "sheet")
+    monkeypatch.setitem(sheets_client._clients, "sheet", SheetsClient("sheet", fake))
+    for name in ("LEADS_DIR", "TALK_TIME_DIR", "DIALS_DIR", "TEAM_DIR"):
+        monkeypatch.setenv(name, str(tmp_path))
+    return fake
+
+def _batch_args(attendance_file=None) -> argparse.Namespace:
+    return argparse.Namespace(metabase=False, verify=False, batch=True,
+                              attendance_file=attendance_file, attendance="Office")
+
+def test_batch_run_uploads_the_whole_team_without_prompts(fake, monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "process_daily_files", lambda *dirs: make_team(["Ann", "Bob"], date="", attendance=""))
+    monkeypatch.setattr("builtins.input", lambda *a: pytest.fail("batch mode prompted"))
+    side_file = write_csv(tmp_path / "attendance.csv", ["Agent Name", "Attendance"], [["Bob", "UPL"]])
+
+    assert cli.run(_batch_args(side_file))
+
+    today = datetime.now().strftime("%d/%m/%Y")
+    assert fake._sheets["Ann"].values[-1][:2] == [today, "Office"]
+    assert fake._sheets["Bob"].values[-1][:2] == [today, "UPL"]
+
+def test_batch_run_with_invalid_rows_uploads_nothing(fake, monkeypatch):
+    monkeypatch.setattr(cli, "process_daily_files", lambda *dirs: make_team(["Ann", "Ann", "Bob"]))
+
+    assert not cli.run(_batch_args())
+
+    assert fake.calls["values_batch_update"] == fake.calls["values_append"] == 0
+    assert len(fake._sheets["Ann"].values) == len(fake._sheets["Bob"].values) == 1
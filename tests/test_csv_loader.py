@@ -0,0 +1,51 @@
+# tests/test_csv_loader.py
+
+import gzip
+import pytest
+from src.data.csv_reader import csv_loader
+from src.data.csv_reader.csv_loader import iter_columns, iter_csv_columns, read_csv_header
+
+HEADER = "Extra,User Name,Notes,Sum of Duration in Minutes"
+
+
+def _write_gz(path, text: str) -> str:
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return str(path)
+
+def test_only_the_requested_columns_are_yielded_in_order(tmp_path):
+    path = tmp_path / "talk.csv"
+    path.write_text(f'{HEADER}\nx,Ann,"a, quoted note",12.5\n\ny,Bob\n', encoding="utf-8")
+
+    rows = list(iter_csv_columns(str(path), ["Sum of Duration in Minutes", "User Name"]))
+
+    # Blank lines are skipped and short rows padded
+    assert rows == [("12.5", "Ann"), ("", "Bob")]
+
+def test_missing_columns_fail_before_any_row_is_read(tmp_path):
+    path = tmp_path / "talk.csv"
+    path.write_text("User Name,Minutes\nAnn,1\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="Sum of Duration in Minutes"):
+        iter_csv_columns(str(path), ["User Name", "Sum of Duration in Minutes"])
+
+def test_gz_source_is_read_and_closed_when_the_caller_stops_early(tmp_path, monkeypatch):
+    body = HEADER + "\n" + "".join(f"x,Agent {i},,{i}\n" for i in range(10_000))
+    path = _write_gz(tmp_path / "talk.csv.gz", body)
+    assert read_csv_header(path) == HEADER.split(",")
+    opened = []
+    open_csv = csv_loader.open_csv
+    monkeypatch.setattr(csv_loader, "open_csv", lambda p: opened.append(open_csv(p)) or opened[-1])
+
+    rows = iter_csv_columns(path, ["User Name"])
+    first = [next(rows) for _ in range(3)]
+    assert not opened[0].closed
+    rows.close()
+
+    assert first == [("Agent 0",), ("Agent 1",), ("Agent 2",)]
+    assert opened[0].closed
+
+def test_iter_columns_streams_any_line_source():
+    lines = iter([HEADER + "\n", "x,Ann,,3\n", "y,Bob,,4\n"])
+
+    assert list(iter_columns(lines, ["User Name"])) == [("Ann",), ("Bob",)]
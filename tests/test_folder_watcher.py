@@ -0,0 +1,64 @@
+# tests/test_folder_watcher.py
+
+import os
+import pytest
+from src.data.file_manager.folder_watcher import FolderWatcher
+
+
+@pytest.fixture
+def folders(tmp_path):
+    paths = {}
+    for key in ("talk_time", "dials"):
+        paths[key] = tmp_path / key
+        paths[key].mkdir()
+    return paths
+
+def _watcher(folders, settle_seconds: float) -> FolderWatcher:
+    return FolderWatcher({key: str(path) for key, path in folders.items()}, settle_seconds,
+                         poll_interval=0.01, use_notifications=False)
+
+def test_file_settles_once_unchanged_between_polls(folders):
+    (folders["talk_time"] / "talk.csv").write_text("a", encoding="utf-8")
+    watcher = _watcher(folders, settle_seconds=0)
+
+    assert watcher.poll() == ({}, {})
+    settled, _ = watcher.poll()
+
+    assert settled == {"talk_time": str(folders["talk_time"] / "talk.csv")}
+    assert watcher.present() == {"talk_time"}
+
+def test_file_still_being_written_is_present_but_not_settled(folders):
+    path = folders["dials"] / "dials.csv"
+    path.write_text("a", encoding="utf-8")
+    watcher = _watcher(folders, settle_seconds=0)
+    watcher.poll()
+
+    # Grows between polls: its settle clock starts over
+    path.write_text("ab", encoding="utf-8")
+    settled, _ = watcher.poll()
+
+    assert settled == {}
+    assert watcher.present() == {"dials"}
+
+def test_file_changed_after_settling_is_not_unchanged(folders):
+    path = folders["talk_time"] / "talk.csv"
+    path.write_text("a", encoding="utf-8")
+    watcher = _watcher(folders, settle_seconds=0)
+    watcher.poll()
+    settled, _ = watcher.poll()
+    assert watcher.unchanged(settled)
+
+    path.write_text("replaced", encoding="utf-8")
+    assert not watcher.unchanged(settled)
+    os.remove(path)
+    assert not watcher.unchanged(settled)
+
+def test_folder_with_several_csvs_is_a_problem(folders):
+    for name in ("a.csv", "b.csv"):
+        (folders["talk_time"] / name).write_text("x", encoding="utf-8")
+    watcher = _watcher(folders, settle_seconds=0)
+
+    _, problems = watcher.poll()
+
+    assert list(problems) == ["talk_time"] and "a.csv" in problems["talk_time"]
+    assert watcher.present() == set()
@@ -0,0 +1,81 @@
+# tests/test_index_cache.py
+
+import os
+from src.data.csv_reader.index_cache import cached_index
+
+
+class CountingBuild:
+    """A `build` callback that records the paths it parsed."""
+
+    def __init__(self):
+        self.paths = []
+
+    def __call__(self, path: str) -> dict:
+        self.paths.append(path)
+        with open(path, encoding="utf-8") as f:
+            return {"text": f.read()}
+
+def _entries(cache_dir, kind: str) -> list:
+    return [name for name in os.listdir(cache_dir) if f"-{kind}-" in name]
+
+def test_unchanged_file_is_parsed_once(tmp_path):
+    source = tmp_path / "talk.csv"
+    source.write_text("a", encoding="utf-8")
+    build = CountingBuild()
+
+    first = cached_index("talk_time", str(source), build, cache_dir=str(tmp_path / "cache"))
+    second = cached_index("talk_time", str(source), build, cache_dir=str(tmp_path / "cache"))
+
+    assert first == second == {"text": "a"}
+    assert len(build.paths) == 1
+
+def test_changed_contents_are_parsed_again(tmp_path):
+    source = tmp_path / "talk.csv"
+    source.write_text("a", encoding="utf-8")
+    build = CountingBuild()
+    cached_index("talk_time", str(source), build, cache_dir=str(tmp_path / "cache"))
+
+    source.write_text("bb", encoding="utf-8")
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cached_index("talk_time", str(source), build, cache_dir=str(tmp_path / "cache")) == {"text": "bb"}
+    assert len(build.paths) == 2
+
+def test_touched_file_with_same_contents_still_hits(tmp_path):
+    source = tmp_path / "talk.csv"
+    source.write_text("a", encoding="utf-8")
+    build = CountingBuild()
+    cached_index("talk_time", str(source), build, cache_dir=str(tmp_path / "cache"))
+
+    # New mtime, same bytes: the contents hash finds the old entry
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cached_index("talk_time", str(source), build, cache_dir=str(tmp_path / "cache"))
+
+    assert len(build.paths) == 1
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache_dir = tmp_path / "cache"
+    build = CountingBuild()
+    sources = {}
+    for kind in ("a", "b", "c"):
+        sources[kind] = tmp_path / f"{kind}.csv"
+        sources[kind].write_text(kind * 100, encoding="utf-8")
+
+    cached_index("a", str(sources["a"]), build, cache_dir=str(cache_dir))
+    (entry_a,) = _entries(cache_dir, "a")
+    entry_size = os.path.getsize(cache_dir / entry_a)
+    limit = int(entry_size * 2.5)
+    cached_index("b", str(sources["b"]), build, cache_dir=str(cache_dir), max_bytes=limit)
+    # Age both entries, then use "a" again so "b" is the least recently used
+    for name in _entries(cache_dir, "a") + _entries(cache_dir, "b"):
+        os.utime(cache_dir / name, (1, 1))
+    cached_index("a", str(sources["a"]), build, cache_dir=str(cache_dir), max_bytes=limit)
+
+    cached_index("c", str(sources["c"]), build, cache_dir=str(cache_dir), max_bytes=limit)
+
+    assert _entries(cache_dir, "a") and _entries(cache_dir, "c")
+    assert not _entries(cache_dir, "b")
+    cached_index("b", str(sources["b"]), build, cache_dir=str(cache_dir), max_bytes=limit)
+    assert [os.path.basename(p) for p in build.paths] == ["a.csv", "b.csv", "c.csv", "b.csv"]
@@ -0,0 +1,30 @@
+# tests/test_main_window.py
+
+import os
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtWidgets import QApplication
+from src.ui.gui.main_window import MainWindow
+
+
+@pytest.fixture
+def window():
+    app = QApplication.instance() or QApplication([])
+    window = MainWindow()
+    window.file_paths.update(talk_time="talk.csv", dials_made="dials.csv")
+    yield window
+    window.close()
+
+def test_load_waits_for_a_running_upload(window):
+    window.check_ready_to_load()
+    assert window.load_button.isEnabled()
+
+    window.uploading = True
+    # Picking another file mid-upload must not re-enable loading
+    window.check_ready_to_load()
+    assert not window.load_button.isEnabled()
+
+    window.upload_thread_finished()
+    assert window.load_button.isEnabled()
@@ -0,0 +1,48 @@
+# tests/test_metabase_client.py
+
+import pytest
+from src.data.metabase_client.fake_server import FakeMetabaseServer
+from src.data.metabase_client.metabase_client import MetabaseClient, fetch_metric_index
+
+TALK_TIME_CSV = "User Name,Sum of Duration in Minutes\nAnn Smith,120.5\nBob Jones,45\n"
+# Same agents spelled the way another export spells them
+DIALS_CSV = "User Name,Distinct values of Started At\nann  smith ,30\nBOB JONES,12\n"
+LEADS_CSV = "Sales Rep,Count\nAnn Smith,3\n"
+
+
+@pytest.fixture
+def cards(tmp_path):
+    paths = {}
+    for card_id, body in ((101, TALK_TIME_CSV), (102, DIALS_CSV), (103, LEADS_CSV)):
+        path = tmp_path / f"card_{card_id}.csv"
+        path.write_text(body, encoding="utf-8")
+        paths[card_id] = str(path)
+    return paths
+
+def test_fetch_metric_index_merges_cards_by_normalized_name(cards):
+    with FakeMetabaseServer(cards) as server:
+        client = MetabaseClient(server.url, api_key=server.api_key)
+        index = fetch_metric_index(client, {"talk_time": 101, "dials": 102, "leads": 103})
+
+    assert index == {
+        "ann smith": {"agent_name": "Ann Smith", "talk_time": 120.5, "dials": 30, "leads": 3},
+        "bob jones": {"agent_name": "Bob Jones", "talk_time": 45.0, "dials": 12, "leads": 0}
+    }
+
+def test_fetch_metric_index_without_leads_card_logs_in_once(cards):
+    with FakeMetabaseServer(cards) as server:
+        client = MetabaseClient(server.url, username=server.username, password=server.password)
+        index = fetch_metric_index(client, {"talk_time": 101, "dials": 102})
+        # One login shared by both card requests
+        assert len(server.sessions) == 1
+        assert server.requests == 3
+
+    assert {key: entry["leads"] for key, entry in index.items()} == {"ann smith": 0, "bob jones": 0}
+
+def test_fetch_metric_index_rejects_a_card_with_wrong_columns(cards, tmp_path):
+    wrong = tmp_path / "wrong.csv"
+    wrong.write_text("Agent,Minutes\nAnn Smith,1\n", encoding="utf-8")
+    with FakeMetabaseServer({**cards, 101: str(wrong)}) as server:
+        client = MetabaseClient(server.url, api_key=server.api_key)
+        with pytest.raises(RuntimeError, match="Missing expected columns"):
+            fetch_metric_index(client, {"talk_time": 101, "dials": 102})
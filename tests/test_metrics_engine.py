@@ -0,0 +1,71 @@
+# tests/test_metrics_engine.py
+
+import pytest
+from src.core.services import metrics_engine
+from src.core.services.metrics_engine import build_metric_index, load_inputs, resolve_team, validate_input_headers
+from src.core.services.team_data_service import process_team_data
+from tests.helpers import write_csv
+
+
+def test_team_join_keeps_roster_order_and_zero_fills_missing_agents(tmp_path):
+    team = write_csv(tmp_path / "team.csv", ["Agent Name"], [["Cat"], ["Ann"], ["Bob"]])
+    talk = write_csv(tmp_path / "talk.csv", ["User Name", "Sum of Duration in Minutes"], [["Ann", 61.5], ["Bob", 30]])
+    dials = write_csv(tmp_path / "dials.csv", ["User Name", "Distinct values of Started At"], [["Ann", 40]])
+
+    table = process_team_data(team, talk, dials)
+
+    assert table.agent_name.tolist() == ["Cat", "Ann", "Bob"]
+    assert table.talk_time.tolist() == [0.0, 61.5, 30.0]
+    assert table.dials.tolist() == [0, 40, 0]
+    # No leads export → every agent has 0 leads
+    assert table.leads.tolist() == [0, 0, 0]
+
+def test_first_row_per_agent_wins_within_an_export(tmp_path):
+    talk = write_csv(tmp_path / "talk.csv", ["User Name", "Sum of Duration in Minutes"], [["Ann", 10], ["Ann", 99]])
+    dials = write_csv(tmp_path / "dials.csv", ["User Name", "Distinct values of Started At"], [["Ann", 2]])
+    leads = write_csv(tmp_path / "leads.csv", ["Sales Rep", "Count"], [["Ann", 1], ["Zed", 4]])
+
+    index = build_metric_index(talk, dials, leads)
+
+    assert index["ann"] == {"agent_name": "Ann", "talk_time": 10.0, "dials": 2, "leads": 1}
+    # Agents in only one export still get an entry, zero elsewhere
+    assert index["zed"] == {"agent_name": "Zed", "talk_time": 0.0, "dials": 0, "leads": 4}
+
+def test_resolve_team_defaults_agents_absent_from_the_index():
+    index = {"ann": {"agent_name": "Ann", "talk_time": 5.0, "dials": 3, "leads": 1}}
+
+    table = resolve_team(["Ann", "Nobody"], index, aliases={}, report=False)
+
+    assert [table.record(i)["dials"] for i in range(2)] == [3, 0]
+    assert table.attendance.tolist() == ["Office", "Office"]
+
+def test_bad_headers_in_several_files_fail_together_before_any_parse(tmp_path, monkeypatch):
+    team = write_csv(tmp_path / "team.csv", ["Name"], [["Ann"]])
+    talk = write_csv(tmp_path / "talk.csv", ["User Name", "Sum of Duration in Minutes"], [["Ann", 10]])
+    dials = write_csv(tmp_path / "dials.csv", ["User Name", "Dials"], [["Ann", 2]])
+    monkeypatch.setattr(metrics_engine, "_parse_input", lambda *a: pytest.fail("parsed despite bad headers"))
+
+    with pytest.raises(RuntimeError) as e:
+        load_inputs({"team_members": team, "talk_time": talk, "dials": dials, "leads": None})
+    message = str(e.value)
+    assert message.startswith("Invalid input files:")
+    assert "team_members (team.csv): missing expected columns ['Agent Name']" in message
+    assert "dials (dials.csv): missing expected columns ['Distinct values of Started At']" in message
+    assert "talk_time" not in message
+
+def test_unreadable_input_is_reported_with_the_others(tmp_path):
+    talk = write_csv(tmp_path / "talk.csv", ["User Name", "Sum of Duration in Minutes"], [["Ann", 10]])
+
+    problems = validate_input_headers({"talk_time": talk, "leads": str(tmp_path / "missing.csv")})
+
+    assert len(problems) == 1 and problems[0].startswith("leads (missing.csv): ")
+
+def test_inputs_load_together(tmp_path):
+    team = write_csv(tmp_path / "team.csv", ["Agent Name"], [["Ann"], ["Bob"]])
+    talk = write_csv(tmp_path / "talk.csv", ["User Name", "Sum of Duration in Minutes"], [["Ann", 10]])
+    dials = write_csv(tmp_path / "dials.csv", ["User Name", "Distinct values of Started At"], [["Bob", 2]])
+
+    loaded = load_inputs({"team_members": team, "talk_time": talk, "dials": dials, "leads": None})
+
+    assert sorted(loaded) == ["dials", "talk_time", "team_members"]
+    assert loaded["team_members"] == ["Ann", "Bob"]
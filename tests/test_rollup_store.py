@@ -0,0 +1,79 @@
+# tests/test_rollup_store.py
+
+from benchmarks.fake_sheets import FakeSpreadsheet
+from src.data.sheets_client.rollup_store import get_rollup_store
+from src.data.sheets_client.sheets_client import SUMMARY_HEADER, SheetsClient, push_summary
+from tests.helpers import make_team
+
+
+def _rollup(store, period: str, agent: str = "Ann") -> dict:
+    (row,) = [r for r in store.summary("sheet") if r["period"] == period and r["agent"] == agent]
+    return row
+
+def test_days_add_up_per_week_and_month():
+    store = get_rollup_store()
+    # Thursday and Friday of ISO week 40
+    store.record("sheet", make_team(["Ann"], "01/10/2026", talk_time=60.0, dials=10, leads=1))
+    store.record("sheet", make_team(["Ann"], "02/10/2026", talk_time=30.0, dials=5, leads=2, attendance="UPL"))
+
+    week = _rollup(store, "week")
+    assert (week["period_key"], week["period_start"]) == ("2026-W40", "2026-09-28")
+    assert (week["days"], week["present_days"], week["talk_time"], week["dials"], week["leads"]) == (2, 1, 90.0, 15, 3)
+    month = _rollup(store, "month")
+    assert (month["period_key"], month["days"], month["dials"]) == ("2026-10", 2, 15)
+
+def test_rewriting_a_day_applies_only_the_difference():
+    store = get_rollup_store()
+    store.record("sheet", make_team(["Ann"], "01/10/2026", talk_time=60.0, dials=10, leads=1))
+    store.record("sheet", make_team(["Ann"], "02/10/2026", talk_time=30.0, dials=5, leads=0))
+    # 01/10 uploaded again with corrected figures and attendance
+    store.record("sheet", make_team(["Ann"], "01/10/2026", talk_time=75.0, dials=8, leads=4, attendance="UPL"))
+
+    for period in ("week", "month"):
+        rollup = _rollup(store, period)
+        assert (rollup["days"], rollup["present_days"]) == (2, 1)
+        assert (rollup["talk_time"], rollup["dials"], rollup["leads"]) == (105.0, 13, 4)
+
+def test_rewriting_the_same_figures_changes_nothing():
+    store = get_rollup_store()
+    team = make_team(["Ann", "Bob"], "01/10/2026")
+    store.record("sheet", team)
+    before = store.summary("sheet")
+    store.record("sheet", team)
+
+    assert store.summary("sheet") == before
+
+def test_spreadsheets_are_kept_apart():
+    store = get_rollup_store()
+    store.record("sheet", make_team(["Ann"], "01/10/2026", dials=10))
+    store.record("other-sheet", make_team(["Ann"], "01/10/2026", dials=3))
+
+    assert _rollup(store, "week")["dials"] == 10
+    assert [r["dials"] for r in store.summary("other-sheet")] == [3, 3]
+
+def _two_agents_two_days():
+    store = get_rollup_store()
+    store.record("fake-spreadsheet", make_team(["Ann", "Bob"], "01/10/2026", dials=10))
+    store.record("fake-spreadsheet", make_team(["Ann", "Bob"], "02/10/2026", dials=5))
+    return store
+
+def test_summary_tab_is_created_when_missing():
+    fake = FakeSpreadsheet(["Ann", "Bob"])
+    written = push_summary(_two_agents_two_days(), SheetsClient("fake-spreadsheet", fake))
+
+    assert written == 4
+    summary = fake._sheets["Summary"].values
+    assert summary[0] == SUMMARY_HEADER
+    assert sorted(row[2] for row in summary[1:]) == ["Ann", "Ann", "Bob", "Bob"]
+    assert (fake.calls["add_worksheet"], fake.calls["values_batch_update"]) == (1, 2)
+
+def test_short_summary_tab_grows_before_the_write():
+    fake = FakeSpreadsheet(["Ann", "Bob", "Summary"])
+    fake._sheets["Summary"].row_count = 2
+    written = push_summary(_two_agents_two_days(), SheetsClient("fake-spreadsheet", fake))
+
+    assert written == 4
+    assert fake._sheets["Summary"].row_count >= 5
+    assert fake._sheets["Summary"].values[0] == SUMMARY_HEADER
+    assert [row[6] for row in fake._sheets["Summary"].values[1:]] == ["15"] * 4
+    assert (fake.calls["add_worksheet"], fake.calls["batch_update"], fake.calls["values_batch_update"]) == (0, 1, 2)
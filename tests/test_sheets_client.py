@@ -0,0 +1,110 @@
+# tests/test_sheets_client.py
+
+import pytest
+from benchmarks.fake_sheets import FakeSpreadsheet
+from src.data.sheets_client.sheets_client import SheetsClient, install_format_rules, update_sheets_for_team
+from src.data.sheets_client.upload_journal import get_journal
+from tests.helpers import make_team
+
+
+def _dates(fake: FakeSpreadsheet, title: str) -> list:
+    """Column A of a fake tab, header excluded."""
+    return [row[0] if row else "" for row in fake._sheets[title].values[1:]]
+
+@pytest.fixture
+def fake():
+    return FakeSpreadsheet(["Ann", "Bob"], history_rows=3)
+
+def test_rows_land_after_the_last_row(fake):
+    results = update_sheets_for_team(make_team(["Ann", "Bob"]), SheetsClient("sheet", fake))
+
+    assert all(r["success"] and not r["skipped"] for r in results)
+    assert _dates(fake, "Ann") == ["01/01/2025"] * 3 + ["01/10/2026"]
+    assert fake._sheets["Bob"].values[-1][:3] == ["01/10/2026", "Office", "1"]
+
+def test_full_tab_grows_before_values_are_written():
+    fake = FakeSpreadsheet(["Ann"], history_rows=999)
+    assert fake._sheets["Ann"].row_count == 1000
+
+    results = update_sheets_for_team(make_team(["Ann"]), SheetsClient("sheet", fake))
+
+    assert results[0]["success"]
+    assert fake._sheets["Ann"].row_count == 1001
+    assert _dates(fake, "Ann")[-1] == "01/10/2026"
+
+def test_unformatted_tabs_get_their_cells_coloured(fake):
+    update_sheets_for_team(make_team(["Ann"]), SheetsClient("sheet", fake))
+
+    assert fake.calls["batch_update"] == 1
+    # Attendance (B) and Leads (C) of the new row, 0-based row 4
+    assert set(fake._sheets["Ann"].formats) == {(4, 1), (4, 2)}
+
+def test_rows_added_by_hand_are_not_overwritten(fake):
+    client = SheetsClient("sheet", fake)
+    update_sheets_for_team(make_team(["Ann"], "01/10/2026"), client)
+    fake._sheets["Ann"].values.append(["30/09/2026", "Home", "0", "5", "00:10:00", "added by hand"])
+
+    update_sheets_for_team(make_team(["Ann"], "02/10/2026"), client)
+
+    assert _dates(fake, "Ann")[-3:] == ["01/10/2026", "30/09/2026", "02/10/2026"]
+    assert fake._sheets["Ann"].values[-2][-1] == "added by hand"
+
+def test_cold_session_reads_only_the_tail_the_journal_knows(fake, monkeypatch):
+    journal = get_journal()
+    update_sheets_for_team(make_team(["Ann"], "01/10/2026"), SheetsClient("sheet", fake), journal)
+
+    ranges = []
+    values_batch_get = fake.values_batch_get
+    monkeypatch.setattr(fake, "values_batch_get", lambda r, params=None: ranges.extend(r) or values_batch_get(r, params))
+    update_sheets_for_team(make_team(["Ann"], "02/10/2026"), SheetsClient("sheet", fake), journal)
+
+    # The 01/10 row went to row 5, so the next read starts at row 6
+    assert ranges == ["'Ann'!A6:A"]
+    assert _dates(fake, "Ann")[-2:] == ["01/10/2026", "02/10/2026"]
+
+def test_journal_skips_rows_already_written(fake):
+    journal = get_journal()
+    update_sheets_for_team(make_team(["Ann", "Bob"]), SheetsClient("sheet", fake), journal)
+    fake.calls.clear()
+
+    # A re-run with a fresh session touches nothing
+    results = update_sheets_for_team(make_team(["Ann", "Bob"]), SheetsClient("sheet", fake), journal)
+
+    assert all(r["success"] and r["skipped"] for r in results)
+    assert fake.total_calls == 0
+    assert _dates(fake, "Ann").count("01/10/2026") == 1
+
+def test_verify_skips_dates_already_on_the_tab(fake):
+    update_sheets_for_team(make_team(["Ann"]), SheetsClient("sheet", fake))
+
+    team = make_team(["Ann", "Ann"])
+    team.date[1] = "02/10/2026"
+    results = update_sheets_for_team(team, SheetsClient("sheet", fake), verify=True)
+
+    assert [r["skipped"] for r in results] == [True, False]
+    assert _dates(fake, "Ann")[-2:] == ["01/10/2026", "02/10/2026"]
+
+def test_agents_without_a_tab_fail_alone(fake):
+    results = update_sheets_for_team(make_team(["Ann", "Zoe"]), SheetsClient("sheet", fake))
+
+    assert results[0]["success"]
+    assert not results[1]["success"] and "Zoe" in results[1]["error"]
+
+def test_missing_tabs_are_copied_from_the_template():
+    fake = FakeSpreadsheet(["Template"])
+    results = update_sheets_for_team(make_team(["Zoe"]), SheetsClient("sheet", fake))
+
+    assert results[0]["success"]
+    assert fake._sheets["Zoe"].values[0][0] == "Date"
+    assert _dates(fake, "Zoe") == ["01/10/2026"]
+
+def test_formatted_tabs_get_values_only(fake):
+    client = SheetsClient("sheet", fake)
+    assert install_format_rules(["Ann", "Bob"], client) == 6
+    fake.calls.clear()
+
+    update_sheets_for_team(make_team(["Ann", "Bob"]), client)
+
+    assert "batch_update" not in fake.calls
+    assert fake.calls["values_batch_update"] == 1
+    assert not fake._sheets["Ann"].formats
@@ -0,0 +1,43 @@
+# tests/test_team_loading.py
+
+import pytest
+
+pytest.importorskip("PySide6")
+from src.ui.gui.main_window import TeamDataLoadingThread
+from tests.helpers import write_csv
+
+
+def _run_load(file_paths) -> dict:
+    """Run the loader on this thread and collect what it emits."""
+    thread = TeamDataLoadingThread(file_paths)
+    emitted = {"rows": [], "metrics": [], "complete": []}
+    thread.rows_loaded.connect(emitted["rows"].append)
+    thread.metric_loaded.connect(lambda key, values, default: emitted["metrics"].append((key, values)))
+    thread.load_complete.connect(lambda ok, message: emitted["complete"].append((ok, message)))
+    thread.load()
+    return emitted
+
+@pytest.fixture
+def inputs(tmp_path):
+    return {
+        "team_members": write_csv(tmp_path / "team.csv", ["Agent Name"], [["Ann"], ["Bob"]]),
+        "talk_time": write_csv(tmp_path / "talk.csv", ["User Name", "Sum of Duration in Minutes"], [["ann", 12.5]]),
+        "dials_made": write_csv(tmp_path / "dials.csv", ["User Name", "Distinct values of Started At"], [["Bob", 7]]),
+        "leads": None
+    }
+
+def test_metric_columns_are_filled_file_by_file(inputs):
+    emitted = _run_load(inputs)
+
+    assert [len(rows) for rows in emitted["rows"]] == [2]
+    assert emitted["metrics"] == [("talk_time", {"Ann": 12.5, "Bob": 0.0}), ("dials", {"Ann": 0, "Bob": 7})]
+    assert emitted["complete"][0][0]
+
+def test_a_bad_header_fails_before_any_row_is_shown(inputs, tmp_path):
+    inputs["leads"] = write_csv(tmp_path / "leads.csv", ["Rep", "Total"], [["Ann", 1]])
+
+    emitted = _run_load(inputs)
+
+    assert emitted["rows"] == [] and emitted["metrics"] == []
+    ((ok, message),) = emitted["complete"]
+    assert not ok and "leads (leads.csv)" in message
@@ -0,0 +1,34 @@
+# tests/test_upload_journal.py
+
+from src.data.sheets_client.upload_journal import get_journal
+
+
+def test_completed_returns_only_recorded_keys():
+    journal = get_journal()
+    journal.record("sheet", [("Ann", "01/10/2026", 5), ("Bob", "01/10/2026", 7)])
+
+    keys = [("Ann", "01/10/2026"), ("Ann", "02/10/2026"), ("Bob", "01/10/2026")]
+    assert journal.completed("sheet", keys) == {("Ann", "01/10/2026"), ("Bob", "01/10/2026")}
+    assert journal.completed("other-sheet", keys) == set()
+
+def test_rewriting_a_key_replaces_its_row():
+    journal = get_journal()
+    journal.record("sheet", [("Ann", "01/10/2026", 5), ("Ann", "02/10/2026", 6)])
+    # The same (agent, date) written again, e.g. after its row was deleted by hand
+    journal.record("sheet", [("Ann", "01/10/2026", 9)])
+
+    assert journal.last_rows("sheet", ["Ann", "Bob"]) == {"Ann": 9}
+    count = journal._conn.execute("SELECT COUNT(*) FROM uploads WHERE agent = 'Ann'").fetchone()[0]
+    assert count == 2
+
+def test_forget_drops_one_entry():
+    journal = get_journal()
+    journal.record("sheet", [("Ann", "01/10/2026", 5), ("Ann", "02/10/2026", 6)])
+    journal.forget("sheet", "Ann", "02/10/2026")
+
+    assert journal.completed("sheet", [("Ann", "01/10/2026"), ("Ann", "02/10/2026")]) == {("Ann", "01/10/2026")}
+    assert journal.last_rows("sheet", ["Ann"]) == {"Ann": 5}
+
+def test_get_journal_shares_one_store_per_path(tmp_path):
+    assert get_journal() is get_journal()
+    assert get_journal(str(tmp_path / "other.sqlite")) is not get_journal()
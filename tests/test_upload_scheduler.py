@@ -0,0 +1,83 @@
+# tests/test_upload_scheduler.py
+
+import pytest
+from benchmarks.fake_sheets import FakeSpreadsheet, api_error
+from src.data.sheets_client import sheets_client, upload_scheduler
+from src.data.sheets_client.rollup_store import get_rollup_store
+from src.data.sheets_client.sheets_client import SheetsClient
+from src.data.sheets_client.upload_journal import get_journal
+from src.data.sheets_client.upload_scheduler import CALLS_PER_BATCH, TokenBucket, UploadScheduler, upload_to_spreadsheets
+from tests.helpers import make_team
+
+
+def test_acquire_beyond_capacity_raises_instead_of_hanging():
+    bucket = TokenBucket(12)
+    with pytest.raises(ValueError):
+        bucket.acquire(bucket.capacity + 1)
+
+def test_bucket_rejects_a_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+def test_low_rate_still_fits_a_whole_batch():
+    scheduler = UploadScheduler(requests_per_minute=8)
+    assert scheduler.bucket.capacity >= CALLS_PER_BATCH
+
+def test_too_small_bucket_is_rejected():
+    with pytest.raises(ValueError):
+        UploadScheduler(bucket=TokenBucket(60, capacity=CALLS_PER_BATCH - 1))
+
+def test_run_uploads_every_row_within_the_calls_per_batch():
+    fake = FakeSpreadsheet(["Ann", "Bob", "Template"])
+    scheduler = UploadScheduler(SheetsClient("sheet", fake), batch_size=2)
+
+    results = scheduler.run(make_team(["Ann", "Bob", "Zoe"]))
+
+    assert [r["success"] for r in results] == [True, True, True]
+    # Each batch stays within the calls the token bucket charges for it (Ann+Bob, then Zoe)
+    assert fake.total_calls <= CALLS_PER_BATCH * 2
+
+def test_retry_after_a_committed_write_does_not_write_twice(monkeypatch):
+    fake = FakeSpreadsheet(["Ann"], history_rows=2)
+    values_batch_update = fake.values_batch_update
+    failures = [api_error(503, "The service is currently unavailable.")]
+
+    def commit_then_fail(body):
+        # The rows land, but the response is lost
+        response = values_batch_update(body)
+        if failures:
+            raise failures.pop()
+        return response
+
+    monkeypatch.setattr(fake, "values_batch_update", commit_then_fail)
+    monkeypatch.setattr(upload_scheduler.time, "sleep", lambda seconds: None)
+    # More rows than the verify window, all on one tab
+    team = make_team(["Ann"] * 7)
+    team.date[:] = [f"0{day}/10/2026" for day in range(1, 8)]
+    rollups = get_rollup_store()
+
+    results = UploadScheduler(SheetsClient("sheet", fake), journal=get_journal(), rollups=rollups).run(team)
+
+    assert all(r["success"] for r in results)
+    dates = [row[0] for row in fake._sheets["Ann"].values[1:]]
+    assert dates == ["01/01/2025"] * 2 + team.date.tolist()
+    assert get_journal().completed("sheet", team.keys()) == set(team.keys())
+    assert [r["days"] for r in rollups.summary("sheet") if r["period"] == "month"] == [7]
+
+def test_spreadsheets_share_one_quota_bucket(monkeypatch):
+    fakes = {sheet: FakeSpreadsheet(["Ann", "Bob"]) for sheet in ("sheet-a", "sheet-b")}
+    for sheet, fake in fakes.items():
+        monkeypatch.setitem(sheets_client._clients, sheet, SheetsClient(sheet, fake))
+    buckets = []
+    init = UploadScheduler.__init__
+
+    def recording_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        buckets.append(self.bucket)
+
+    monkeypatch.setattr(UploadScheduler, "__init__", recording_init)
+
+    results = upload_to_spreadsheets([("sheet-a", make_team(["Ann"])), ("sheet-b", make_team(["Bob"]))])
+
+    assert [r["success"] for job in results for r in job] == [True, True]
+    assert len(buckets) == 2 and buckets[0] is buckets[1]
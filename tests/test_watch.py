@@ -0,0 +1,27 @@
+# tests/test_watch.py
+
+import argparse
+from benchmarks.fake_sheets import FakeSpreadsheet, FakeWorksheet
+from src.data.sheets_client import sheets_client
+from src.data.sheets_client.sheets_client import SheetsClient
+from src.ui.cli.watch import retry_upload, upload
+from tests.helpers import make_team
+
+
+def test_failed_rows_are_returned_and_go_through_on_retry(monkeypatch):
+    fake = FakeSpreadsheet(["Ann"])
+    monkeypatch.setenv("GOOGLE_SHEETS_TEMPLATE_ID", "sheet")
+    monkeypatch.setitem(sheets_client._clients, "sheet", SheetsClient("sheet", fake))
+    args = argparse.Namespace(verify=False)
+
+    failed = upload(args, make_team(["Ann", "Zoe"]))
+    assert failed.agent_name.tolist() == ["Zoe"]
+
+    # Zoe's tab is added by hand before the next retry
+    fake._sheets["Zoe"] = FakeWorksheet(fake, "Zoe", 2000)
+    sheets_client._clients["sheet"].reset_row_cache()
+
+    assert not len(retry_upload(args, failed))
+    assert fake._sheets["Zoe"].values[-1][0] == "01/10/2026"
+    # Ann was written once, by the first run
+    assert [row[0] for row in fake._sheets["Ann"].values].count("01/10/2026") == 1